@@ -0,0 +1,154 @@
+import json
+import os
+import shutil
+import tempfile
+
+
+# --- Crash-Safe Files ---
+#
+# A file is never written in place. The new contents go to a temporary file in
+# the same directory, which is flushed and fsynced and then renamed over the
+# target with os.replace, so a reader sees either the old or the new file, never
+# a truncated one. Before the rename, the previous file is kept as a backup
+# generation (<name>.bak1 is the newest, up to <name>.bak<BACKUP_GENERATIONS>);
+# load_with_backups (and load_json_with_backups for JSON files) falls back to
+# those when the file cannot be decoded.
+
+BACKUP_GENERATIONS = 2
+
+
+def backup_path(path, generation):
+    return f"{path}.bak{generation}"
+
+
+def _fsync_directory(directory):
+    """Makes a rename in directory durable; not supported on every platform."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _rotate_backups(path, generations):
+    for generation in range(generations, 1, -1):
+        older = backup_path(path, generation - 1)
+        if os.path.exists(older):
+            os.replace(older, backup_path(path, generation))
+    newest = backup_path(path, 1)
+    if os.path.exists(newest):
+        os.remove(newest)
+    try:
+        os.link(path, newest)  # The current file stays in place until the new one replaces it
+    except OSError:
+        shutil.copy2(path, newest)
+
+
+def atomic_write(path, write, backups=BACKUP_GENERATIONS, binary=False):
+    """
+    Writes a file atomically, keeping earlier versions as backups.
+
+    Args:
+        path (str): The target file.
+        write (callable): Called with the open temporary file to write the contents.
+        backups (int): Number of backup generations to keep; 0 keeps none.
+        binary (bool): Open the temporary file in binary instead of UTF-8 text mode.
+
+    Raises:
+        OSError: If the file cannot be written; the target is left unchanged. Errors
+            raised by write propagate the same way.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with (os.fdopen(fd, 'wb') if binary else os.fdopen(fd, 'w', encoding="utf-8")) as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        if backups and os.path.exists(path):
+            _rotate_backups(path, backups)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    _fsync_directory(directory)
+
+
+def atomic_write_json(path, data, backups=BACKUP_GENERATIONS, **dump_kwargs):
+    """
+    Writes data as JSON to path atomically, keeping earlier versions as backups.
+
+    Args:
+        path (str): The target file.
+        data: A JSON-serializable value.
+        backups (int): Number of backup generations to keep; 0 keeps none.
+        **dump_kwargs: Passed to json.dump, e.g. indent or default.
+
+    Raises:
+        OSError, TypeError, ValueError: If the file cannot be written; the target is left unchanged.
+    """
+    atomic_write(path, lambda f: json.dump(data, f, **dump_kwargs), backups)
+
+
+def load_with_backups(path, read, generations=BACKUP_GENERATIONS):
+    """
+    Reads a file written by atomic_write, falling back to its backups.
+
+    Args:
+        path (str): The file to read.
+        read (callable): Reads and checks one candidate file given its path; it
+            raises ValueError if the contents are not usable.
+        generations (int): Number of backup generations to try.
+
+    Returns:
+        tuple: (result of read, path actually read). The path differs from the argument if a backup was used.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If neither the file nor any backup can be decoded; the error of the file itself.
+    """
+    first_error = None
+    for candidate in [path] + [backup_path(path, generation) for generation in range(1, generations + 1)]:
+        try:
+            return read(candidate), candidate
+        except FileNotFoundError:
+            if candidate == path:
+                raise
+        except ValueError as e:  # Includes JSONDecodeError and UnicodeDecodeError
+            print(f"Could not decode {candidate}: {e}")
+            if first_error is None:
+                first_error = e
+    raise first_error
+
+
+def load_json_with_backups(path, validate=None, generations=BACKUP_GENERATIONS, **load_kwargs):
+    """
+    Loads a JSON file written by atomic_write_json, falling back to its backups.
+
+    Args:
+        path (str): The file to load.
+        validate (callable): Optional check of the decoded value; it raises ValueError to reject it.
+        generations (int): Number of backup generations to try.
+        **load_kwargs: Passed to json.load, e.g. object_hook.
+
+    Returns:
+        tuple: (data, path actually read). The path differs from the argument if a backup was used.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If neither the file nor any backup can be decoded; the error of the file itself.
+    """
+    def read(candidate):
+        with open(candidate, 'r', encoding="utf-8") as f:
+            data = json.load(f, **load_kwargs)
+        if validate is not None:
+            validate(data)
+        return data
+
+    return load_with_backups(path, read, generations)
@@ -0,0 +1,76 @@
+"""
+Compares Course/Unit objects with dictionaries holding the same fields.
+
+Run from the repository root:
+    python benchmarks/bench_course_model.py [course_count]
+
+Reports the memory of both representations of the same synthetic syllabus and
+the cost of producing a subject's unit titles the way the window used to (by
+splitting every unit's text) and from the precomputed Course.unit_titles.
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from syllabus_generator import generate_syllabus  # noqa: E402
+from syllabus_model import Unit, build_courses  # noqa: E402
+from syllabus_parser import parse_syllabus  # noqa: E402
+
+
+def build_course_dicts(syllabus_data):
+    """The same fields as build_courses, as dictionaries."""
+    courses = {}
+    for title, course in syllabus_data.items():
+        units = []
+        for index, text in enumerate(course["Units"]):
+            unit = Unit.from_text(text, index)
+            units.append({"title": unit.title, "number": unit.number, "hours": unit.hours, "body": unit.body})
+        courses[title] = {"title": title, "details": dict(course["Details"]), "units": units,
+                          "lab_work": course["Lab Work"], "unit_titles": [unit["title"] for unit in units],
+                          "total_hours": sum(unit["hours"] for unit in units if unit["hours"] is not None)}
+    return courses
+
+
+def traced_size(build, syllabus_data):
+    """Memory allocated by build(syllabus_data) and still held by its result."""
+    tracemalloc.start()
+    result = build(syllabus_data)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def split_unit_titles(course):
+    """The unit title extraction previously done on every subject click."""
+    return [text.splitlines()[0].strip() if text.splitlines() else f"Unit {idx + 1}"
+            for idx, text in enumerate(course["Units"])]
+
+
+def main():
+    course_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    syllabus_data = parse_syllabus(generate_syllabus(course_count, seed=1)[0])
+
+    _, dict_size = traced_size(build_course_dicts, syllabus_data)
+    courses, slot_size = traced_size(build_courses, syllabus_data)
+    print(f"{course_count} courses, excluding the unit and lab text both representations share:")
+    print(f"  dictionaries   {dict_size / course_count:>8.0f} bytes/course")
+    print(f"  Course/Unit    {slot_size / course_count:>8.0f} bytes/course ({slot_size / dict_size - 1:+.0%})")
+
+    start = time.perf_counter()
+    for course in syllabus_data.values():
+        split_unit_titles(course)
+    split_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for course in courses.values():
+        list(course.unit_titles)
+    precomputed_time = time.perf_counter() - start
+    print("Unit titles for every subject:")
+    print(f"  splitting unit text  {split_time * 1e6 / course_count:>7.2f} us/subject")
+    print(f"  Course.unit_titles   {precomputed_time * 1e6 / course_count:>7.2f} us/subject")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Measures incremental re-parsing after editing a single course.
+
+Run from the repository root:
+    python benchmarks/bench_incremental.py
+
+A full parse is compared with an IncrementalSyllabusParser that already holds
+the previous results and only has to parse the edited course's block.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_parser_scaling import build_corpus  # noqa: E402
+from syllabus_blocks import IncrementalSyllabusParser  # noqa: E402
+from syllabus_parser import parse_syllabus  # noqa: E402
+
+SIZES = (100, 1000, 5000)
+
+
+def main():
+    print(f"{'courses':>8} {'full parse s':>13} {'incremental s':>14} {'parsed blocks':>14} {'speedup':>8}")
+    for size in SIZES:
+        text = build_corpus(size)
+        edited = text.replace("This course covers topic 7 in detail.", "This course now covers topic 7 briefly.")
+
+        parser = IncrementalSyllabusParser()
+        parser.parse_lines(text.split("\n"))
+
+        start = time.perf_counter()
+        expected = parse_syllabus(edited)
+        full = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = parser.parse_lines(edited.split("\n"))
+        incremental = time.perf_counter() - start
+
+        assert result == expected
+        print(f"{size:>8} {full:>13.3f} {incremental:>14.3f} {parser.parsed_count:>14} {full / incremental:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Measures finding the tasks the notice board shows after each task change: the
+previous approach (all tasks from get_data(), partitioned on their timestamp and
+fully sorted) against TaskTableModel.recent_tasks and its recency index.
+
+Run from the repository root:
+    python benchmarks/bench_notice_board.py [task_count] [changes]
+
+Each change updates one task's fields (its timestamp included, as updating a
+task from the form does), which the recency index absorbs, then the three most
+recent tasks are looked up. Both row backends are measured.
+
+Also measures the deadlines panel's queries (open tasks overdue, and due in the
+next week) answered by scanning every task and by the model's deadline index.
+"""
+import datetime
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_task_load import generate_tasks  # noqa: E402
+from main import CLOSED_TASK_STATUSES, DEADLINE_WINDOW_DAYS, NOTICE_BOARD_TASKS, TaskTableModel  # noqa: E402
+from task_rows import ColumnarTaskRows, TaskRows  # noqa: E402
+
+HEADERS = ["Subject", "Type", "Description", "Assigned", "Submit By", "Status", "Timestamp"]
+
+
+def previous_recent_tasks(model, count):
+    """The notice board's task selection before the recency index, kept for comparison."""
+    all_tasks = model.get_data()
+    valid_tasks = [task for task in all_tasks if isinstance(task.get('Timestamp'), datetime.datetime)]
+    invalid_tasks = [task for task in all_tasks if not isinstance(task.get('Timestamp'), datetime.datetime)]
+    tasks_sorted = sorted(valid_tasks, key=lambda x: x['Timestamp'], reverse=True)
+    tasks_sorted.extend(invalid_tasks)
+    return tasks_sorted[:count]
+
+
+def run_changes(model, recent_tasks, changes, seed=0):
+    """Applies changes task updates, finding the recent tasks after each; returns the time per change and the last result."""
+    rng = random.Random(seed)
+    task_ids = [model.get_row_task_id(row) for row in range(model.rowCount())]
+    model.get_task_row(task_ids[0])  # Builds the row lookup by id, which both approaches use
+    now = datetime.datetime(2026, 1, 1)
+    start = time.perf_counter()
+    for change in range(changes):
+        model.update_task_fields(rng.choice(task_ids), {
+            "Description": f"Changed {change}",
+            "Timestamp": now + datetime.timedelta(seconds=rng.randrange(-10 ** 8, 10 ** 6)),
+        })
+        result = recent_tasks(model, NOTICE_BOARD_TASKS)
+    return (time.perf_counter() - start) / changes, result
+
+
+def scan_deadlines(model, today):
+    """Open tasks overdue and due within the deadline window, by checking every task."""
+    window_end = today + datetime.timedelta(days=DEADLINE_WINDOW_DAYS)
+    overdue, due_soon = [], []
+    for task in model.get_data():
+        due_date = task.get("Submit By")
+        if not isinstance(due_date, datetime.date) or task.get("Status") in CLOSED_TASK_STATUSES:
+            continue
+        if due_date < today:
+            overdue.append((due_date.toordinal(), task["Id"]))
+        elif due_date <= window_end:
+            due_soon.append((due_date.toordinal(), task["Id"]))
+    return [task_id for _, task_id in sorted(overdue)], [task_id for _, task_id in sorted(due_soon)]
+
+
+def index_deadlines(model, today):
+    return model.deadlines.overdue(today), model.deadlines.due_within(DEADLINE_WINDOW_DAYS, today)
+
+
+def first_due(model, today):
+    return model.deadlines.due_within(DEADLINE_WINDOW_DAYS, today, limit=NOTICE_BOARD_TASKS)
+
+
+def time_queries(query, model, today, repeat=5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = query(model, today)
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    changes = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    tasks = generate_tasks(task_count)
+    print(f"{task_count} tasks, per change and notice board update (mean of {changes}):")
+    for rows_class in (TaskRows, ColumnarTaskRows):
+        previous_model = TaskTableModel([dict(task) for task in tasks], HEADERS, rows_class=rows_class)
+        indexed_model = TaskTableModel([dict(task) for task in tasks], HEADERS, rows_class=rows_class)
+        previous_time, previous_result = run_changes(previous_model, previous_recent_tasks, changes)
+        indexed_time, indexed_result = run_changes(indexed_model, TaskTableModel.recent_tasks, changes)
+        if indexed_result != previous_result:
+            sys.exit("recent_tasks and the previous selection disagree")
+        print(f"  {rows_class.__name__:<17} previous {previous_time * 1e3:>8.2f} ms   "
+              f"recency index {indexed_time * 1e3:>7.3f} ms  ({previous_time / indexed_time:,.0f}x)")
+
+    today = datetime.date(2025, 1, 1)  # Inside the range of the generated deadlines
+    print(f"Open tasks overdue and due in the next {DEADLINE_WINDOW_DAYS} days:")
+    for rows_class in (TaskRows, ColumnarTaskRows):
+        model = TaskTableModel([dict(task) for task in tasks], HEADERS, rows_class=rows_class)
+        scan_time, scanned = time_queries(scan_deadlines, model, today)
+        index_time, indexed = time_queries(index_deadlines, model, today)
+        if indexed != scanned:
+            sys.exit("The deadline index and the scan disagree")
+        first_time, _ = time_queries(first_due, model, today)
+        print(f"  {rows_class.__name__:<17} scan {scan_time * 1e3:>8.2f} ms   deadline index {index_time * 1e3:>6.2f} ms"
+              f" ({len(indexed[0])} + {len(indexed[1])} tasks); first {NOTICE_BOARD_TASKS} due"
+              f" {first_time * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Measures parallel parsing speedup against the number of worker processes.
+
+Run from the repository root:
+    python benchmarks/bench_parallel.py [course_count]
+
+The synthetic corpus (5000 courses by default) is parsed once in-process and
+then with parse_syllabus_parallel for 1, 2, 4, ... workers up to the CPU count.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_parser_scaling import build_corpus  # noqa: E402
+from syllabus_blocks import parse_syllabus_parallel  # noqa: E402
+from syllabus_parser import parse_syllabus  # noqa: E402
+
+
+def worker_counts():
+    cpu_count = os.cpu_count() or 1
+    counts = []
+    workers = 1
+    while workers < cpu_count:
+        counts.append(workers)
+        workers *= 2
+    counts.append(cpu_count)
+    return counts
+
+
+def main():
+    course_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    text = build_corpus(course_count)
+    lines = text.split("\n")
+
+    start = time.perf_counter()
+    expected = parse_syllabus(text)
+    serial = time.perf_counter() - start
+    print(f"{course_count} courses, {len(lines)} lines, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'seconds':>9} {'speedup':>8}")
+    print(f"{'serial':>8} {serial:>9.3f} {1.0:>7.2f}x")
+
+    for workers in worker_counts():
+        start = time.perf_counter()
+        result = parse_syllabus_parallel(lines, max_workers=workers)
+        elapsed = time.perf_counter() - start
+        assert result == expected
+        print(f"{workers:>8} {elapsed:>9.3f} {serial / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
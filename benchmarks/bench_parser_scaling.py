@@ -0,0 +1,94 @@
+"""
+Compares how parse_syllabus and the original look-ahead parser scale with input size.
+
+Run from the repository root:
+    python benchmarks/bench_parser_scaling.py
+
+For each corpus size the time per line is reported; a linear parser keeps the
+per-line cost flat as the corpus grows.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from legacy_parser import parse_syllabus_legacy  # noqa: E402
+from line_classifier import LineClassifier  # noqa: E402
+from syllabus_parser import SyllabusStateMachine, parse_syllabus, tokenize  # noqa: E402
+
+COURSE_TEMPLATE = """
+Course Title: Sample Course {n}
+Course No: CSC{n}
+Nature of the Course: Theory + Lab
+Semester: IV
+Full Marks: 60+20+20
+Pass Marks: 24+8+8
+Credit Hrs: 3
+
+Course Description: This course covers topic {n} in detail.
+
+Course Contents:
+
+Unit I: Foundations (6 Hrs.)
+1.1 Basic definitions and notation
+1.2 Examples and exercises
+
+Unit II: Core Techniques (10 Hrs.)
+2.1 Algorithms, Complexity
+a) Worked examples
+b) Case studies
+
+Unit III: Applications (8 Hrs.)
+Applications of the techniques to real problems
+
+Laboratory Works:
+Students implement the algorithms covered in the course
+using any high level language.
+
+
+Text Books:
+1. A. Author, A Book on Topic {n}, Publisher.
+"""
+
+SIZES = (100, 1000, 5000, 20000)
+
+
+def build_corpus(course_count):
+    return "".join(COURSE_TEMPLATE.format(n=n) for n in range(course_count))
+
+
+def time_parser(parser, text, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parser(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"{'courses':>8} {'lines':>9} {'legacy us/line':>15} {'new us/line':>12} {'speedup':>8}")
+    for size in SIZES:
+        text = build_corpus(size)
+        line_count = text.count("\n") + 1
+        assert parse_syllabus(text) == parse_syllabus_legacy(text)
+        legacy = time_parser(parse_syllabus_legacy, text)
+        new = time_parser(parse_syllabus, text)
+        print(f"{size:>8} {line_count:>9} {legacy / line_count * 1e6:>15.2f} {new / line_count * 1e6:>12.2f} "
+              f"{legacy / new:>7.2f}x")
+
+    # Line class distribution of the largest corpus, as seen by the classifier
+    classifier = LineClassifier(count_hits=True)
+    machine = SyllabusStateMachine()
+    for token in tokenize(text.split("\n"), classifier):
+        machine.feed(token)
+    machine.finish()
+    print()
+    print(f"{'class':>10} {'hits':>9} {'share':>7}")
+    for name, hits, share in classifier.hit_report():
+        print(f"{name:>10} {hits:>9} {share:>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
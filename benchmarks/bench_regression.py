@@ -0,0 +1,111 @@
+"""
+Parser benchmark and regression check on synthetic syllabi of 10 to 10,000 courses.
+
+Run from the repository root:
+    python benchmarks/bench_regression.py                   # compare with the stored baseline
+    python benchmarks/bench_regression.py --update-baseline # record this machine's numbers
+
+For every size the generated text is parsed, the result is checked against what
+the generator wrote, and throughput (lines/sec, best of --repeat runs) and peak
+traced memory of one parse are reported. The script exits with status 1 if a
+parse is wrong or if throughput falls more than --threshold below the baseline.
+Baselines are machine-specific; record one before comparing on a new machine.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from syllabus_generator import check_parse, generate_syllabus  # noqa: E402
+from syllabus_parser import PARSER_VERSION, parse_syllabus  # noqa: E402
+
+SIZES = (10, 100, 1000, 10000)
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "parser_baseline.json")
+DEFAULT_THRESHOLD = 0.25  # Allowed relative drop in lines/sec
+MIN_LINES_PER_RUN = 50000
+
+
+def measure(course_count, repeat):
+    """Returns (line count, lines/sec, peak bytes, problems) for one corpus size."""
+    text, courses = generate_syllabus(course_count, seed=course_count)
+    line_count = text.count("\n") + 1
+
+    # Small corpora are parsed several times per timed run to rise above timer noise
+    loops = max(1, MIN_LINES_PER_RUN // line_count)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            syllabus_data = parse_syllabus(text)
+        best = min(best, (time.perf_counter() - start) / loops)
+    problems = check_parse(syllabus_data, courses)
+
+    tracemalloc.start()
+    parse_syllabus(text)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return line_count, line_count / best, peak, problems
+
+
+def load_baseline(path):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, metavar="N",
+                            help="corpus sizes in courses (default: %(default)s)")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="timed runs per size; the best is kept")
+    arg_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                            help="fail if lines/sec drops by more than this fraction (default: %(default)s)")
+    arg_parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline file")
+    arg_parser.add_argument("--update-baseline", action="store_true", help="write the results as the new baseline")
+    args = arg_parser.parse_args()
+
+    baseline = None if args.update_baseline else load_baseline(args.baseline)
+    if baseline is not None and baseline.get("parser_version") != PARSER_VERSION:
+        print(f"Note: baseline was recorded for parser version {baseline.get('parser_version')}")
+    baseline_sizes = baseline["sizes"] if baseline else {}
+
+    failed = False
+    results = {}
+    print(f"{'courses':>8} {'lines':>9} {'lines/sec':>11} {'peak MiB':>9} {'baseline':>11} {'change':>8}")
+    for size in args.sizes:
+        line_count, lines_per_sec, peak, problems = measure(size, args.repeat)
+        results[str(size)] = {"lines": line_count, "lines_per_sec": round(lines_per_sec), "peak_bytes": peak}
+        reference = baseline_sizes.get(str(size), {}).get("lines_per_sec")
+        if reference:
+            change = lines_per_sec / reference - 1
+            status = f"{change:>+7.1%}"
+            if change < -args.threshold:
+                status += "  REGRESSION"
+                failed = True
+        else:
+            status = "-"
+        print(f"{size:>8} {line_count:>9} {lines_per_sec:>11,.0f} {peak / (1 << 20):>9.2f} "
+              f"{reference or '-':>11} {status:>8}")
+        for problem in problems[:5]:
+            print(f"    wrong parse: {problem}")
+        failed = failed or bool(problems)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump({"parser_version": PARSER_VERSION, "python": platform.python_version(),
+                       "machine": platform.machine(), "sizes": results}, f, indent=4)
+        print(f"Baseline written to {args.baseline}")
+    elif baseline is None:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
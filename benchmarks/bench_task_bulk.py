@@ -0,0 +1,73 @@
+"""
+Measures adding a batch of tasks to a populated task table: the previous way
+(insertRows for one default row, then setData for each of its cells, per task)
+against TaskTableModel.add_tasks, which inserts the batch as one block.
+
+Run from the repository root:
+    python benchmarks/bench_task_bulk.py [task_count] [batch_size]
+
+A QTableView and a dataChanged slot are attached, as in the application, so
+the cost of the signals each approach emits is included. A display-less Qt
+platform is used when none is set.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import Qt  # noqa: E402
+from PyQt5.QtWidgets import QApplication, QTableView  # noqa: E402
+
+from bench_task_load import generate_tasks  # noqa: E402
+from main import TaskTableModel  # noqa: E402
+from task_rows import ColumnarTaskRows, TaskRows  # noqa: E402
+
+HEADERS = ["Subject", "Type", "Description", "Assigned", "Submit By", "Status", "Timestamp"]
+
+
+def add_per_cell(model, tasks):
+    for task in tasks:
+        model.insertRows(0, 1)
+        for column, key in enumerate(HEADERS):
+            model.setData(model.index(0, column), task[key], Qt.EditRole)
+
+
+def add_in_bulk(model, tasks):
+    model.add_tasks(tasks, position=0)
+
+
+def measure(add, rows_class, tasks, batch):
+    model = TaskTableModel([dict(task) for task in tasks], HEADERS, rows_class=rows_class)
+    view = QTableView()
+    view.setModel(model)
+    signals = []
+    model.dataChanged.connect(lambda *args: signals.append("dataChanged"))
+    model.rowsInserted.connect(lambda *args: signals.append("rowsInserted"))
+    start = time.perf_counter()
+    add(model, batch)
+    elapsed = time.perf_counter() - start
+    view.deleteLater()
+    return elapsed, len(signals), model
+
+
+def main():
+    task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    app = QApplication.instance() or QApplication([])  # noqa: F841 (needed by the view)
+    tasks = generate_tasks(task_count)
+    batch = [{key: task[key] for key in HEADERS} for task in generate_tasks(batch_size, seed=1)]
+    print(f"Adding {batch_size} tasks to {task_count}:")
+    for rows_class in (TaskRows, ColumnarTaskRows):
+        cell_time, cell_signals, cell_model = measure(add_per_cell, rows_class, tasks, batch)
+        bulk_time, bulk_signals, bulk_model = measure(add_in_bulk, rows_class, tasks, batch)
+        if [cell_model.get_row_fields(row, 0, len(HEADERS) - 1)[1] for row in range(batch_size)] != \
+                [bulk_model.get_row_fields(row, 0, len(HEADERS) - 1)[1] for row in range(batch_size - 1, -1, -1)]:
+            sys.exit("The two ways of adding tasks disagree")
+        print(f"  {rows_class.__name__:<17} per cell {cell_time:>7.3f} s ({cell_signals} signals)   "
+              f"add_tasks {bulk_time:>7.3f} s ({bulk_signals} signal)  ({cell_time / bulk_time:,.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
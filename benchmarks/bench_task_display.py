@@ -0,0 +1,92 @@
+"""
+Measures TaskTableModel.data() for the display role, the call a QTableView makes
+for every visible cell on every repaint: the previous implementation (formatting
+every call and wrapping the text in a QVariant), the current one with the display
+cache disabled, and with the cache.
+
+Run from the repository root:
+    python benchmarks/bench_task_display.py [task_count] [repaints]
+
+Simulates a view of SCREEN_ROWS rows scrolled a screen at a time from the top of
+the table and back, repainting each screen several times (as hovering,
+selection changes and focus changes do), for both row backends.
+"""
+import datetime
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import Qt, QVariant  # noqa: E402
+
+from bench_task_load import generate_tasks  # noqa: E402
+from main import DISPLAY_CACHE_ROWS, TaskTableModel  # noqa: E402
+from task_rows import ColumnarTaskRows, TaskRows  # noqa: E402
+
+HEADERS = ["Subject", "Type", "Description", "Assigned", "Submit By", "Status", "Timestamp"]
+SCREEN_ROWS = 40
+SCREENS = 50
+
+
+class PreviousTaskTableModel(TaskTableModel):
+    """TaskTableModel with the display role of data() as it was before the cache, kept for comparison."""
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+        row = index.row()
+        if not (0 <= row < len(self._rows)):
+            return QVariant()
+        value = self._rows.value(row, self.headers[index.column()])
+        if role == Qt.DisplayRole:
+            if isinstance(value, datetime.date):
+                return QVariant(value.strftime("%Y-%m-%d"))
+            elif isinstance(value, datetime.datetime):
+                return QVariant(value.strftime("%Y-%m-%d %H:%M:%S"))
+            elif value is None:
+                return QVariant("")
+            else:
+                return QVariant(str(value))
+        return super().data(index, role)
+
+
+def paint_screens(model, repaints):
+    """Returns the number of data() calls made and the time they took."""
+    indexes = [[model.index(row, column) for column in range(len(HEADERS))] for row in range(SCREENS * SCREEN_ROWS)]
+    screens = list(range(SCREENS)) + list(range(SCREENS - 1, -1, -1))
+    data, display = model.data, Qt.DisplayRole
+    calls = 0
+    start = time.perf_counter()
+    for screen in screens:
+        screen_indexes = indexes[screen * SCREEN_ROWS:(screen + 1) * SCREEN_ROWS]
+        for _ in range(repaints):
+            for row_indexes in screen_indexes:
+                for index in row_indexes:
+                    data(index, display)
+            calls += SCREEN_ROWS * len(HEADERS)
+    return calls, time.perf_counter() - start
+
+
+def main():
+    task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    repaints = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    tasks = generate_tasks(task_count)
+    print(f"data(DisplayRole) on {task_count} tasks, {SCREENS} screens of {SCREEN_ROWS} rows down and up, "
+          f"{repaints} repaints each:")
+    for rows_class in (TaskRows, ColumnarTaskRows):
+        rates = []
+        for model_class, cache_rows in [(PreviousTaskTableModel, 0), (TaskTableModel, 0),
+                                        (TaskTableModel, DISPLAY_CACHE_ROWS)]:
+            model = model_class([dict(task) for task in tasks], HEADERS, rows_class=rows_class,
+                                display_cache_rows=cache_rows)
+            calls, elapsed = paint_screens(model, repaints)
+            rates.append(calls / elapsed)
+        print(f"  {rows_class.__name__}:")
+        for label, rate in zip(["previous", "no cache", "cached"], rates):
+            print(f"    {label:<9} {rate:>11,.0f} calls/s  ({rate / rates[0]:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Measures importing a task file with TaskFileReader and parse_import_row, the
+work TaskImporter does on its worker thread, for each supported file format.
+
+Run from the repository root:
+    python benchmarks/bench_task_import.py [task_count]
+
+Reports rows read per second and the peak memory traced while reading, which
+stays flat as the file grows because rows are streamed and not collected.
+"""
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_task_load import STATUSES, SUBJECTS, TYPES, generate_tasks  # noqa: E402
+from task_import import TaskFileReader, parse_import_row  # noqa: E402
+from task_store import json_default  # noqa: E402
+
+FIELDS = ["Subject", "Type", "Description", "Assigned", "Submit By", "Status"]
+ICS_STATUSES = {"Pending": "NEEDS-ACTION", "In Progress": "IN-PROCESS",
+                "Completed": "COMPLETED", "Cancelled": "CANCELLED"}
+
+
+def write_csv(path, tasks):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for task in tasks:
+            writer.writerow(task)
+
+
+def write_json(path, tasks):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump([{key: task[key] for key in FIELDS} for task in tasks], f, indent=4, default=json_default)
+
+
+def write_ics(path, tasks):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//bench//task import//EN\r\n")
+        for index, task in enumerate(tasks):
+            f.write("BEGIN:VTODO\r\n"
+                    f"UID:task-{index}@bench\r\n"
+                    f"SUMMARY:{task['Description']}\r\n"
+                    f"CATEGORIES:{task['Subject']}\r\n"
+                    f"X-TASK-TYPE:{task['Type']}\r\n"
+                    f"DTSTART;VALUE=DATE:{task['Assigned']:%Y%m%d}\r\n"
+                    f"DUE;VALUE=DATE:{task['Submit By']:%Y%m%d}\r\n"
+                    f"STATUS:{ICS_STATUSES[task['Status']]}\r\n"
+                    "END:VTODO\r\n")
+        f.write("END:VCALENDAR\r\n")
+
+
+def import_file(path, subjects):
+    """Reads and validates every row, keeping only the count, as the worker hands chunks away."""
+    imported = 0
+    with TaskFileReader(path) as reader:
+        for _, fields in reader:
+            task, error = parse_import_row(fields, subjects, TYPES, STATUSES)
+            if error:
+                sys.exit(f"{path}: {error}")
+            imported += 1
+    return imported
+
+
+def timed_import(path, subjects):
+    """The import timed untraced, then repeated under tracemalloc for its peak memory."""
+    start = time.perf_counter()
+    imported = import_file(path, subjects)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    import_file(path, subjects)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return imported, elapsed, peak
+
+
+def first_tasks(path, subjects, count):
+    with TaskFileReader(path) as reader:
+        tasks = []
+        for _, fields in reader:
+            tasks.append(parse_import_row(fields, subjects, TYPES, STATUSES)[0])
+            if len(tasks) == count:
+                return tasks
+    return tasks
+
+
+def main():
+    task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    tasks = generate_tasks(task_count)
+    subjects = set(SUBJECTS)
+    expected = [{key: task[key] for key in FIELDS} for task in tasks[:100]]
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{task_count} tasks:")
+        for extension, write in ((".csv", write_csv), (".json", write_json), (".ics", write_ics)):
+            path = os.path.join(directory, "tasks" + extension)
+            write(path, tasks)
+            if first_tasks(path, subjects, 100) != expected:
+                sys.exit(f"{path} is not read back as written")
+            imported, elapsed, peak = timed_import(path, subjects)
+            if imported != task_count:
+                sys.exit(f"{path}: {imported} of {task_count} tasks imported")
+            print(f"  {extension:<6} {os.path.getsize(path) / 1e6:>6.1f} MB  {elapsed:>6.2f} s"
+                  f"  {imported / elapsed:>9,.0f} rows/s  peak {peak / 1e6:>5.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Measures adding tasks one at a time to a large task table, as the task form
+does: add_tasks with one task, then looking the task up by id.
+
+Run from the repository root:
+    python benchmarks/bench_task_insert.py [task_count] [added]
+
+Tasks are added at the top of the table, where the form puts them, and at the
+bottom. The rows are stored bottom-up (see task_rows.NewestFirstRows), so adding
+at the bottom inserts at the front of the storage and shifts every stored task,
+as adding at the top did before; it is the baseline.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_task_load import generate_tasks  # noqa: E402
+from main import TaskTableModel  # noqa: E402
+from task_rows import ColumnarTaskRows, TaskRows  # noqa: E402
+
+HEADERS = ["Subject", "Type", "Description", "Assigned", "Submit By", "Status", "Timestamp"]
+
+
+def add_one_by_one(model, tasks, at_top):
+    start = time.perf_counter()
+    for task in tasks:
+        task_id, = model.add_tasks([task], position=0 if at_top else model.rowCount())
+        model.get_task(task_id)
+    return (time.perf_counter() - start) / len(tasks)
+
+
+def main():
+    task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    added = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    tasks = generate_tasks(task_count)
+    new_tasks = [{key: task[key] for key in HEADERS} for task in generate_tasks(added, seed=1)]
+    print(f"Adding {added} tasks one at a time to {task_count}, per task:")
+    for rows_class in (TaskRows, ColumnarTaskRows):
+        times = []
+        for at_top in (False, True):
+            model = TaskTableModel([dict(task) for task in tasks], HEADERS, rows_class=rows_class)
+            model.get_task_row(model.get_row_task_id(0))  # Builds the lookup by id
+            times.append(add_one_by_one(model, new_tasks, at_top))
+        print(f"  {rows_class.__name__:<17} bottom (previous top) {times[0] * 1e6:>8.1f} us   "
+              f"top {times[1] * 1e6:>6.1f} us  ({times[0] / times[1]:,.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Compares loading a task snapshot with TaskJournal.load and with the previous
+implementation (json.load, then strptime/fromisoformat on every field of every
+task, then sorting).
+
+Run from the repository root:
+    python benchmarks/bench_task_load.py [task_count] [repeat]
+
+The synthetic snapshot is written the way the application writes it (indent=4,
+newest first), with dates drawn from a two-year range so that, as in real task
+lists, the same dates recur across many tasks.
+"""
+import datetime
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from atomic_file import atomic_write_json  # noqa: E402
+from task_store import TASK_ID_KEY, TaskJournal, json_default  # noqa: E402
+
+SUBJECTS = ["Artificial Intelligence", "Computer Networks", "Database Management System", "Operating Systems",
+            "Software Engineering", "Numerical Methods", "Simulation and Modeling", "Web Technology"]
+TYPES = ["Assignment", "Lab Report", "Project", "Presentation", "Exam Prep", "Other"]
+STATUSES = ["Pending", "In Progress", "Completed", "Cancelled"]
+
+
+def generate_tasks(count, seed=0):
+    """Returns count task dictionaries, newest first, as the window stores them."""
+    rng = random.Random(seed)
+    start = datetime.date(2024, 1, 1)
+    now = datetime.datetime(2025, 12, 31, 12, 0, 0)
+    tasks = []
+    for index in range(count):
+        assigned = start + datetime.timedelta(days=rng.randrange(730))
+        tasks.append({
+            "Subject": rng.choice(SUBJECTS),
+            "Type": rng.choice(TYPES),
+            "Description": f"Task {index}: {rng.choice(TYPES).lower()} on chapter {rng.randrange(1, 12)}",
+            "Assigned": assigned,
+            "Submit By": assigned + datetime.timedelta(days=rng.randrange(1, 30)),
+            "Status": rng.choice(STATUSES),
+            "Timestamp": now - datetime.timedelta(seconds=index * 37, microseconds=rng.randrange(1000000)),
+            TASK_ID_KEY: f"{rng.getrandbits(128):032x}",  # Like new_task_id, but reproducible
+        })
+    return tasks
+
+
+def legacy_load(path):
+    """The task loading of the application before the fast path, kept for comparison."""
+    with open(path, 'r', encoding="utf-8") as f:
+        tasks = json.load(f)
+    for task in tasks:
+        for key in ["Assigned", "Submit By"]:
+            if key in task and isinstance(task[key], str):
+                try:
+                    task[key] = datetime.datetime.strptime(task[key], "%Y-%m-%d").date()
+                except ValueError:
+                    task[key] = None
+        if 'Timestamp' in task and isinstance(task['Timestamp'], str):
+            try:
+                task['Timestamp'] = datetime.datetime.fromisoformat(task['Timestamp'].replace('Z', '+00:00'))
+            except ValueError:
+                task['Timestamp'] = datetime.datetime.min
+    tasks.sort(key=lambda x: x.get('Timestamp') or datetime.datetime.min, reverse=True)
+    return tasks
+
+
+def best_time(load, path, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = load(path)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def main():
+    task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "syllabus_tasks.json")
+        atomic_write_json(path, generate_tasks(task_count), backups=0, indent=4, default=json_default)
+        size = os.path.getsize(path)
+
+        legacy_tasks, legacy_time = best_time(legacy_load, path, repeat)
+        fast_tasks, fast_time = best_time(lambda p: TaskJournal(p).load(), path, repeat)
+        if fast_tasks != legacy_tasks:
+            sys.exit("TaskJournal.load and the previous implementation disagree")
+
+    print(f"{task_count} tasks, {size / 1e6:.1f} MB snapshot, best of {repeat}:")
+    print(f"  previous load     {legacy_time:>7.3f} s  {task_count / legacy_time:>10,.0f} tasks/s")
+    print(f"  TaskJournal.load  {fast_time:>7.3f} s  {task_count / fast_time:>10,.0f} tasks/s"
+          f"  ({legacy_time / fast_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Compares the two row backends of TaskTableModel: a list of task dictionaries
+(TaskRows) and typed columns (ColumnarTaskRows).
+
+Run from the repository root:
+    python benchmarks/bench_task_rows.py [task_count]
+
+Reports the memory each backend holds for the same synthetic tasks, including
+the strings and date objects it keeps alive, and the cost of reading every
+cell the way TaskTableModel.data() does.
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_task_load import generate_tasks  # noqa: E402
+from task_rows import ColumnarTaskRows, TaskRows  # noqa: E402
+
+HEADERS = ["Subject", "Type", "Description", "Assigned", "Submit By", "Status", "Timestamp"]
+
+
+def held_memory(build, task_count):
+    """Memory still allocated once build(tasks) has returned and the input tasks are gone."""
+    gc.collect()
+    tracemalloc.start()
+    rows = build(generate_tasks(task_count))
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return rows, size
+
+
+def read_all_cells(rows):
+    start = time.perf_counter()
+    for row in range(len(rows)):
+        for key in HEADERS:
+            rows.value(row, key)
+    return time.perf_counter() - start
+
+
+def main():
+    task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    dict_rows, dict_size = held_memory(TaskRows, task_count)
+    columnar_rows, columnar_size = held_memory(ColumnarTaskRows, task_count)
+    if columnar_rows.tasks() != dict_rows.tasks():
+        sys.exit("The backends hold different tasks")
+
+    cells = task_count * len(HEADERS)
+    dict_time = read_all_cells(dict_rows)
+    columnar_time = read_all_cells(columnar_rows)
+    print(f"{task_count} tasks:")
+    print(f"  TaskRows           {dict_size / 1e6:>7.1f} MB  {dict_size / task_count:>5.0f} bytes/task")
+    print(f"  ColumnarTaskRows   {columnar_size / 1e6:>7.1f} MB  {columnar_size / task_count:>5.0f} bytes/task"
+          f"  ({columnar_size / dict_size - 1:+.0%})")
+    print("Reading every cell:")
+    print(f"  TaskRows           {dict_time * 1e9 / cells:>7.0f} ns/cell")
+    print(f"  ColumnarTaskRows   {columnar_time * 1e9 / cells:>7.0f} ns/cell")
+
+
+if __name__ == "__main__":
+    main()
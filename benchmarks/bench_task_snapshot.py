@@ -0,0 +1,67 @@
+"""
+Compares the JSON task snapshot with the binary columnar snapshot (task_snapshot).
+
+Run from the repository root:
+    python benchmarks/bench_task_snapshot.py [task_count] [repeat]
+
+Reports the file sizes, a full TaskJournal.load of each format, and opening the
+binary snapshot lazily and reading one screen of rows, which decodes no column.
+Every load starts from a new store object, so nothing decoded earlier is reused.
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_task_load import generate_tasks  # noqa: E402
+from task_snapshot import TaskSnapshot  # noqa: E402
+from task_store import TaskJournal  # noqa: E402
+
+SCREEN_ROWS = 50
+
+
+def best_time(function, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def first_screen(path):
+    with TaskSnapshot(path) as snapshot:
+        return [snapshot.task(row) for row in range(min(SCREEN_ROWS, len(snapshot)))]
+
+
+def main():
+    task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    tasks = generate_tasks(task_count)
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "syllabus_tasks.json")
+        binary_path = os.path.join(directory, "syllabus_tasks.tasksnap")
+        TaskJournal(json_path).compact(tasks)
+        TaskJournal(binary_path).compact(tasks)
+        json_size = os.path.getsize(json_path)
+        binary_size = os.path.getsize(binary_path)
+
+        json_tasks, json_time = best_time(lambda: TaskJournal(json_path).load(), repeat)
+        binary_tasks, binary_time = best_time(lambda: TaskJournal(binary_path).load(), repeat)
+        screen, screen_time = best_time(lambda: first_screen(binary_path), repeat)
+        if binary_tasks != json_tasks or screen != json_tasks[:SCREEN_ROWS]:
+            sys.exit("The JSON and binary snapshots disagree")
+
+    print(f"{task_count} tasks, best of {repeat}:")
+    print(f"  JSON snapshot      {json_size / 1e6:>7.1f} MB")
+    print(f"  binary snapshot    {binary_size / 1e6:>7.1f} MB  ({json_size / binary_size:.1f}x smaller)")
+    print(f"  load JSON                  {json_time:>7.3f} s")
+    print(f"  load binary                {binary_time:>7.3f} s  ({json_time / binary_time:.1f}x)")
+    print(f"  open binary, {SCREEN_ROWS} rows       {screen_time:>7.4f} s  ({json_time / screen_time:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
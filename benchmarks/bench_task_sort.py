@@ -0,0 +1,58 @@
+"""
+Measures sorting the task table by each column with TaskTableModel.sort, for
+both row backends, against a QSortFilterProxyModel over the same model (which
+compares display strings fetched through data() for every comparison).
+
+Run from the repository root:
+    python benchmarks/bench_task_sort.py [task_count] [proxy_task_count]
+
+The proxy is slow enough that it is measured on fewer tasks (10,000 by default)
+and scaled up linearly, which understates its cost, as sorting is O(n log n).
+A display-less Qt platform is used when none is set.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QSortFilterProxyModel, Qt  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from bench_task_load import generate_tasks  # noqa: E402
+from main import TaskTableModel  # noqa: E402
+from task_rows import ColumnarTaskRows, TaskRows  # noqa: E402
+
+HEADERS = ["Subject", "Type", "Description", "Assigned", "Submit By", "Status", "Timestamp"]
+
+
+def time_sort(sort, column):
+    start = time.perf_counter()
+    sort(column, Qt.AscendingOrder)
+    return time.perf_counter() - start
+
+
+def main():
+    task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    proxy_task_count = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    app = QApplication.instance() or QApplication([])  # noqa: F841 (needed by the proxy model)
+    tasks = generate_tasks(task_count)
+    dict_model = TaskTableModel([dict(task) for task in tasks], HEADERS)
+    columnar_model = TaskTableModel(tasks, HEADERS, rows_class=ColumnarTaskRows)
+    proxy_model = QSortFilterProxyModel()
+    proxy_model.setSourceModel(TaskTableModel(generate_tasks(proxy_task_count), HEADERS, rows_class=TaskRows))
+
+    print(f"Sorting {task_count} tasks, ascending (proxy: {proxy_task_count} tasks, scaled linearly):")
+    print(f"  {'column':<12} {'TaskRows':>10} {'Columnar':>10} {'proxy':>12}")
+    for column, header in enumerate(HEADERS):
+        dict_time = time_sort(dict_model.sort, column)
+        columnar_time = time_sort(columnar_model.sort, column)
+        if dict_model.get_data() != columnar_model.get_data():
+            sys.exit(f"The backends sort {header} differently")
+        proxy_time = time_sort(proxy_model.sort, column) * task_count / proxy_task_count
+        print(f"  {header:<12} {dict_time * 1e3:>8.0f} ms {columnar_time * 1e3:>8.0f} ms {proxy_time * 1e3:>10.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
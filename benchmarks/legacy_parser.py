@@ -0,0 +1,191 @@
+"""
+The original look-ahead syllabus parser, which syllabus_parser replaced.
+
+It is only used by the benchmarks, as the reference that parse_syllabus is
+checked against and timed against.
+"""
+import os
+import re
+import sys
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from syllabus_parser import clean_syllabus_data  # noqa: E402
+
+
+def parse_syllabus_legacy(text):
+    """
+    Original look-ahead based parser, kept as the reference implementation.
+
+    syllabus_parser.parse_syllabus must produce identical output; the benchmarks compare the two.
+
+    Args:
+        text (str): The full text content from the PDF.
+
+    Returns:
+        dict: A dictionary where keys are course titles and values are
+              dictionaries containing course details.
+    """
+    syllabus_data = defaultdict(lambda: {"Units": [], "Lab Work": "", "Details": {}})
+    current_subject = None
+    parsing_contents = False
+    current_unit_content = []
+    lines = text.split('\n')
+    line_idx = 0
+
+    # Pattern for "Course Title: ..."
+    course_title_pattern = re.compile(r"^\s*\"?Course Title:\s*(.*?)\"?\s*$", re.IGNORECASE)
+    # General pattern for potential titles (if not starting with "Course Title:")
+    # This pattern is kept simpler; relies on subsequent keyword checks.
+    general_title_pattern = re.compile(r"^\s*\"?([A-Z][A-Za-z0-9\s\(\)\-\:]+?)\"?\s*$")
+
+    detail_keywords_re = re.compile(r"Course No:|Nature of the Course:|Semester:|Full Marks:|Pass Marks:|Credit Hrs:",
+                                    re.IGNORECASE)
+    unit_start_re = re.compile(r"^\s*Unit\s+[IVXLCDM]+[:\s(]", re.IGNORECASE)
+    lab_work_start_re = re.compile(r"^\s*(Laboratory Works?:|Lab Work:)", re.IGNORECASE)
+    books_start_re = re.compile(r"^\s*(Text Books?:|Reference Books?:)", re.IGNORECASE)
+
+    while line_idx < len(lines):
+        line = lines[line_idx].strip()
+        potential_title = None
+        title_found_this_iteration = False
+
+        # Try to match "Course Title: <Name>"
+        match = course_title_pattern.match(line)
+        if match:
+            potential_title = match.group(1).strip()
+            # Check if details follow in the next few lines
+            for i in range(line_idx, min(line_idx + 4, len(lines))):  # Check current and next 3 lines
+                if detail_keywords_re.search(lines[i]):
+                    title_found_this_iteration = True
+                    break
+
+        # If not found, try to match a general title format
+        # This is more heuristic: looks for a capitalized line followed by detail keywords
+        if not title_found_this_iteration:
+            match = general_title_pattern.match(line)
+            if match:
+                temp_title = match.group(1).strip()
+                # Avoid matching things like "Unit I" or "Text Books:" as titles
+                if len(temp_title) > 4 and not unit_start_re.match(temp_title) \
+                        and not lab_work_start_re.match(temp_title) \
+                        and not books_start_re.match(temp_title) \
+                        and not detail_keywords_re.search(temp_title):
+                    # Check if detail keywords (especially "Course No:") follow soon
+                    for i in range(line_idx + 1, min(line_idx + 4, len(lines))):
+                        if lines[i].strip().startswith("Course No:"):
+                            potential_title = temp_title
+                            title_found_this_iteration = True
+                            break
+
+        if title_found_this_iteration and potential_title:
+            if current_subject and current_unit_content:  # Save previous unit
+                unit_text = "\n".join(current_unit_content).strip()
+                if unit_text: syllabus_data[current_subject]["Units"].append(unit_text)
+            current_unit_content = []
+
+            current_subject = potential_title
+            parsing_contents = False
+            syllabus_data[current_subject]  # Ensure key exists
+
+            # Extract details from the vicinity of the title
+            details_text_block = []
+            for i in range(line_idx, min(line_idx + 7, len(lines))):  # Look in a small block of lines
+                details_text_block.append(lines[i])
+                if len(details_text_block) > 1 and lines[i].strip() == "" and \
+                        (i + 1 < len(lines) and (
+                                course_title_pattern.match(lines[i + 1]) or general_title_pattern.match(
+                            lines[i + 1]))):  # Stop if next title seems to start
+                    break
+            details_text = "\n".join(details_text_block)
+
+            # More robust detail extraction
+            course_no = re.search(r"Course No:\s*(\S+)", details_text, re.IGNORECASE)
+            if course_no: syllabus_data[current_subject]["Details"]["Course No"] = course_no.group(1)
+
+            credit_hrs = re.search(r"Credit Hrs:\s*(\S+)", details_text, re.IGNORECASE)
+            if credit_hrs: syllabus_data[current_subject]["Details"]["Credit Hrs"] = credit_hrs.group(1)
+
+            semester = re.search(r"Semester:\s*(\S+)", details_text, re.IGNORECASE)
+            if semester: syllabus_data[current_subject]["Details"]["Semester"] = semester.group(1)
+
+            full_marks = re.search(r"Full Marks:\s*(\S+)", details_text, re.IGNORECASE)
+            if full_marks: syllabus_data[current_subject]["Details"]["Full Marks"] = full_marks.group(1)
+
+            pass_marks = re.search(r"Pass Marks:\s*(\S+)", details_text, re.IGNORECASE)
+            if pass_marks: syllabus_data[current_subject]["Details"]["Pass Marks"] = pass_marks.group(1)
+
+            nature = re.search(r"Nature of the Course:\s*(.+)", details_text, re.IGNORECASE)
+            if nature: syllabus_data[current_subject]["Details"]["Nature"] = nature.group(1).strip()
+
+
+        elif line.startswith("Course Contents:"):
+            if current_subject:
+                parsing_contents = True
+                if current_unit_content:  # Save any lingering unit content before starting new ones
+                    unit_text = "\n".join(current_unit_content).strip()
+                    if unit_text: syllabus_data[current_subject]["Units"].append(unit_text)
+                current_unit_content = []
+
+
+        elif parsing_contents and current_subject and unit_start_re.match(line):
+            if current_unit_content:
+                unit_text = "\n".join(current_unit_content).strip()
+                if unit_text: syllabus_data[current_subject]["Units"].append(unit_text)
+            current_unit_content = [line]
+
+        elif lab_work_start_re.match(line) and current_subject:
+            if current_unit_content:  # Save previous unit
+                unit_text = "\n".join(current_unit_content).strip()
+                if unit_text: syllabus_data[current_subject]["Units"].append(unit_text)
+            current_unit_content = []
+            parsing_contents = False  # Lab work is usually after units
+
+            lab_desc = [
+                line.replace(lab_work_start_re.match(line).group(0), "").strip()]  # Remove "Laboratory Works:" prefix
+            temp_idx = line_idx + 1
+            blank_line_count = 0
+            while temp_idx < len(lines):
+                next_line = lines[temp_idx].strip()
+                if not next_line:
+                    blank_line_count += 1
+                    if blank_line_count >= 2: break  # Stop after two consecutive blank lines
+                else:
+                    blank_line_count = 0
+
+                # Stop conditions for lab work description
+                if books_start_re.match(next_line) or \
+                        course_title_pattern.match(next_line) or \
+                        (general_title_pattern.match(next_line) and \
+                         temp_idx + 1 < len(lines) and lines[temp_idx + 1].strip().startswith("Course No:")):
+                    break
+                lab_desc.append(next_line)
+                temp_idx += 1
+            syllabus_data[current_subject]["Lab Work"] = "\n".join(
+                filter(None, lab_desc)).strip()  # Filter out empty strings
+            line_idx = temp_idx - 1  # Adjust line_idx as we've looked ahead
+
+        elif parsing_contents and current_subject and current_unit_content and line:
+            # Append line to current unit if it seems to be part of it
+            # (e.g., indented, or not starting a new major section)
+            if re.match(r"^\s*\d+\.\d+(\.\d+)*\s+", line) or \
+                    re.match(r"^\s*[a-zA-Z][.)]\s+", line) or \
+                    (line.startswith("  ") or line.startswith("\t")) or \
+                    not (unit_start_re.match(line) or lab_work_start_re.match(line) or books_start_re.match(
+                        line) or course_title_pattern.match(line)):
+                current_unit_content.append(line)
+            else:  # Line doesn't seem part of current unit, save current unit and re-evaluate line
+                if current_unit_content:
+                    unit_text = "\n".join(current_unit_content).strip()
+                    if unit_text: syllabus_data[current_subject]["Units"].append(unit_text)
+                current_unit_content = []
+                line_idx -= 1  # Re-process this line in the next iteration
+
+        line_idx += 1
+
+    if current_subject and current_unit_content:  # Save the last unit
+        unit_text = "\n".join(current_unit_content).strip()
+        if unit_text: syllabus_data[current_subject]["Units"].append(unit_text)
+
+    return clean_syllabus_data(syllabus_data)
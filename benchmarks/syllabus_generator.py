@@ -0,0 +1,125 @@
+"""
+Generates synthetic syllabus text in the format parse_syllabus expects.
+
+Each course has a title, the detail lines, a varying number of units with
+numbered and lettered topics, optional laboratory works and book lists. The
+generator also returns what it wrote, so a parse of the text can be checked.
+
+Run from the repository root to write a corpus file:
+    python benchmarks/syllabus_generator.py 1000 > syllabus/synthetic.txt
+"""
+import random
+import sys
+
+ROMAN_NUMERALS = ("I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X", "XI", "XII")
+TOPIC_WORDS = ("Introduction", "Models", "Algorithms", "Analysis", "Design", "Protocols", "Structures",
+               "Applications", "Optimization", "Verification", "Security", "Systems", "Theory", "Methods")
+NATURES = ("Theory + Lab", "Theory", "Theory + Project")
+
+
+class GeneratedCourse:
+    """What the generator wrote for one course."""
+    __slots__ = ("title", "course_no", "unit_count", "has_lab")
+
+    def __init__(self, title, course_no, unit_count, has_lab):
+        self.title = title
+        self.course_no = course_no
+        self.unit_count = unit_count
+        self.has_lab = has_lab
+
+
+def _topic(rng):
+    return " and ".join(rng.sample(TOPIC_WORDS, 2))
+
+
+def generate_course(rng, n):
+    """
+    Returns the text lines of one course and its GeneratedCourse record.
+
+    Args:
+        rng (random.Random): Source of variation.
+        n (int): Sequence number; makes the title and course number unique.
+    """
+    title = f"Synthetic {_topic(rng)} {n}"
+    course_no = f"CSC{1000 + n}"
+    unit_count = rng.randint(2, len(ROMAN_NUMERALS))
+    has_lab = rng.random() < 0.7
+    lines = [
+        f"Course Title: {title}",
+        f"Course No: {course_no}",
+        f"Nature of the Course: {rng.choice(NATURES)}",
+        f"Semester: {ROMAN_NUMERALS[rng.randrange(8)]}",
+        "Full Marks: 60+20+20",
+        "Pass Marks: 24+8+8",
+        f"Credit Hrs: {rng.randint(2, 4)}",
+        "",
+        f"Course Description: This course covers {_topic(rng).lower()} in detail.",
+        "",
+        "Course Contents:",
+        "",
+    ]
+    for unit in range(unit_count):
+        lines.append(f"Unit {ROMAN_NUMERALS[unit]}: {_topic(rng)} ({rng.randint(3, 10)} Hrs.)")
+        for topic in range(rng.randint(1, 6)):
+            lines.append(f"{unit + 1}.{topic + 1} {_topic(rng)}")
+        if rng.random() < 0.3:
+            lines.append(f"a) Worked examples of {_topic(rng).lower()}")
+            lines.append("b) Case studies")
+        lines.append("")
+    if has_lab:
+        lines.append("Laboratory Works:")
+        for _ in range(rng.randint(1, 4)):
+            lines.append(f"Implement {_topic(rng).lower()} using any high level language.")
+        lines.append("")
+    lines.append("Text Books:")
+    lines.append(f"1. A. Author, {_topic(rng)}, Publisher.")
+    if rng.random() < 0.5:
+        lines.append("Reference Books:")
+        lines.append(f"1. B. Author, {_topic(rng)}, Publisher.")
+    lines.append("")
+    return lines, GeneratedCourse(title, course_no, unit_count, has_lab)
+
+
+def generate_syllabus(course_count, seed=0):
+    """
+    Generates a syllabus of course_count courses.
+
+    Returns:
+        tuple: (text, list of GeneratedCourse). The same seed always gives the same text.
+    """
+    rng = random.Random(seed)
+    lines = [""]
+    courses = []
+    for n in range(course_count):
+        course_lines, course = generate_course(rng, n)
+        lines.extend(course_lines)
+        courses.append(course)
+    return "\n".join(lines), courses
+
+
+def check_parse(syllabus_data, courses):
+    """
+    Compares a parse result with what the generator wrote.
+
+    Returns:
+        list: Descriptions of the differences; empty if the parse is correct.
+    """
+    problems = []
+    if len(syllabus_data) != len(courses):
+        problems.append(f"expected {len(courses)} courses, parsed {len(syllabus_data)}")
+    for course in courses:
+        parsed = syllabus_data.get(course.title)
+        if parsed is None:
+            problems.append(f"missing course {course.title!r}")
+            continue
+        if parsed["Details"].get("Course No") != course.course_no:
+            problems.append(f"{course.title!r}: course no {parsed['Details'].get('Course No')!r}")
+        if len(parsed["Units"]) != course.unit_count:
+            problems.append(f"{course.title!r}: {len(parsed['Units'])} units, expected {course.unit_count}")
+        if bool(parsed["Lab Work"]) != course.has_lab:
+            problems.append(f"{course.title!r}: lab work {'missing' if course.has_lab else 'unexpected'}")
+    return problems
+
+
+if __name__ == "__main__":
+    sys.stdout.write(generate_syllabus(int(sys.argv[1]) if len(sys.argv) > 1 else 100)[0])
@@ -0,0 +1,170 @@
+import re
+from collections import Counter
+
+
+# --- Syllabus Line Classification ---
+#
+# All syllabus patterns live here at module level. Section markers are told
+# apart by the first character of the stripped line, so a line costs at most one
+# section match: only lines starting with 'C' or '"' can be titles or "Course
+# Contents:", only 'U' lines can start a unit, and so on. Blank lines and most
+# body text need no match at all. Detail keywords all end with a colon, so lines
+# without one are never searched for them, and only lines starting with a capital
+# letter or a quote are checked for the shape of a plain title.
+
+COURSE_TITLE_RE = re.compile(r"^\s*\"?Course Title:\s*(.*?)\"?\s*$", re.IGNORECASE)
+# Shape of a plain title such as "Database Management System", optionally quoted
+TITLE_SHAPE_RE = re.compile(r"\"?([A-Z][A-Za-z0-9\s\(\)\-\:]+)\"?$")
+# Any of "Course No:", "Nature of the Course:", "Semester:", "Full Marks:", "Pass Marks:" or "Credit Hrs:".
+# The search stops only at colons and looks behind them for a keyword, which is much faster than trying
+# every keyword at every position of the line.
+DETAIL_KEYWORDS_RE = re.compile(r":(?:(?<=Course No:)|(?<=Nature of the Course:)|(?<=Semester:)|(?<=Full Marks:)"
+                                r"|(?<=Pass Marks:)|(?<=Credit Hrs:))", re.IGNORECASE)
+UNIT_START_RE = re.compile(r"^\s*Unit\s+[IVXLCDM]+[:\s(]", re.IGNORECASE)
+LAB_WORK_START_RE = re.compile(r"^\s*(Laboratory Works?:|Lab Work:)", re.IGNORECASE)
+BOOKS_START_RE = re.compile(r"^\s*(Text Books?:|Reference Books?:)", re.IGNORECASE)
+
+# Line classes, in priority order
+TITLE_LINE = "title"
+CONTENTS_LINE = "contents"
+UNIT_LINE = "unit"
+LAB_LINE = "lab"
+BOOKS_LINE = "books"
+BLANK_LINE = "blank"
+DETAIL_LINE = "detail"
+TEXT_LINE = "text"
+LINE_CLASSES = (TITLE_LINE, CONTENTS_LINE, UNIT_LINE, LAB_LINE, BOOKS_LINE, BLANK_LINE, DETAIL_LINE, TEXT_LINE)
+
+# Number of distinct whitespace-only lines whose LineInfo is kept for reuse
+BLANK_LINE_CACHE_SIZE = 16
+
+# First character of a stripped line -> (section pattern, class) it may start
+_SECTION_BY_FIRST_CHAR = {}
+for _chars, _pattern, _line_class in (("\"Cc", COURSE_TITLE_RE, TITLE_LINE), ("Uu", UNIT_START_RE, UNIT_LINE),
+                                      ("Ll", LAB_WORK_START_RE, LAB_LINE), ("TtRr", BOOKS_START_RE, BOOKS_LINE)):
+    for _char in _chars:
+        _SECTION_BY_FIRST_CHAR[_char] = (_pattern, _line_class)
+_TITLE_SHAPE_FIRST_CHARS = frozenset("\"ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+
+class LineInfo:
+    """
+    Classification result for a single syllabus line.
+
+    Attributes:
+        raw (str): The line exactly as it appeared in the input.
+        line (str): The stripped line.
+        line_class (str): The primary class, one of LINE_CLASSES.
+        course_title (str): Text after "Course Title:", or None if the line is not of that form.
+        general_match (bool): The line has the shape of a plain capitalized title.
+        general_title (str): The plain title, if it is not a unit, lab, book or detail line.
+        has_detail (bool): The line contains a course detail keyword such as "Credit Hrs:".
+        course_no (bool): The line starts with "Course No:".
+        marker (str): The matched "Laboratory Works:" style prefix for lab lines.
+
+    The parser's tokenizer (syllabus_parser.tokenize) then sets the token kind,
+    the confirmed course title and whether the line ends a lab section in kind,
+    title and ends_lab, so that each line is a single object throughout parsing.
+    """
+    __slots__ = ("raw", "line", "line_class", "course_title", "general_match", "general_title", "has_detail",
+                 "course_no", "marker", "kind", "title", "ends_lab")
+
+    def __init__(self, raw, line, line_class, course_title, general_match, general_title, has_detail, course_no,
+                 marker):
+        self.raw = raw
+        self.line = line
+        self.line_class = line_class
+        self.course_title = course_title
+        self.general_match = general_match
+        self.general_title = general_title
+        self.has_detail = has_detail
+        self.course_no = course_no
+        self.marker = marker
+
+    def __repr__(self):
+        return f"LineInfo({self.line_class}, {self.line!r})"
+
+
+class LineClassifier:
+    """
+    Classifies syllabus lines with at most one section match per line.
+
+    Args:
+        count_hits (bool): Keep per-class hit counters in `hits`, for profiling.
+    """
+
+    def __init__(self, count_hits=False):
+        self.count_hits = count_hits
+        self.hits = Counter()
+        self._blank_lines = {}  # Blank lines all classify alike, so one LineInfo is shared per distinct raw text
+
+    def classify(self, raw):
+        """
+        Classifies one line of syllabus text.
+
+        Args:
+            raw (str): The line, with or without surrounding whitespace.
+
+        Returns:
+            LineInfo: The classification result.
+        """
+        line = raw.strip()
+        if not line:
+            if self.count_hits:
+                self.hits[BLANK_LINE] += 1
+            info = self._blank_lines.get(raw)
+            if info is None:
+                info = LineInfo(raw, line, BLANK_LINE, None, False, None, False, False, None)
+                if len(self._blank_lines) < BLANK_LINE_CACHE_SIZE:
+                    self._blank_lines[raw] = info
+            return info
+
+        has_detail = ":" in line and DETAIL_KEYWORDS_RE.search(line) is not None
+        line_class = DETAIL_LINE if has_detail else TEXT_LINE
+        course_title = marker = None
+        first = line[0]
+        section = _SECTION_BY_FIRST_CHAR.get(first)
+        if section is not None:
+            pattern, section_class = section
+            match = pattern.match(line)
+            if match is not None:
+                line_class = section_class
+                if section_class == TITLE_LINE:
+                    course_title = match.group(1).strip()
+                elif section_class == LAB_LINE:
+                    marker = match.group(0)
+            elif first == "C" and line.startswith("Course Contents:"):
+                line_class = CONTENTS_LINE
+
+        general_match = False
+        general_title = None
+        if first in _TITLE_SHAPE_FIRST_CHARS:
+            match = TITLE_SHAPE_RE.match(line)
+            if match is not None:
+                general_match = True
+                temp_title = match.group(1).strip()
+                # Avoid matching things like "Unit I" or "Text Books:" as titles
+                if len(temp_title) > 4:
+                    if first == '"':  # The class above describes the quoted line, not the title inside it
+                        if not UNIT_START_RE.match(temp_title) and not LAB_WORK_START_RE.match(temp_title) \
+                                and not BOOKS_START_RE.match(temp_title) and not DETAIL_KEYWORDS_RE.search(temp_title):
+                            general_title = temp_title
+                    elif line_class not in (UNIT_LINE, LAB_LINE, BOOKS_LINE) and not has_detail:
+                        general_title = temp_title
+
+        if self.count_hits:
+            self.hits[line_class] += 1
+        return LineInfo(raw, line, line_class, course_title, general_match, general_title, has_detail,
+                        has_detail and line.startswith("Course No:"), marker)
+
+    def reset_hits(self):
+        self.hits.clear()
+
+    def hit_report(self):
+        """Returns the hit counters as (class, count, share) tuples in LINE_CLASSES order."""
+        total = sum(self.hits.values())
+        return [(name, self.hits[name], self.hits[name] / total if total else 0.0) for name in LINE_CLASSES]
+
+
+# Shared classifier used by the parser when the caller does not supply one
+default_classifier = LineClassifier()
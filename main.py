@@ -1,808 +1,74 @@
 import sys
-import re
+import argparse
+import bisect
+import csv
 import datetime
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import time
 import json  # For potentially saving/loading tasks later
+import sqlite3
 
 # Import necessary PyQt5 components
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTabWidget, QListWidget, QLabel, QTextEdit, QFormLayout,
     QLineEdit, QPushButton, QDateEdit, QComboBox, QTableView,
-    QGroupBox, QMessageBox, QSplitter, QHeaderView, QAbstractItemView
+    QGroupBox, QMessageBox, QSplitter, QHeaderView, QAbstractItemView, QFileDialog, QProgressBar
 )
 # Import QtCore explicitly for QDate, Qt, QAbstractTableModel, QVariant, QModelIndex
-from PyQt5.QtCore import Qt, QDate, QAbstractTableModel, QVariant, QModelIndex, pyqtSignal
+from PyQt5.QtCore import (Qt, QDate, QAbstractItemModel, QAbstractTableModel, QVariant, QModelIndex, QObject, QThread,
+                          QSemaphore, QTimer, pyqtSignal)
 from PyQt5.QtGui import QFont
 
+from atomic_file import atomic_write_json, load_json_with_backups
+from syllabus_cache import iter_syllabus_cached
+from syllabus_model import Course
+from syllabus_source import DEFAULT_SYLLABUS_PATH, SyllabusSource
+from task_import import TaskFileReader, parse_import_row, validate_task
+from task_index import DeadlineIndex, RecencyIndex
+from task_rows import ColumnarTaskRows, NewestFirstRows, TaskRows
+from task_store import (ADD, DELETE, TASK_ID_KEY, UPDATE, export_tasks_json, migrate_tasks, new_task_id,
+                        open_task_store)
 
-# --- Syllabus Parsing Logic ---
-def parse_syllabus(text):
-    """
-    Parses the syllabus text.
 
-    Args:
-        text (str): The full text content from the PDF.
+# --- Task Data Model (using QAbstractTableModel) ---
+TASK_TYPES = ["Assignment", "Lab Report", "Project", "Presentation", "Study Task"]
+TASK_STATUSES = ["Pending", "In Progress", "Completed", "Cancelled"]  # In workflow order, which is how they sort
+CLOSED_TASK_STATUSES = ["Completed", "Cancelled"]  # Tasks with these are never due
+SORT_RANKS = {"Status": {status: rank for rank, status in enumerate(TASK_STATUSES)}}
+DISPLAY_CACHE_ROWS = 2000  # Rows whose display text is kept; a few screens' worth
 
-    Returns:
-        dict: A dictionary where keys are course titles and values are
-              dictionaries containing course details.
-    """
-    syllabus_data = defaultdict(lambda: {"Units": [], "Lab Work": "", "Details": {}})
-    current_subject = None
-    parsing_contents = False
-    current_unit_content = []
-    lines = text.split('\n')
-    line_idx = 0
-
-    # Pattern for "Course Title: ..."
-    course_title_pattern = re.compile(r"^\s*\"?Course Title:\s*(.*?)\"?\s*$", re.IGNORECASE)
-    # General pattern for potential titles (if not starting with "Course Title:")
-    # This pattern is kept simpler; relies on subsequent keyword checks.
-    general_title_pattern = re.compile(r"^\s*\"?([A-Z][A-Za-z0-9\s\(\)\-\:]+?)\"?\s*$")
-
-    detail_keywords_re = re.compile(r"Course No:|Nature of the Course:|Semester:|Full Marks:|Pass Marks:|Credit Hrs:",
-                                    re.IGNORECASE)
-    unit_start_re = re.compile(r"^\s*Unit\s+[IVXLCDM]+[:\s(]", re.IGNORECASE)
-    lab_work_start_re = re.compile(r"^\s*(Laboratory Works?:|Lab Work:)", re.IGNORECASE)
-    books_start_re = re.compile(r"^\s*(Text Books?:|Reference Books?:)", re.IGNORECASE)
-
-    while line_idx < len(lines):
-        line = lines[line_idx].strip()
-        potential_title = None
-        title_found_this_iteration = False
-
-        # Try to match "Course Title: <Name>"
-        match = course_title_pattern.match(line)
-        if match:
-            potential_title = match.group(1).strip()
-            # Check if details follow in the next few lines
-            for i in range(line_idx, min(line_idx + 4, len(lines))):  # Check current and next 3 lines
-                if detail_keywords_re.search(lines[i]):
-                    title_found_this_iteration = True
-                    break
-
-        # If not found, try to match a general title format
-        # This is more heuristic: looks for a capitalized line followed by detail keywords
-        if not title_found_this_iteration:
-            match = general_title_pattern.match(line)
-            if match:
-                temp_title = match.group(1).strip()
-                # Avoid matching things like "Unit I" or "Text Books:" as titles
-                if len(temp_title) > 4 and not unit_start_re.match(temp_title) \
-                        and not lab_work_start_re.match(temp_title) \
-                        and not books_start_re.match(temp_title) \
-                        and not detail_keywords_re.search(temp_title):
-                    # Check if detail keywords (especially "Course No:") follow soon
-                    for i in range(line_idx + 1, min(line_idx + 4, len(lines))):
-                        if lines[i].strip().startswith("Course No:"):
-                            potential_title = temp_title
-                            title_found_this_iteration = True
-                            break
-
-        if title_found_this_iteration and potential_title:
-            if current_subject and current_unit_content:  # Save previous unit
-                unit_text = "\n".join(current_unit_content).strip()
-                if unit_text: syllabus_data[current_subject]["Units"].append(unit_text)
-            current_unit_content = []
-
-            current_subject = potential_title
-            parsing_contents = False
-            syllabus_data[current_subject]  # Ensure key exists
-
-            # Extract details from the vicinity of the title
-            details_text_block = []
-            for i in range(line_idx, min(line_idx + 7, len(lines))):  # Look in a small block of lines
-                details_text_block.append(lines[i])
-                if len(details_text_block) > 1 and lines[i].strip() == "" and \
-                        (i + 1 < len(lines) and (
-                                course_title_pattern.match(lines[i + 1]) or general_title_pattern.match(
-                            lines[i + 1]))):  # Stop if next title seems to start
-                    break
-            details_text = "\n".join(details_text_block)
-
-            # More robust detail extraction
-            course_no = re.search(r"Course No:\s*(\S+)", details_text, re.IGNORECASE)
-            if course_no: syllabus_data[current_subject]["Details"]["Course No"] = course_no.group(1)
-
-            credit_hrs = re.search(r"Credit Hrs:\s*(\S+)", details_text, re.IGNORECASE)
-            if credit_hrs: syllabus_data[current_subject]["Details"]["Credit Hrs"] = credit_hrs.group(1)
-
-            semester = re.search(r"Semester:\s*(\S+)", details_text, re.IGNORECASE)
-            if semester: syllabus_data[current_subject]["Details"]["Semester"] = semester.group(1)
-
-            full_marks = re.search(r"Full Marks:\s*(\S+)", details_text, re.IGNORECASE)
-            if full_marks: syllabus_data[current_subject]["Details"]["Full Marks"] = full_marks.group(1)
-
-            pass_marks = re.search(r"Pass Marks:\s*(\S+)", details_text, re.IGNORECASE)
-            if pass_marks: syllabus_data[current_subject]["Details"]["Pass Marks"] = pass_marks.group(1)
-
-            nature = re.search(r"Nature of the Course:\s*(.+)", details_text, re.IGNORECASE)
-            if nature: syllabus_data[current_subject]["Details"]["Nature"] = nature.group(1).strip()
-
-
-        elif line.startswith("Course Contents:"):
-            if current_subject:
-                parsing_contents = True
-                if current_unit_content:  # Save any lingering unit content before starting new ones
-                    unit_text = "\n".join(current_unit_content).strip()
-                    if unit_text: syllabus_data[current_subject]["Units"].append(unit_text)
-                current_unit_content = []
-
-
-        elif parsing_contents and current_subject and unit_start_re.match(line):
-            if current_unit_content:
-                unit_text = "\n".join(current_unit_content).strip()
-                if unit_text: syllabus_data[current_subject]["Units"].append(unit_text)
-            current_unit_content = [line]
-
-        elif lab_work_start_re.match(line) and current_subject:
-            if current_unit_content:  # Save previous unit
-                unit_text = "\n".join(current_unit_content).strip()
-                if unit_text: syllabus_data[current_subject]["Units"].append(unit_text)
-            current_unit_content = []
-            parsing_contents = False  # Lab work is usually after units
-
-            lab_desc = [
-                line.replace(lab_work_start_re.match(line).group(0), "").strip()]  # Remove "Laboratory Works:" prefix
-            temp_idx = line_idx + 1
-            blank_line_count = 0
-            while temp_idx < len(lines):
-                next_line = lines[temp_idx].strip()
-                if not next_line:
-                    blank_line_count += 1
-                    if blank_line_count >= 2: break  # Stop after two consecutive blank lines
-                else:
-                    blank_line_count = 0
-
-                # Stop conditions for lab work description
-                if books_start_re.match(next_line) or \
-                        course_title_pattern.match(next_line) or \
-                        (general_title_pattern.match(next_line) and \
-                         temp_idx + 1 < len(lines) and lines[temp_idx + 1].strip().startswith("Course No:")):
-                    break
-                lab_desc.append(next_line)
-                temp_idx += 1
-            syllabus_data[current_subject]["Lab Work"] = "\n".join(
-                filter(None, lab_desc)).strip()  # Filter out empty strings
-            line_idx = temp_idx - 1  # Adjust line_idx as we've looked ahead
-
-        elif parsing_contents and current_subject and current_unit_content and line:
-            # Append line to current unit if it seems to be part of it
-            # (e.g., indented, or not starting a new major section)
-            if re.match(r"^\s*\d+\.\d+(\.\d+)*\s+", line) or \
-                    re.match(r"^\s*[a-zA-Z][.)]\s+", line) or \
-                    (line.startswith("  ") or line.startswith("\t")) or \
-                    not (unit_start_re.match(line) or lab_work_start_re.match(line) or books_start_re.match(
-                        line) or course_title_pattern.match(line)):
-                current_unit_content.append(line)
-            else:  # Line doesn't seem part of current unit, save current unit and re-evaluate line
-                if current_unit_content:
-                    unit_text = "\n".join(current_unit_content).strip()
-                    if unit_text: syllabus_data[current_subject]["Units"].append(unit_text)
-                current_unit_content = []
-                line_idx -= 1  # Re-process this line in the next iteration
-
-        line_idx += 1
-
-    if current_subject and current_unit_content:  # Save the last unit
-        unit_text = "\n".join(current_unit_content).strip()
-        if unit_text: syllabus_data[current_subject]["Units"].append(unit_text)
-
-    # Final cleanup: remove subjects with no substantial content
-    cleaned_data = {
-        k: v for k, v in syllabus_data.items()
-        if v.get("Units") or v.get("Lab Work") or (v.get("Details") and v["Details"].get("Course No"))
-    }
-    for k in cleaned_data:  # Ensure "Units" key exists even if empty
-        if "Units" not in cleaned_data[k]:
-            cleaned_data[k]["Units"] = []
-    return cleaned_data
-
-
-# --- Extracted Text (Paste the full text from the PDF here) ---
-# Cleaned up entries for Operating Systems and Database Management System
-pdf_text = """
---- PAGE 1 ---
-
-Course Title: Theory of Computation
-Course No: CSC257
-Nature of the Course: Theory + Lab
-Semester: IV
-Full Marks: $60+20+20$
-Pass Marks: $24+8+8$
-Credit Hrs: 3
-
-Course Description: This course presents a study of Finite State Machines and their languages.
-It covers the details of finite state automata, regular expressions, context free grammars. More,
-the course includes design of the Push-down automata and Turing Machines. The course also
-includes basics of undecidabilty and intractability.
-
-Course Objectives: The main objective of the course is to introduce concepts of the models of
-computation and formal language approach to computation. The general objectives of this
-course are to, introduce concepts in automata theory and theory of computation, design different
-finite state machines and grammars and recognizers for different formal languages, identify
-different formal language classes and their relationships, determine the decidability and
-intractability of computational problems.
-
-Course Contents:
-
-Unit I: Basic Foundations (3 Hrs.)
-1.1. Review of Set Theory, Logic, Functions, Proofs
-1.2. Automata, Computability and Complexity: Complexity Theory, Computability Theory,
-Automata Theory
-1.3. Basic concepts of Automata Theory: Alphabets, Power of Alphabet, Kleen Closure
-Alphabet, Positive Closure of Alphabet, Strings, Empty String, Substring of a string,
-Concatenation of strings, Languages, Empty Language
-
-Unit II: Introduction to Finite Automata (8 Hrs.)
-2.1 Introduction to Finite Automata, Introduction of Finite State Machine
-2.2 Deterministic Finite Automata (DFA), Notations for DFA, Language of DFA, Extended
-Transition Function of DFA Non-Deterministic Finite Automaton (NFA), Notations for
-NFA, Language of NFA, Extended Transition
-2.3 Equivalence of DFA and NFA, Subset-Construction
-2.4 Method for reduction of NFA to DFA, Theorems for equivalence of Language accepted
-by DFA and NFA
-2.5 Finite Automaton with Epsilon Transition (ε - NFA), Notations for  NFA, Epsilon
-Closure of a State, Extended Transition Function of  NFA, Removing Epsilon
-Transition using the concept of Epsilon Closure, Equivalence of NFA and  -NFA,
-Equivalence of DFA and  - NFA
-2.6 Finite State Machines with output: Moore machine and Mealy Machines
-
-Unit III: Regular Expressions (6 Hrs.)
-3.1 Regular Expressions, Regular Operators, Regular Languages and their applications,
-Algebraic Rules for Regular Expressions
-
-36
-
-
---- PAGE 2 ---
-
-3.2 Equivalence of Regular Expression and Finite Automata, Reduction of Regular
-Expression to  – NFA, Conversion of DFA to Regular Expression
-3.3 Properties of Regular Languages, Pumping Lemma, Application of Pumping Lemma,
-Closure Properties of Regular Languages over (Union, Intersection, Complement)
-Minimization of Finite State Machines: Table Filling Algorithm
-
-Unit IV: Context Free Grammar (9 Hrs.)
-4.1 Introduction to Context Free Grammar (CFG), Components of CFG, Use of CFG,
-Context Free Language (CFL)
-4.2 Types of derivations: Bottomup and Topdown approach, Leftmost and Rightmost,
-Language of a grammar
-4.3 Parse tree and its construction, Ambiguous grammar, Use of parse tree to show ambiguity
-in grammar
-4.4 Regular Grammars: Right Linear and Left Linear, Equivalence of regular grammar and
-finite automata
-4.5 Simplification of CFG: Removal of Useless symbols, Nullable Symbols, and Unit
-Productions, Chomsky Normal Form (CNF), Greibach Normal Form (GNF), Backus-
-Naur Form (BNF)
-4.6 Context Sensitive Grammar, Chomsky Hierarchy Pumping Lemma for CFL, Application
-of Pumping Lemma, Closure Properties of CFL
-
-Unit V: Push Down Automata (7 Hrs.)
-5.1 Introduction to Push Down Automata (PDA), Representation of PDA, Operations of
-PDA, Move of a PDA, Instantaneous Description for PDA
-5.2 Deterministic PDA, Non Deterministic PDA, Acceptance of strings by PDA, Language
-of PDA
-5.3 Construction of PDA by Final State, Construction of PDA by Empty Stack,
-5.4 Conversion of PDA by Final State to PDA accepting by Empty Stack and vice-versa,
-Conversion of CFG to PDA, Conversion of PDA to CFG
-
-Unit VI: Turing Machines (10 Hrs.)
-6.1 Introduction to Turing Machines (TM), Notations of Turing Machine, Language of a
-Turing Machine, Instantaneous Description for Turing Machine, Acceptance of a string
-by a Turing Machines
-6.2 Turing Machine as a Language Recognizer, Turing Machine as a Computing Function,
-Turing Machine with Storage in its State, Turing Machine as a enumerator of stings of a
-language, Turing Machine as Subroutine
-6.3 Turing Machine with Multiple Tracks, Turing Machine with Multiple Tapes, Equivalence
-of Multitape-TM and Multitrack-TM, Non-Deterministic Turing Machines, Restricted
-Turing Machines: With Semi-infinite Tape, Multistack Machines, Counter Machines
-6.4 Curch Turing Thesis, Universal Turing Machine, Turing Machine and Computers,
-Encoding of Turing Machine, Enumerating Binary Strings, Codes of Turing Machine,
-Universal Turing Machine for encoding of Turing Machine
-
-37
-
-
---- PAGE 3 ---
-
-Unit VII: Undecidability and Intractability (5 Hrs.)
-7.1 Computational Complexity, Time and Space complexity of A Turing Machine,
-Intractability
-7.2 Complexity Classes, Problem and its types: Absract, Decision, Optimization
-7.3 Reducibility, Turing Reducible, Circuit Satisfiability, Cook's Theorem,
-7.4 Undecidability, Undecidable Problems: Post's Correspondence Problem, Halting
-Problem and its proof, Undecidable Problem about Turing Machines
-
-Laboratory Works:
-The laboratory work consists of design and implementation of finite state machines like DFA,
-NFA, PDA, and Turing Machine. Students are highly recommended to construct Tokenizers/
-Lexers over/for some language. Students are advised to use regex and Perl (for using regular
-expressions), or any other higher level language for the laboratory works.
-
-Text Books:
-1. John E. Hopcroft, Rajeev Motwani, Jeffrey D. Ullman, Introduction to Automata
-Theory, Languages, and Computation, 3rd Edition, Pearson - Addison-Wesley.
-
-Reference Books:
-1. Harry R. Lewis and Christos H. Papadimitriou, Elements of the Theory of Computation,
-$2^{nd}$ Edition, Prentice Hall.
-2. Michael Sipser, Introduction to the Theory of Computation, $3^{rd}$ Edition, Thomson Course
-Technology
-3. Efim Kinber, Carl Smith, Theory of Computing: A Gentle introduction, Prentice- Hall.
-4. John Martin, Introduction to Languages and the Theory of Computation, 3rd Edition, Tata
-McGraw Hill.
-5. Kenneth H. Rosen, Discrete Mathematics and its Applications to Computers Science,
-WCB/Mc-Graw Hill.
-
-38
-
-
---- PAGE 4 ---
-
-Course Title: Computer Networks
-Course No: CSC258
-Nature of the Course: Theory + Lab
-Semester: IV
-Full Marks: $60+20+20$
-Pass Marks: $24+8+8$
-Credit Hrs: 3
-
-Course Description: This course introduces concept of computer networking and discuss the
-different layers of networking model.
-
-Course Objective: The main objective of this course is to introduce the understanding of the
-concept of computer networking with its layers, topologies, protocols & standards, IPv4/IPv6
-addressing, Routing and Latest Networking Standards
-
-Course Contents:
-
-Unit 1: Introduction to Computer Network (6Hrs.)
-1.1. Definitions, Uses, Benefits
-1.2. Overview of Network Topologies (Star, Tree, Bus,...)
-1.3. Overview of Network Types (PAN, LAN, CAN, MAN,...)
-1.4. Networking Types (Client/Server, P2P)
-1.5. Overview of Protocols and Standards
-1.6. OSI Reference Model
-1.7. TCP/IP Models and its comparison with OSI.
-1.8. Connection and Connection-Oriented Network Services
-1.9. Internet, ISPs, Backbone Network Overview
-
-Unit 2: Physical Layer and Network Media (4Hrs.)
-2.1. Network Devices: Repeater, Hub, Switch, Bridge, Router
-2.2. Different types of transmission medias (wired: twisted pair, coaxial, fiber optic, Wireless:
-Radio waves, micro waves, infrared)
-2.3. Ethernet Cable Standards (UTP & Fiber cable standards)
-2.4. Circuit, Message & Packet Switching
-2.5. ISDN: Interface and Standards
-
-Unit 3: Data Link Layer (8Hrs.)
-3.1. Function of Data Link Layer (DLL)
-3.2. Overview of Logical Link Control (LLC) and Media Access Control (MAC)
-3.3. Framing and Flow Control Mechanisms
-3.4. Error Detection and Correction techniques
-3.5. Channel Allocation Techniques (ALOHA, Slotted ALOHA)
-3.6. Ethernet Standards (802.3 CSMA/CD, 802.4 Token Bus, 802.5 Token Ring)
-3.7. Wireless LAN: Spread Spectrum, Bluetooth, Wi-Fi
-3.8. Overview Virtual Circuit Switching, Frame Relay& ATM
-3.9. DLL Protocol: HDLC, PPP
-
-39
-
-
---- PAGE 5 ---
-
-Unit 4: Network Layer (10Hrs.)
-4.1. Introduction and Functions
-4.2. IPv4 Addressing & Sub-netting
-4.3. Class-full and Classless Addressing
-4.4. IPv6 Addressing and its Features
-4.5. IPv4 and IPv6 Datagram Formats
-4.6. Comparison of IPv4 and IPv6 Addressing
-4.7. Example Addresses: Unicast, Multicast and Broadcast
-4.8. Routing
-4.8.1. Introduction and Definition
-4.8.2. Types of Routing (Static vs Dynamic, Unicast vs Multicast, Link State vs
-Distance Vector, Interior vs Exterior)
-4.8.3. Path Computation Algorithms: Bellman Ford, Dijkstra's
-4.8.4. Routing Protocols: RIP, OSPF & BGP
-4.9. Overview of IPv4 to IPv6 Transition Mechanisms
-4.10. Overview of ICMP/ICMPv6&NATing
-4.11. Overview of Network Traffic Analysis
-4.12. Security Concepts: Firewall & Router Access Control
-
-Unit 5: Transport Layer (6Hrs.)
-5.1. Introduction, Functions and Services
-5.2. Transport Protocols: TCP, UDP and Their Comparisons
-5.3. Connection Oriented and Connectionless Services
-5.4. Congestion Control: Open Loop & Closed Loop, TCP Congestion Control
-5.5. Traffic Shaping Algorithms: Leaky Bucket & Token Bucket
-5.6. Queuing Techniques for Scheduling
-5.7. Introduction to Ports and Sockets, Socket Programming
-
-Unit 6: Application Layer (7Hrs.)
-6.1. Introduction and Functions
-6.2. Web &HTTP
-6.3. DNS and the Query Types
-6.4. File Transfer and Email Protocols: FTP, SFTP, SMTP, IMAP, POP3
-6.5. Overview of Application Server Concepts: Proxy, Web, Mail
-6.6. Network Management: SNMP
-
-Unit 7: Multimedia & Future Networking (4Hrs.)
-7.1. Overview Multimedia Streaming Protocols: SCTP
-7.2. Overview of SDN and its Features, Data and Control Plane
-7.3. Overview of NFV
-7.4. Overview of NGN
-
-Laboratory Works:
-The lab activities under this subject should accommodate at least the following;
-1. Understanding of Network equipment, wiring in details
-2. OS (Ubuntu/CentOS/Windows) installation, practice on basic Networking commands
-
-40
-
-
---- PAGE 6 ---
-
-(ifconfig/ipconfig, tcpdump, netstat, dnsip, hostname, route...)
-3. Overview of IP Addressing and sub-netting, static ip setting on Linux/windows machine,
-testing
-4. Introduction to Packet Tracer, creating of a LAN and connectivity test in the LAN,
-creation of VLAN and VLAN trunking.
-5. Basic Router Configuration, Static Routing Implementation
-6. Implementation of Dyanmic/interior/exterior routing (RIP, OSPF, BGP)
-7. Firewall Implementation, Router Access Control List (ACL)
-8. Packet capture and header analysis by wire-shark (TCP, UDP, IP)
-9. DNS, Web, FTP server configuration (shall use packet tracer, GNS3)
-10. Case Study: Network Operation Center Visit (ISP, Telecom, University Network)
-11. LAB Exam, Report and VIVA
-
-Text Books:
-1. Data Communications and Networking, 4th Edition, Behrouz A Forouzan. McGraw-Hill
-2. Computer Networking; A Top Down Approach Featuring The Internet, 2nd Edition,
-Kurose James F., Ross W. Keith PEARSON EDUCATION ASIA
-
-41
-
-
---- PAGE 7 ---
-
-Course Title: Operating Systems
-Course No: CSC259
-Nature of the Course: Theory + Lab
-Semester: IV
-Full Marks: $60+20+20$
-Pass Marks: 24+8+8
-Credit Hrs: 3
-
-Course Description: This course includes the basic concepts of operating system components. It
-consists of process management, deadlocks and process synchronization, memory management
-techniques, File system implementation, and I/O device management principles. It also includes
-case study on Linux operating system.
-
-Course Objectives:
-• Describe need and role of operating system.
-• Understand OS components such a scheduler, memory manager, file system handlers and
-I/O device managers.
-• Analyze and criticize techniques used in OS components
-• Demonstrate and simulate algorithms used in OS components
-• Identify algorithms and techniques used in different components of Linux
-
-Course Contents:
-
-Unit 1: Operating System Overview (4 Hrs.)
-1.1. Definition, Two views of operating system, Evolution of operating system, Types of OS.
-1.2. System Call, Handling System Calls, System Programs, Operating System Structures,
-The Shell, Open Source Operating Systems
-
-Unit 2: Process Management (10 Hrs.)
-2.1. Process vs Program, Multiprogramming, Process Model, Process States, Process Control
-Block.
-2.2. Threads, Thread vs Process, User and Kernel Space Threads.
-2.3. Inter Process Communication, Race Condition, Critical Section
-2.4. Implementing Mutual Exclusion: Mutual Exclusion with Busy Waiting (Disabling
-Interrupts, Lock Variables, Strict Alteration, Peterson's Solution, Test and Set Lock),
-Sleep and Wakeup, Semaphore, Monitors, Message Passing,
-2.5. Classical IPC problems: Producer Consumer, Sleeping Barber, Dining Philosopher
-Problem
-2.6. Process Scheduling: Goals, Batch System Scheduling (First-Come First-Served, Shortest
-Job First, Shortest Remaining Time Next), Interactive System Scheduling (Round-Robin
-Scheduling, Priority Scheduling, Multiple Queues), Overview of Real Time System
-Scheduling
-
-Unit 3: Process Deadlocks (6 Hrs.)
-3.1. Introduction, Deadlock Characterization, Preemptable and Non-preemptable Resources,
-Resource - Allocation Graph, Conditions for Deadlock
-
-42
-
-
---- PAGE 8 ---
-
-3.2. Handling Deadlocks: Ostrich Algorithm, Deadlock prevention, Deadlock Avoidance,
-Deadlock Detection (For Single and Multiple Resource Instances), Recovery From
-Deadlock (Through Preemption and Rollback)
-
-Unit 4: Memory Management (8 Hrs.)
-4.1. Introduction, Monoprogramming VS. Multi-programming, Modelling
-Multiprogramming, Multiprogramming with fixed and variable partitions, Relocation
-and Protection.
-4.2. Memory management (Bitmaps & Linked-list), Memory Allocation Strategies
-4.3. Virtual memory: Paging, Page Table, Page Table Structure, Handling Page Faults,
-TLB's
-4.4. Page Replacement Algorithms: FIFO, Second Chance, LRU, Optimal, LFU, Clock, WS-
-Clock, Concept of Locality of Reference, Belady's Anomaly
-4.5. Segmentation: Need of Segmentation, its Drawbacks, Segmentation with Paging(MULTICS)
-
-Unit 5: File Management (6 Hrs.)
-5.1. File Overview: File Naming, File Structure, File Types, File Access, File Attributes, File
-Operations, Single Level, two Level and Hierarchical Directory Systems, File System
-Layout.
-5.2. Implementing Files: Contiguous allocation, Linked List Allocation, Linked List
-Allocation using Table in Memory, Inodes.
-5.3. Directory Operations, Path Names, Directory Implementation, Shared Files
-5.4. Free Space Management: Bitmaps, Linked List
-
-Unit 6: Device Management (6 Hrs.)
-6.1. Classification of IO devices, Controllers, Memory Mapped IO, DMA Operation,
-Interrupts
-6.2. Goals of IO Software, Handling IO(Programmed IO, Interrupt Driven IO, IO using
-DMA), IO Software Layers (Interrupt Handlers, Device Drivers)
-6.3. Disk Structure, Disk Scheduling (FCFS, SSTF, SCAN, CSCAN, LOOK, CLOOK), Disk
-Formatting (Cylinder Skew, Interleaving, Error handling), RAID
-
-Unit 7: Linux Case Study (5 Hrs.)
-7.1 History, Kernel Modules, Process Management, Scheduling, Inter-process
-Communication, Memory Management, File System Management Approaches, Device
-Management Approaches.
-
-Laboratory Works:
-The laboratory work includes solving problems in operating system. The lab work should include
-at least;
-Learn basic Linux Commands
-Create process, threads and implement IPC techniques
-Simulate process Scheduling algorithms and deadlock detection algorithms
-Simulate page replacement algorithms
-Simulate free space management techniques and disk scheduling algorithms.
-
-43
-
-
---- PAGE 9 ---
-
-Text Books:
-1. Modern Operating Systems: Andrew S. Tanenbaum, PH1 Publication, Third edition,
-2008
-
-Reference Books:
-1. Abraham Silberschatz, Peter Baer Galvin and Greg Gagne, "Operating System
-Concepts", John Wiley & Sons (ASIA) Pvt. Ltd, Seventh edition, 2005.
-2. Harvey M. Deitel, Paul J. Deitel, and David R. Choffnes, "Operating Systems, Prentice
-Hall, Third edition, 2003.
-
-44
-
-
---- PAGE 10 ---
-
-Course Title: Database Management System
-Course No: CSC260
-Nature of the Course: Theory + Lab
-Semester: IV
-Full Marks: $60+20+20$
-Pass Marks: $24+8+8$
-Credit Hrs: 3
-
-Course Description: The course covers the basic concepts of databases, database system
-concepts and architecture, data modeling using ER diagram, relational model, SQL, relational
-algebra and calculus, normalization, transaction processing, concurrency control, and database
-recovery.
-
-Course Objective: The main objective of this course is to introduce the basic concepts of
-database, data modeling techniques using entity relationship diagram, relational algebra and
-calculus, basic and advanced features SQL, normalization, transaction processing, concurrency
-control, and recovery techniques.
-
-Course Contents:
-
-Unit 1: Database and Database Users (2 Hrs.)
-Introduction; Characteristics of the Database Approach; Actors on the Scene; Workers behind
-the Scene; Advantages of Using the DBMS Approach
-
-Unit 2: Database System - Concepts and Architecture (3 Hrs.)
-Data Models, Schemas, and Instances; Three-Schema Architecture and Data Independence;
-Database Languages and Interfaces; the Database System Environment; Centralized and
-Client/Server Architectures for DBMSS; Classification of Database Management Systems
-
-Unit 3: Data Modeling Using the Entity-Relational Model (6 Hrs.)
-Using High-Level Conceptual Data Models for Database Design; Entity Types, Entity Sets,
-Attributes, and Keys; Relationship Types, Relationship Sets, Roles, and Structural Constraints;
-Weak Entity Types; ER Diagrams, Naming Conventions, and Design Issues; Relationship Types
-of Degree Higher Than Two; Subclasses, Superclasses, and Inheritance; Specialization and
-Generalization; Constraints and Characteristics of Specialization and Generalization
-
-Unit 4: The Relational Data Model and Relational Database Constraints (3 Hrs.)
-Relational Model Concepts; Relational Model Constraints and Relational Database Schemas;
-Update Operations, Transactions, and Dealing with Constraint Violations
-
-Unit 5: The Relational Algebra and Relational Calculus (5 Hrs.)
-Unary Relational Operations: SELECT and PROJECT; Relational Algebra Operations from Set
-Theory; Binary Relational Operations: JOIN and DIVISION; Additional Relational Operations;
-the Tuple Relational Calculus; the Domain Relational Calculus
-
-Unit 6: SQL (8 Hrs.)
-Data Definition and Data Types; Specifying Constraints; Basic Retrieval Queries; Complex
-Retrieval Queries; INSERT, DELETE, and UPDATE Statements; Views
-
-45
-
-
---- PAGE 11 ---
-
-Unit 7: Relational Database Design (7 Hrs.)
-Relational Database Design Using ER-to-Relational Mapping; Informal Design Guidelines for
-Relational Schemas; Functional Dependencies; Normal Forms Based on Primary Keys; General
-Definitions of Second and Third Normal Forms; Boyce-Codd Normal Form; Multivalued
-Dependency and Fourth Normal Form; Properties of Relational Decomposition
-
-Unit 8: Introduction to Transaction Processing Concepts and Theory (4 Hrs.)
-Introduction to Transaction Processing; Transaction and System Concepts; Desirable Properties
-of Transactions; Characterizing Schedules Based on Recoverability; Characterizing Schedules
-Based on Serializability
-
-Unit 9: Concurrency Control Techniques (4 Hrs.)
-Two-Phase Locking Technique; Timestamp Ordering; Multiversion Concurrency Control;
-Validation (Optimistic) Techniques and Snapshot Isolation Concurrency Control
-
-Unit 10: Database Recovery Techniques (3 Hrs.)
-Recovery Concepts; NO-UNDO/REDO Recovery Based on Deferred Update; Recovery
-Technique Based on Immediate Update; Shadow Paging; Database Backup and Recovery from
-Catastrophic Failures
-
-Laboratory Works:
-The laboratory work includes writing database programs to create and query databases using
-basic and advanced features of structured query language (SQL).
-
-Text Books:
-1. Fundamentals of Database Systems; Seventh Edition; Ramez Elmasri, Shamkant B. Navathe;
-Pearson Education
-2. Database System Concepts; Sixth Edition; Avi Silberschatz, Henry F Korth, S Sudarshan;
-McGraw-Hill
-
-Reference Books:
-1. Database Management Systems; Third Edition; Raghu Ramakrishnan, Johannes Gehrke;
-McGraw-Hill
-2. A First Course in Database Systems; Jaffrey D. Ullman, Jennifer Widom; Third Edition;
-Pearson Education Limited
-
-46
-
-
---- PAGE 12 ---
-
-Course Title: Artificial Intelligence
-Course No: CSC261
-Nature of the Course: Theory + Lab
-Semester: IV
-Full Marks: $60+20+20$
-Pass Marks: $24+8+8$
-Credit Hrs: 3
-
-Course Description: The course introduces the ideas and techniques underlying the principles
-and design of artificial intelligent systems. The course covers the basics and applications of AI,
-including: design of intelligent agents, problem solving, searching, knowledge representation
-systems, probabilistic reasoning, neural networks, machine learning and natural language
-processing.
-
-Course Objectives: The main objective of the course is to introduce fundamental concepts of
-Artificial Intelligence. The general objectives are to learn about computer systems that exhibit
-intelligent behavior, design intelligent agents, identify Al problems and solve the problems,
-design knowledge representation and expert systems, design neural networks for solving
-problems, identify different machine learning paradigms and identify their practical applications.
-
-Course Contents:
-
-Unit I: Introduction (3 Hrs.)
-1.1. Artificial Intelligence (AI), AI Perspectives: acting and thinking humanly, acting and
-thinking rationally
-1.2. History of AI
-1.3. Foundations of AI
-1.4. Applications of Al
-
-Unit II: Intelligent Agents (4 Hrs.)
-2.1. Introduction of agents, Structure of Intelligent agent, Properties of Intelligent Agents
-2.2. Configuration of Agents, PEAS description of Agents
-2.3. Types of Agents: Simple Reflexive, Model Based, Goal Based, Utility Based.
-2.4. Environment Types: Deterministic, Stochastic, Static, Dynamic, Observable, Semi-
-observable, Single Agent, Multi Agent
-
-Unit III: Problem Solving by Searching (9 Hrs.)
-3.1. Definition, Problem as a state space search, Problem formulation, Well-defined
-problems,
-3.2. Solving Problems by Searching, Search Strategies, Performance evaluation of search
-techniques
-3.3. Uninformed Search: Depth First Search, Breadth First Search, Depth Limited Search,
-Iterative Deepening Search, Bidirectional Search
-3.4. Informed Search: Greedy Best first search, $A^{*}$ search, Hill Climbing, Simulated
-Annealing
-3.5. Game playing, Adversarial search techniques, Mini-max Search, Alpha-Beta Pruning.
-3.6. Constraint Satisfaction Problems
-
-47
-
-
---- PAGE 13 ---
-
-Unit IV: Knowledge Representation (14 Hrs.)
-4.1. Definition and importance of Knowledge, Issues in Knowledge Representation,
-Knowledge Representation Systems, Properties of Knowledge Representation Systems.
-4.2. Types of Knowledge Representation Systems: Semantic Nets, Frames, Conceptual
-Dependencies, Scripts, Rule Based Systems, Propositional Logic, Predicate Logic
-4.3. Propositional Logic(PL): Syntax, Semantics, Formal logic-connectives, truth tables,
-tautology, validity, well-formed-formula, Inference using Resolution, Backward
-Chaining and Forward Chaining
-4.4. Predicate Logic: FOPL, Syntax, Semantics, Quantification, Inference with FOPL: By
-converting into PL (Existential and universal instantiation), Unification and lifting,
-Inference using resolution
-4.5. Handling Uncertain Knowledge, Radom Variables, Prior and Posterior Probability,
-Inference using Full Joint Distribution, Bayes' Rule and its use, Bayesian Networks,
-Reasoning in Belief Networks
-4.6. Fuzzy Logic
-
-Unit V: Machine Learning (9 Hrs.)
-5.1. Introduction to Machine Learning, Concepts of Learning, Supervised, Unsupervised and
-Reinforcement Learning
-5.2. Statistical-based Learning: Naive Bayes Model
-5.3. Learning by Genetic Algorithm
-5.4. Learning with Neural Networks: Introduction, Biological Neural Networks Vs. Artificial
-Neural Networks (ANN), Mathematical Model of ANN, Types of ANN: Feed-forward,
-Recurrent, Single Layered, Multi-Layered, Application of Artificial Neural Networks,
-Learning by Training ANN, Supervised vs. Unsupervised Learning, Hebbian Learning,
-Perceptron Learning, Back-propagation Learning
-
-Unit VI: Applications of AI (6 Hrs.)
-6.1. Expert Systems, Development of Expert Systems
-6.2. Natural Language Processing: Natural Language Understanding and Natural Language
-Generation, Steps of Natural Language Processing
-6.3. Machine Vision Concepts
-6.4. Robotics
-
-Laboratory Works:
-The laboratory work consists of design and implementation of intelligent agents and expert
-systems, searching techniques, knowledge representation systems and machine learning
-techniques. Students are also advised to implement Neural Networks, Genetic Algorithms for
-solving practical problems of AI. Students are advised to use LISP, PROLOG, or any other high
-level language.
-
-Text Books:
-1. Stuart Russel and Peter Norvig, Artificial Intelligence A Modern Approach, Pearson
-
-48
-
-
---- PAGE 14 ---
-
-Reference Books:
-1. E. Rich, K. Knight, Shivashankar B. Nair, Artificial Intelligence, Tata McGraw Hill.
-2. George F. Luger, Artificial Intelligence: Structures and Strategies for Complex Problem
-Solving, Benjamin/Cummings Publication
-3. D. W. Patterson, Artificial Intelligence and Expert Systems, Prentice Hall.
-4. P. H. Winston, Artificial Intelligence, Addison Wesley.
-
-49
-"""
+
+def format_display_value(value):
+    """The text a task table cell shows for a value."""
+    if isinstance(value, datetime.date):
+        return value.strftime("%Y-%m-%d")
+    elif isinstance(value, datetime.datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    elif value is None:
+        return ""  # Represent None as empty string for display
+    else:
+        return str(value)  # Convert other types to string for display
 
 
-# --- Task Data Model (using QAbstractTableModel) ---
 class TaskTableModel(QAbstractTableModel):
-    def __init__(self, data, headers, parent=None):
+    def __init__(self, data, headers, parent=None, rows_class=TaskRows, display_cache_rows=DISPLAY_CACHE_ROWS):
         super().__init__(parent)
-        self._data = data  # List of dictionaries
+        self._rows_class = rows_class  # TaskRows, or ColumnarTaskRows to keep tasks in typed columns
+        self._rows = self._make_rows(data)
         self.headers = headers
+        # Row -> display text of its cells, formatted once for all columns when the row is first
+        # painted. Dropped for a row when it changes, and entirely when rows move; 0 rows disables it.
+        self._display_cache = {}
+        self._display_cache_rows = display_cache_rows
+        # Indexes of task ids by some of their fields, kept up to date as tasks change
+        self._recency_index = RecencyIndex()
+        self._deadline_index = DeadlineIndex(closed_statuses=CLOSED_TASK_STATUSES)
+        self._field_indexes = [self._recency_index, self._deadline_index]
+        self._index_tasks()
 
     def rowCount(self, parent=QModelIndex()):
-        return len(self._data)
+        return len(self._rows)
 
     def columnCount(self, parent=QModelIndex()):
         return len(self.headers)
@@ -812,22 +78,21 @@ class TaskTableModel(QAbstractTableModel):
             return QVariant()  # Return default-constructed (invalid) QVariant
 
         row = index.row()
-        if not (0 <= row < len(self._data)):
+        if not (0 <= row < len(self._rows)):
             return QVariant()
 
+        if role == Qt.DisplayRole:  # Plain text: PyQt wraps it without a QVariant being built here
+            texts = self._display_cache.get(row)
+            if texts is None:
+                if not self._display_cache_rows:
+                    return format_display_value(self._rows.value(row, self.headers[index.column()]))
+                texts = self._cache_display_row(row)
+            return texts[index.column()]
+
         col_key = self.headers[index.column()]
-        value = self._data[row].get(col_key)
+        value = self._rows.value(row, col_key)
 
-        if role == Qt.DisplayRole:
-            if isinstance(value, datetime.date):
-                return QVariant(value.strftime("%Y-%m-%d"))
-            elif isinstance(value, datetime.datetime):
-                return QVariant(value.strftime("%Y-%m-%d %H:%M:%S"))
-            elif value is None:
-                return QVariant("")  # Represent None as empty string for display
-            else:
-                return QVariant(str(value))  # Convert other types to string for display
-        elif role == Qt.EditRole:
+        if role == Qt.EditRole:
             if isinstance(value, datetime.date):
                 # For QDateEdit, it expects QDate
                 return QDate(value.year, value.month, value.day)
@@ -837,6 +102,13 @@ class TaskTableModel(QAbstractTableModel):
 
         return QVariant()  # Default for other roles
 
+    def _cache_display_row(self, row):
+        texts = tuple(format_display_value(self._rows.value(row, key)) for key in self.headers)
+        if len(self._display_cache) >= self._display_cache_rows:
+            del self._display_cache[next(iter(self._display_cache))]  # The row cached longest ago
+        self._display_cache[row] = texts
+        return texts
+
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         if role == Qt.DisplayRole and orientation == Qt.Horizontal:
             return QVariant(self.headers[section])  # Wrap header string in QVariant
@@ -852,7 +124,7 @@ class TaskTableModel(QAbstractTableModel):
             return False
 
         row = index.row()
-        if not (0 <= row < len(self._data)):
+        if not (0 <= row < len(self._rows)):
             return False
 
         col_key = self.headers[index.column()]
@@ -867,47 +139,458 @@ class TaskTableModel(QAbstractTableModel):
         else:
             py_value = value  # Assume it's already a Python type or string
 
-        self._data[row][col_key] = py_value
+        self._rows.set_value(row, col_key, py_value)
+        self._display_cache.pop(row, None)
+        self._index_fields(row, [col_key])
         self.dataChanged.emit(index, index, [role])
         return True
 
     def insertRows(self, position, rows=1, parent=QModelIndex()):
-        position = max(0, min(position, self.rowCount()))
-        self.beginInsertRows(parent, position, position + rows - 1)
-        for i in range(rows):
-            default_task = {key: None for key in self.headers}
-            default_task['Status'] = 'Pending'
-            default_task['Timestamp'] = datetime.datetime.now()
-            default_task['Assigned'] = datetime.date.today()
-            default_task['Submit By'] = datetime.date.today() + datetime.timedelta(days=7)
-            self._data.insert(position + i, default_task)
-        self.endInsertRows()
+        self.add_tasks([{}] * rows, position)  # Rows of default values
         return True
 
     def removeRows(self, position, rows=1, parent=QModelIndex()):
-        if position < 0 or position + rows > len(self._data):
+        if position < 0 or position + rows > len(self._rows):
             return False
-        self.beginRemoveRows(parent, position, position + rows - 1)
-        for _ in range(rows):  # Use _ if loop variable i is not used
-            if position < len(self._data):
-                del self._data[position]
-            else:
-                break
-        self.endRemoveRows()
+        if rows > 0:
+            self._remove_block(position, rows)
         return True
 
+    def _default_task(self):
+        default_task = {key: None for key in self.headers}
+        default_task['Status'] = 'Pending'
+        default_task['Timestamp'] = datetime.datetime.now()
+        default_task['Assigned'] = datetime.date.today()
+        default_task['Submit By'] = datetime.date.today() + datetime.timedelta(days=7)
+        return default_task
+
+    def add_tasks(self, tasks, position=0):
+        """
+        Inserts tasks as one block of rows at position, with a single rowsInserted.
+
+        Fields a task lacks get the defaults of a new row, and a task without
+        an id, or with one already in the table, gets a new one. The given
+        dictionaries are not kept. Returns the ids of the added tasks, in order.
+        """
+        if not tasks:
+            return []
+        position = max(0, min(position, len(self._rows)))
+        default_task = self._default_task()
+        new_tasks = []
+        added_ids = set()
+        for fields in tasks:
+            task = dict(default_task)
+            task.update(fields)
+            task_id = task.get(TASK_ID_KEY)
+            if not task_id or task_id in self._rows or task_id in added_ids:
+                task_id = task[TASK_ID_KEY] = new_task_id()
+            added_ids.add(task_id)
+            new_tasks.append(task)
+
+        self.beginInsertRows(QModelIndex(), position, position + len(new_tasks) - 1)
+        self._rows.insert_many(position, new_tasks)
+        for field_index in self._field_indexes:
+            field_index.add_many((task[TASK_ID_KEY], [task.get(key) for key in field_index.fields])
+                                 for task in new_tasks)
+        self._display_cache.clear()
+        self.endInsertRows()
+        return [task[TASK_ID_KEY] for task in new_tasks]
+
+    def _remove_block(self, position, count):
+        """Removes count adjacent rows with a single rowsRemoved; returns their task ids."""
+        self.beginRemoveRows(QModelIndex(), position, position + count - 1)
+        task_ids = self._rows.remove_many(position, count)
+        for field_index in self._field_indexes:
+            field_index.remove_many(task_ids)
+        self._display_cache.clear()
+        self.endRemoveRows()
+        return task_ids
+
+    def remove_tasks(self, rows):
+        """
+        Removes the given rows, with one rowsRemoved per run of adjacent rows.
+        Rows out of range are ignored. Returns the removed task ids, in row order.
+        """
+        blocks = []  # [first row, row count], top to bottom
+        for row in sorted({row for row in rows if 0 <= row < len(self._rows)}):
+            if blocks and blocks[-1][0] + blocks[-1][1] == row:
+                blocks[-1][1] += 1
+            else:
+                blocks.append([row, 1])
+        # Bottom block first, so the rows of the blocks above do not move
+        removed_blocks = [self._remove_block(first, count) for first, count in reversed(blocks)]
+        return [task_id for task_ids in reversed(removed_blocks) for task_id in task_ids]
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """
+        Sorts the rows by a column, in place, so that view rows stay model rows.
+
+        The rows are ordered by keys the row storage computes for the whole
+        column at once (date ordinals, status ranks, the strings themselves),
+        never by comparing display text. The sort is stable, and selected rows
+        follow their tasks to their new positions.
+        """
+        if not 0 <= column < len(self.headers):
+            return
+        key = self.headers[column]
+        sort_keys = self._rows.sort_keys(key, SORT_RANKS.get(key))
+        new_order = sorted(range(len(sort_keys)), key=sort_keys.__getitem__, reverse=order == Qt.DescendingOrder)
+
+        self.layoutAboutToBeChanged.emit([], QAbstractItemModel.VerticalSortHint)
+        self._rows.reorder(new_order)
+        self._display_cache.clear()
+        persistent_indexes = self.persistentIndexList()
+        if persistent_indexes:
+            new_rows = {old_row: new_row for new_row, old_row in enumerate(new_order)}
+            self.changePersistentIndexList(
+                persistent_indexes,
+                [self.index(new_rows[index.row()], index.column()) for index in persistent_indexes])
+        self.layoutChanged.emit([], QAbstractItemModel.VerticalSortHint)
+
     def get_data(self):
-        return self._data
+        """All tasks, in row order, in a new list. With ColumnarTaskRows the dictionaries are new too."""
+        return self._rows.tasks()
+
+    def _make_rows(self, data):
+        # Stored bottom-up, so tasks added at the top are appended (see NewestFirstRows)
+        return NewestFirstRows(self._rows_class(data[::-1]))
+
+    def set_data(self, data):
+        """Replaces all rows, e.g. once tasks have been loaded in the background."""
+        self.beginResetModel()
+        self._rows = self._make_rows(data)
+        self._index_tasks()
+        self._display_cache.clear()
+        self.endResetModel()
+
+    def _index_tasks(self):
+        """Rebuilds the field indexes from all rows."""
+        for field_index in self._field_indexes:
+            field_index.rebuild((self._rows.task_id(row), [self._rows.value(row, key) for key in field_index.fields])
+                                for row in range(len(self._rows)))
+
+    def _index_fields(self, row, changed_keys):
+        """Updates the field indexes that depend on any of the changed fields of a row."""
+        for field_index in self._field_indexes:
+            if any(key in changed_keys for key in field_index.fields):
+                field_index.set(self._rows.task_id(row), [self._rows.value(row, key) for key in field_index.fields])
+
+    def get_task(self, task_id):
+        """Returns the task with the given id, or None."""
+        row = self.get_task_row(task_id)
+        return self._rows.task(row) if row >= 0 else None
+
+    def get_task_row(self, task_id):
+        """
+        Returns the row of the task with the given id, or -1 if there is none.
+
+        O(1), except for the first lookup after rows were inserted or removed
+        below the top of the table (see NewestFirstRows.row_of).
+        """
+        return self._rows.row_of(task_id)
+
+    def get_row_task_id(self, row_index):
+        if 0 <= row_index < len(self._rows):
+            return self._rows.task_id(row_index)
+        return None
+
+    def update_task(self, row, fields):
+        """
+        Sets several fields of the task at row, with a single dataChanged for
+        the row. Returns False if there is no such row. Task ids cannot be changed.
+        """
+        if not 0 <= row < len(self._rows):
+            return False
+        if TASK_ID_KEY in fields:
+            raise ValueError("the id of a task cannot be changed")
+        self._rows.update(row, fields)
+        self._display_cache.pop(row, None)
+        self._index_fields(row, fields)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.headers) - 1), [Qt.EditRole])
+        return True
+
+    def update_task_fields(self, task_id, fields):
+        """Sets several fields of the task with the given id; returns its row, or -1 if there is no such task."""
+        row = self.get_task_row(task_id)
+        if row < 0:
+            return -1
+        self.update_task(row, fields)
+        return row
+
+    def remove_task(self, task_id):
+        """Removes the task with the given id; returns False if there is no such task."""
+        row = self.get_task_row(task_id)
+        return row >= 0 and self.removeRows(row, 1)
+
+    def recent_tasks(self, count):
+        """
+        The count most recent tasks by Timestamp, newest first, then tasks
+        without a valid timestamp if there are too few. Reads only those tasks.
+        """
+        return [self.get_task(task_id) for task_id in self._recency_index.newest(count)]
+
+    @property
+    def deadlines(self):
+        """The DeadlineIndex of open tasks by Submit By; its queries return task ids for get_task."""
+        return self._deadline_index
 
     def get_row_data(self, row_index):
-        if 0 <= row_index < len(self._data):
-            return self._data[row_index]
+        if 0 <= row_index < len(self._rows):
+            return self._rows.task(row_index)
         return None
 
+    def get_row_fields(self, row_index, first_column, last_column):
+        """Returns the task id of a row and its values for a range of columns, for the task journal."""
+        return (self._rows.task_id(row_index),
+                {key: self._rows.value(row_index, key) for key in self.headers[first_column:last_column + 1]})
+
+
+# --- Background Data Loading ---
+# Parsed courses are sent to the window in batches at most this often
+SYLLABUS_BATCH_SECONDS = 0.03
+
+
+class DataLoader(QObject):
+    """
+    Loads the task list and parses the syllabus off the GUI thread.
+
+    Move it to a QThread and connect the thread's started signal to run(). The
+    results arrive through signals, so the window can be shown before any data
+    has been read.
+    """
+    tasks_loaded = pyqtSignal(list)
+    tasks_failed = pyqtSignal(str)
+    courses_loaded = pyqtSignal(list)  # [(title, Course), ...]; a title may arrive again, updated, or with None
+    syllabus_failed = pyqtSignal(str)
+    finished = pyqtSignal()
+
+    def __init__(self, task_store, syllabus_paths, syllabus_cache_filepath, rebuild_syllabus_cache=False,
+                 parse_workers=None):
+        super().__init__()
+        self.task_store = task_store
+        self.syllabus_paths = syllabus_paths
+        self.syllabus_cache_filepath = syllabus_cache_filepath
+        self.rebuild_syllabus_cache = rebuild_syllabus_cache
+        self.parse_workers = parse_workers
+
+    def run(self):
+        try:
+            self.tasks_loaded.emit(self.task_store.load())
+        except Exception as e:
+            self.tasks_failed.emit(str(e))
+        try:
+            self._load_syllabus()
+        except Exception as e:
+            self.syllabus_failed.emit(str(e))
+        self.finished.emit()
+
+    def _load_syllabus(self):
+        loader = iter_syllabus_cached(SyllabusSource(self.syllabus_paths), self.syllabus_cache_filepath,
+                                      rebuild=self.rebuild_syllabus_cache, max_workers=self.parse_workers)
+        batch = []
+        next_emit = time.perf_counter() + SYLLABUS_BATCH_SECONDS
+        try:
+            for title, course in loader:
+                if QThread.currentThread().isInterruptionRequested():
+                    return
+                # Built from a snapshot of the parser's dict, which later blocks may still extend;
+                # None means a course sent earlier turned out to be empty and must be removed
+                batch.append((title, Course.from_dict(title, course) if course is not None else None))
+                if time.perf_counter() >= next_emit:
+                    self.courses_loaded.emit(batch)
+                    batch = []
+                    next_emit = time.perf_counter() + SYLLABUS_BATCH_SECONDS
+        finally:
+            loader.close()
+        if batch:
+            self.courses_loaded.emit(batch)
+
+
+IMPORT_CHUNK_SIZE = 2000  # Imported tasks are added to the table this many at a time
+IMPORT_ERRORS_SHOWN = 10  # Rejected rows listed after an import
+IMPORT_CHUNKS_QUEUED = 2  # Chunks read ahead of the table; more would queue up and stall the window while added
+
+
+class TaskImporter(QObject):
+    """
+    Reads a task file (see task_import) off the GUI thread, checking each row
+    with the rules of the task form. Valid tasks are sent to the window in
+    chunks, so it can add them while the rest of the file is read. Reading
+    waits while IMPORT_CHUNKS_QUEUED chunks are not yet added, so the window
+    gets to repaint and handle input between chunks; call chunk_added() after
+    adding each one.
+
+    Move it to a QThread and connect the thread's started signal to run().
+    """
+    tasks_read = pyqtSignal(list)  # A chunk of valid tasks, in file order
+    progress = pyqtSignal(int)  # Percent of the file read
+    finished = pyqtSignal(int, int, list)  # Tasks read, rows rejected, the first reasons ("line 3: ...")
+    failed = pyqtSignal(str, int)  # Error, tasks read before it
+
+    def __init__(self, path, subjects, task_types, statuses):
+        super().__init__()
+        self.path = path
+        self.subjects = frozenset(subjects)  # A copy: the window's list grows while the syllabus loads
+        self.task_types = frozenset(task_types)
+        self.statuses = frozenset(statuses)
+        self._free_chunks = QSemaphore(IMPORT_CHUNKS_QUEUED)
+
+    def chunk_added(self):
+        """Called from the GUI thread once a chunk of tasks_read is in the table."""
+        self._free_chunks.release()
+
+    def _send_chunk(self, chunk):
+        """Emits tasks_read once the window has room for the chunk; False if interrupted meanwhile."""
+        while not self._free_chunks.tryAcquire(1, 100):
+            if QThread.currentThread().isInterruptionRequested():
+                return False
+        self.tasks_read.emit(chunk)
+        return True
+
+    def _fail(self, error, chunk, imported):
+        """Sends the tasks read before an error, then failed."""
+        if chunk:
+            if not self._send_chunk(chunk):
+                return
+            imported += len(chunk)
+        self.failed.emit(error, imported)
+
+    def run(self):
+        imported = rejected = 0
+        errors = []
+        chunk = []
+        try:
+            with TaskFileReader(self.path) as reader:
+                for rows_read, (location, fields) in enumerate(reader, 1):
+                    task, error = parse_import_row(fields, self.subjects, self.task_types, self.statuses)
+                    if error:
+                        rejected += 1
+                        if len(errors) < IMPORT_ERRORS_SHOWN:
+                            errors.append(f"{location}: {error}")
+                    else:
+                        chunk.append(task)
+                        if len(chunk) >= IMPORT_CHUNK_SIZE:
+                            if not self._send_chunk(chunk):
+                                return
+                            imported += len(chunk)
+                            chunk = []
+                    if rows_read % IMPORT_CHUNK_SIZE == 0:
+                        if QThread.currentThread().isInterruptionRequested():
+                            return
+                        self.progress.emit(reader.bytes_read() * 100 // max(reader.size, 1))
+        except (OSError, UnicodeDecodeError, ValueError, csv.Error) as e:
+            self._fail(str(e), chunk, imported)
+            return
+        except Exception as e:  # A bug or an unforeseen value; reported so that the window ends the import
+            self._fail(f"{type(e).__name__}: {e}", chunk, imported)
+            return
+        if chunk:
+            if not self._send_chunk(chunk):
+                return
+            imported += len(chunk)
+        self.progress.emit(100)
+        self.finished.emit(imported, rejected, errors)
+
+
+# --- Background Saving ---
+# Changes are written once no further change has arrived for SAVE_DELAY_MS, but
+# no later than SAVE_MAX_DELAY_MS after the first unsaved change
+SAVE_DELAY_MS = 500
+SAVE_MAX_DELAY_MS = 5000
+
+
+class SaveScheduler(QObject):
+    """
+    Debounces and coalesces writes, and performs them on a worker thread.
+
+    Each kind of saved state has a key. schedule() marks it dirty and (re)starts
+    a single-shot timer; when the timer fires, every dirty key is written once,
+    however many changes it received in the meantime. The data to write is taken
+    on the GUI thread by the key's prepare function at that moment, and handed to
+    its write function on a single worker thread, so writes happen in order and
+    never touch GUI state. flush() writes everything still pending and waits for
+    it; the window calls it when it closes.
+
+    Args:
+        delay_ms (int): Quiet period after the last change before writing.
+        max_delay_ms (int): Longest time a change may wait under continuous edits.
+    """
+    save_failed = pyqtSignal(str, str)  # key, error
+
+    def __init__(self, delay_ms=SAVE_DELAY_MS, max_delay_ms=SAVE_MAX_DELAY_MS, parent=None):
+        super().__init__(parent)
+        self.delay_ms = delay_ms
+        self.max_delay_ms = max(max_delay_ms, delay_ms)
+        self._pending = {}  # Key -> (prepare, write), in order of first change
+        self._dirty_since = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.submit_pending)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save")
+
+    def schedule(self, key, prepare, write):
+        """
+        Marks key dirty.
+
+        Args:
+            key (str): What is saved, e.g. "tasks"; shown in error messages.
+            prepare (callable): Called on the GUI thread when the write is started;
+                returns the data to write, which the GUI must not modify afterwards.
+            write (callable): Called on the worker thread with that data.
+        """
+        self._pending[key] = (prepare, write)
+        now = time.monotonic()
+        if self._dirty_since is None:
+            self._dirty_since = now
+        remaining_ms = self.max_delay_ms - (now - self._dirty_since) * 1000
+        self._timer.start(int(max(0, min(self.delay_ms, remaining_ms))))
+
+    def is_pending(self, key):
+        return key in self._pending
+
+    def submit_pending(self):
+        """Starts writing every dirty key on the worker thread without waiting."""
+        self._timer.stop()
+        self._dirty_since = None
+        if not self._pending:
+            return None
+        batch = [(key, write, prepare()) for key, (prepare, write) in self._pending.items()]
+        self._pending.clear()
+        return self._executor.submit(self._write_batch, batch)
+
+    def _write_batch(self, batch):
+        for key, write, data in batch:
+            try:
+                write(data)
+            except Exception as e:  # Reported to the GUI; later keys are still written
+                print(f"Error saving {key}: {e}")
+                self.save_failed.emit(key, str(e))
+
+    def flush(self):
+        """Writes everything pending and waits until all writes have finished."""
+        self.submit_pending()
+        self._executor.submit(lambda: None).result()  # Runs after every earlier write
+
+    def close(self):
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+
+NOTICE_BOARD_TASKS = 3  # Recent tasks shown on the notice board
+DEADLINE_SOON_DAYS = 3  # Deadlines this close are highlighted
+DEADLINE_WINDOW_DAYS = 7  # The deadlines panel lists open tasks due up to this many days ahead
+DEADLINE_PANEL_TASKS = 3  # Tasks listed per group of the deadlines panel
+
+
+def _validate_ongoing_chapters(ongoing_chapters):
+    if not isinstance(ongoing_chapters, dict):
+        raise ValueError("ongoing chapters are not a mapping of subjects to chapters")
+
 
 # --- Main Application Window ---
 class SyllabusTrackerApp(QMainWindow):
-    def __init__(self):
+    def __init__(self, syllabus_paths=None, rebuild_syllabus_cache=False, parse_workers=None, tasks_path=None,
+                 save_delay_ms=SAVE_DELAY_MS, columnar_tasks=False):
         super().__init__()
         self.setWindowTitle("Syllabus & Task Tracker (PyQt5)")
         self.setGeometry(100, 100, 1200, 700)
@@ -915,6 +598,7 @@ class SyllabusTrackerApp(QMainWindow):
         self.central_widget = None
         self.main_layout = None
         self.notice_board_label = None
+        self.deadlines_label = None
         self.tabs = None
         self.footer_label = None
         self.syllabus_tab = None
@@ -942,37 +626,52 @@ class SyllabusTrackerApp(QMainWindow):
         self.update_task_button = None
         self.clear_form_button = None
         self.delete_task_button = None
+        self.import_tasks_button = None
+        self.import_progress_bar = None
         self.task_table_view = None
         self.task_table_model = None
         self.task_headers = ["Subject", "Type", "Description", "Assigned", "Submit By", "Status",
                              "Timestamp"]  # Added Timestamp for sorting
 
-        self.syllabus_data = parse_syllabus(pdf_text)
-        self.subjects = sorted(list(self.syllabus_data.keys()))
-        self.tasks = self._load_tasks()
+        self.task_list_group = None
+        self.loader_thread = None
+        self.data_loader = None
+        self.import_thread = None
+        self.task_importer = None
+
+        self.syllabus_data = {}  # Filled progressively by _on_courses_loaded
+        self.subjects = []  # Kept sorted
+        self.tasks = []  # The initial rows of the task table; loaded tasks go straight into the model
+        self.columnar_tasks = columnar_tasks
+        self.tasks_loaded = False  # Task edits are only possible, and journaled, once tasks have loaded
+        self.task_store = open_task_store(tasks_path or self._get_tasks_filepath())
+        self.applying_task_form = False  # Form edits are journaled as a whole, not per cell
+        self.pending_task_changes = []  # (op, task id, payload) not yet handed to the save scheduler's worker
+        self.save_scheduler = SaveScheduler(save_delay_ms, parent=self)
+        self.save_scheduler.save_failed.connect(self._on_save_failed)
         self.ongoing_chapters = self._load_ongoing_chapters()
 
         self.setup_ui()
-
-        if self.subjects and self.subject_list_widget:  # Ensure widget exists
-            if self.subject_list_widget.count() > 0:  # Check if list has items
-                self.subject_list_widget.setCurrentRow(0)  # Triggers on_subject_selected
-            elif self.subjects:  # If list is empty but subjects exist, display first one
-                self.display_subject_details(self.subjects[0])
-        elif not self.subjects:  # No subjects parsed
-            self.subject_title_label.setText("No subjects found in syllabus data.")
-            self.units_display.setText("Please check the syllabus text format.")
-
+        self._set_tasks_loading(True)
+        self.subject_title_label.setText("Loading syllabus...")
         self.update_notice_board()
+        self._start_data_loading(syllabus_paths or [DEFAULT_SYLLABUS_PATH], rebuild_syllabus_cache, parse_workers)
 
     def setup_ui(self):
         self.central_widget = QWidget()
         self.main_layout = QVBoxLayout(self.central_widget)
         self.setCentralWidget(self.central_widget)
 
+        notice_layout = QHBoxLayout()
         self.notice_board_label = QLabel("Recent Task Updates:")
         self.notice_board_label.setFont(QFont("Arial", 10, QFont.Bold))
-        self.main_layout.addWidget(self.notice_board_label)
+        self.notice_board_label.setAlignment(Qt.AlignTop)
+        self.deadlines_label = QLabel("Upcoming Deadlines:")
+        self.deadlines_label.setFont(QFont("Arial", 10, QFont.Bold))
+        self.deadlines_label.setAlignment(Qt.AlignTop)
+        notice_layout.addWidget(self.notice_board_label, 3)
+        notice_layout.addWidget(self.deadlines_label, 2)
+        self.main_layout.addLayout(notice_layout)
 
         self.tabs = QTabWidget()
         self.main_layout.addWidget(self.tabs)
@@ -1070,7 +769,7 @@ class SyllabusTrackerApp(QMainWindow):
         self.task_subject_combo.addItems(
             ["-- Select Subject --"] + self.subjects if self.subjects else ["-- No Subjects --"])
         self.task_type_combo = QComboBox()
-        self.task_type_combo.addItems(["Assignment", "Lab Report", "Project", "Presentation", "Study Task"])
+        self.task_type_combo.addItems(TASK_TYPES)
         self.task_desc_edit = QLineEdit()
 
         self.task_assigned_date = QDateEdit()
@@ -1082,7 +781,7 @@ class SyllabusTrackerApp(QMainWindow):
         self.task_submit_date.setDate(QDate.currentDate().addDays(7))
 
         self.task_status_combo = QComboBox()
-        self.task_status_combo.addItems(["Pending", "In Progress", "Completed", "Cancelled"])
+        self.task_status_combo.addItems(TASK_STATUSES)
 
         form_layout.addRow("Subject:", self.task_subject_combo)
         form_layout.addRow("Type:", self.task_type_combo)
@@ -1109,9 +808,16 @@ class SyllabusTrackerApp(QMainWindow):
         self.delete_task_button.clicked.connect(self.delete_task)
         form_layout.addRow(self.delete_task_button)
 
-        task_list_group = QGroupBox("Current Tasks List")
-        table_layout = QVBoxLayout(task_list_group)
-        self.task_table_model = TaskTableModel(self.tasks, self.task_headers)
+        self.import_tasks_button = QPushButton("📥 Import Tasks...")
+        self.import_tasks_button.setToolTip("Add tasks from a CSV, JSON or iCalendar (.ics) file")
+        self.import_tasks_button.clicked.connect(lambda: self.import_tasks())
+        form_layout.addRow(self.import_tasks_button)
+
+        self.task_list_group = QGroupBox("Current Tasks List")
+        table_layout = QVBoxLayout(self.task_list_group)
+        self.task_table_model = TaskTableModel(self.tasks, self.task_headers,
+                                               rows_class=ColumnarTaskRows if self.columnar_tasks else TaskRows)
+        self.task_table_model.dataChanged.connect(self.on_task_cell_edited)
         self.task_table_view = QTableView()
         self.task_table_view.setModel(self.task_table_model)
         self.task_table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
@@ -1125,12 +831,21 @@ class SyllabusTrackerApp(QMainWindow):
 
         self.task_table_view.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.task_table_view.setSelectionMode(QAbstractItemView.SingleSelection)
+        # Enabling sorting sorts by the indicator right away; the tasks are already newest first
+        if "Timestamp" in self.task_headers:
+            self.task_table_view.horizontalHeader().setSortIndicator(self.task_headers.index("Timestamp"),
+                                                                     Qt.DescendingOrder)
         self.task_table_view.setSortingEnabled(True)
         self.task_table_view.selectionModel().selectionChanged.connect(self.on_task_selected)
         table_layout.addWidget(self.task_table_view)
 
+        self.import_progress_bar = QProgressBar()
+        self.import_progress_bar.setFormat("Importing tasks... %p%")
+        self.import_progress_bar.setVisible(False)
+        table_layout.addWidget(self.import_progress_bar)
+
         task_layout.addWidget(add_task_group)
-        task_layout.addWidget(task_list_group)
+        task_layout.addWidget(self.task_list_group)
 
     def on_subject_selected(self):
         selected_item = self.subject_list_widget.currentItem()
@@ -1140,22 +855,21 @@ class SyllabusTrackerApp(QMainWindow):
 
     def display_subject_details(self, subject_name):
         if subject_name in self.syllabus_data:
-            data = self.syllabus_data[subject_name]
+            course = self.syllabus_data[subject_name]
             self.subject_title_label.setText(subject_name)
-            details = data.get("Details", {})
-            self.course_no_label.setText(details.get("Course No", "N/A"))
-            self.credit_hrs_label.setText(details.get("Credit Hrs", "N/A"))
-            self.semester_label.setText(details.get("Semester", "N/A"))
-            self.full_marks_label.setText(details.get("Full Marks", "N/A"))
-            self.pass_marks_label.setText(details.get("Pass Marks", "N/A"))
-
-            units_text = "\n\n---\n\n".join(data.get("Units", ["No units found."]))
+            self.course_no_label.setText(course.course_no or "N/A")
+            self.credit_hrs_label.setText(course.credit_hrs or "N/A")
+            self.semester_label.setText(course.semester or "N/A")
+            self.full_marks_label.setText(course.full_marks or "N/A")
+            self.pass_marks_label.setText(course.pass_marks or "N/A")
+
+            units_text = "\n\n---\n\n".join(unit.body for unit in course.units)
             self.units_display.setPlainText(units_text)
-            self.lab_display.setPlainText(data.get("Lab Work", "No lab work details found."))
+            self.lab_display.setPlainText(course.lab_work)
 
             self.ongoing_chapter_combo.blockSignals(True)
             self.ongoing_chapter_combo.clear()
-            unit_titles = self._get_unit_titles_for_subject(data)  # Now static
+            unit_titles = self._get_unit_titles_for_subject(course)  # Now static
             self.ongoing_chapter_combo.addItems(unit_titles)
             current_ongoing = self.ongoing_chapters.get(subject_name, "-- Select Ongoing Chapter --")
             index = self.ongoing_chapter_combo.findText(current_ongoing)
@@ -1174,16 +888,11 @@ class SyllabusTrackerApp(QMainWindow):
             self._update_ongoing_status_labels(None)
 
     @staticmethod
-    def _get_unit_titles_for_subject(subject_data):
+    def _get_unit_titles_for_subject(course):
         titles = ["-- Select Ongoing Chapter --"]
-        units = subject_data.get("Units")
-        if units:
-            unit_titles_list = [
-                unit_content.splitlines()[0].strip() if unit_content.splitlines() else f"Unit {idx + 1}"
-                for idx, unit_content in enumerate(units)
-            ]
-            titles.extend(unit_titles_list)
-        else:  # No units explicitly found under "Units" key
+        if course.unit_titles:  # Extracted once when the course was parsed
+            titles.extend(course.unit_titles)
+        else:  # No units found for the course
             titles.append("(No Units Found)")
         return titles
 
@@ -1201,7 +910,7 @@ class SyllabusTrackerApp(QMainWindow):
             needs_save = True
 
         if needs_save:
-            self._save_ongoing_chapters()
+            self._schedule_ongoing_chapters_save()
         self._update_ongoing_status_labels(subject_name)
 
     def _update_ongoing_status_labels(self, subject_name):
@@ -1247,31 +956,23 @@ class SyllabusTrackerApp(QMainWindow):
             self.clear_task_form()
 
     def _get_task_data_from_form(self):
-        """Retrieves and validates task data from the form."""
-        desc = self.task_desc_edit.text().strip()
-        if not desc:
-            QMessageBox.warning(self, "Input Error", "Task description cannot be empty.")
-            return None
-
+        """Retrieves and validates task data from the form, with the rules imported tasks are checked with."""
         subject = self.task_subject_combo.currentText()
         if subject == "-- Select Subject --" or subject == "-- No Subjects --":
-            QMessageBox.warning(self, "Input Error", "Please select a valid subject for the task.")
-            return None
-
-        assigned = self.task_assigned_date.date().toPyDate()
-        submit = self.task_submit_date.date().toPyDate()
-        if assigned > submit:
-            QMessageBox.warning(self, "Input Error", "Submission date cannot be before assigned date.")
-            return None
-
-        return {
+            subject = ""
+        task_data = {
             "Subject": subject,
             "Type": self.task_type_combo.currentText(),
-            "Description": desc,
-            "Assigned": assigned,
-            "Submit By": submit,
+            "Description": self.task_desc_edit.text().strip(),
+            "Assigned": self.task_assigned_date.date().toPyDate(),
+            "Submit By": self.task_submit_date.date().toPyDate(),
             "Status": self.task_status_combo.currentText(),
         }
+        error = validate_task(task_data, self.syllabus_data, TASK_TYPES, TASK_STATUSES)
+        if error:
+            QMessageBox.warning(self, "Input Error", error)
+            return None
+        return task_data
 
     def add_task(self):
         task_data = self._get_task_data_from_form()
@@ -1280,34 +981,24 @@ class SyllabusTrackerApp(QMainWindow):
 
         task_data["Timestamp"] = datetime.datetime.now()
 
-        row_to_insert_at = 0  # Insert at the top
-        self.task_table_model.insertRows(row_to_insert_at, 1)
-        for col_idx, header in enumerate(self.task_headers):
-            index = self.task_table_model.index(row_to_insert_at, col_idx)
-            value_to_set = task_data.get(header)
-            # setData expects QDate for date fields if editor is QDateEdit
-            if header in ["Assigned", "Submit By"] and isinstance(value_to_set, datetime.date):
-                value_to_set = QDate(value_to_set)
-            self.task_table_model.setData(index, value_to_set, Qt.EditRole)
-
-        # After adding, re-sort if sorting is enabled to maintain order (e.g., by Timestamp)
-        # Or, if always adding to top, ensure model._data is updated correctly and view reflects.
-        # The current insertRows and setData should place it at row 0 in the model's internal list.
+        task_id, = self.task_table_model.add_tasks([task_data], position=0)  # Insert at the top
 
+        self._record_task_change(ADD, task_id, dict(self.task_table_model.get_task(task_id)))
         QMessageBox.information(self, "Success", "Task added successfully.")
         self.clear_task_form()
         self.update_notice_board()
-        self._save_tasks()
 
-    def update_task(self):
+    def _selected_task_id(self):
+        """The id of the task selected in the table, or None."""
         selected_indexes = self.task_table_view.selectionModel().selectedRows()
         if not selected_indexes:
-            QMessageBox.warning(self, "Selection Error", "Please select a task to update.")
-            return
+            return None
+        return self.task_table_model.get_row_task_id(selected_indexes[0].row())
 
-        model_row_index = selected_indexes[0].row()
-        if not (0 <= model_row_index < self.task_table_model.rowCount()):
-            QMessageBox.critical(self, "Error", "Selected row index is invalid.")
+    def update_task(self):
+        task_id = self._selected_task_id()
+        if task_id is None:
+            QMessageBox.warning(self, "Selection Error", "Please select a task to update.")
             return
 
         task_data_from_form = self._get_task_data_from_form()
@@ -1315,24 +1006,20 @@ class SyllabusTrackerApp(QMainWindow):
             return
 
         # Get original timestamp if it exists, otherwise set new one
-        original_task = self.task_table_model.get_row_data(model_row_index)
+        original_task = self.task_table_model.get_task(task_id)
         task_data_from_form["Timestamp"] = original_task.get("Timestamp", datetime.datetime.now())
 
-        for col_idx, header in enumerate(self.task_headers):
-            if header in task_data_from_form:  # Only update headers present in form data + timestamp
-                index = self.task_table_model.index(model_row_index, col_idx)
-                value_to_set = task_data_from_form[header]
-                if header in ["Assigned", "Submit By"] and isinstance(value_to_set, datetime.date):
-                    value_to_set = QDate(value_to_set)  # Convert to QDate for model
-                self.task_table_model.setData(index, value_to_set, Qt.EditRole)
+        self.applying_task_form = True
+        self.task_table_model.update_task_fields(task_id, task_data_from_form)
+        self.applying_task_form = False
 
+        self._record_task_change(UPDATE, task_id, task_data_from_form)
         QMessageBox.information(self, "Success", "Task updated successfully.")
         self.update_notice_board()
-        self._save_tasks()
 
     def delete_task(self):
-        selected_indexes = self.task_table_view.selectionModel().selectedRows()
-        if not selected_indexes:
+        task_id = self._selected_task_id()
+        if task_id is None:
             QMessageBox.warning(self, "Selection Error", "Please select a task to delete.")
             return
 
@@ -1340,15 +1027,13 @@ class SyllabusTrackerApp(QMainWindow):
                                      "Are you sure you want to delete the selected task?",
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
-            model_row_index = selected_indexes[0].row()
-            if 0 <= model_row_index < self.task_table_model.rowCount():
-                self.task_table_model.removeRows(model_row_index, 1)
+            if self.task_table_model.remove_task(task_id):  # By id: the rows may have changed meanwhile
+                self._record_task_change(DELETE, task_id, None)
                 QMessageBox.information(self, "Success", "Task deleted successfully.")
                 self.clear_task_form()
                 self.update_notice_board()
-                self._save_tasks()
             else:
-                QMessageBox.critical(self, "Error", "Selected row index became invalid.")
+                QMessageBox.critical(self, "Error", "The selected task no longer exists.")
 
     def clear_task_form(self):
         self.task_subject_combo.setCurrentIndex(0)
@@ -1360,51 +1045,77 @@ class SyllabusTrackerApp(QMainWindow):
         self.task_table_view.clearSelection()
 
     def update_notice_board(self):
-        # Sort tasks by Timestamp (datetime object) descending for "Recent"
-        # Ensure Timestamp is part of the task data and is a datetime object for proper sorting
-        all_tasks = self.task_table_model.get_data()
-
-        # Filter out tasks that might have a None timestamp or invalid one before sorting
-        valid_tasks_for_sorting = [task for task in all_tasks if isinstance(task.get('Timestamp'), datetime.datetime)]
-        invalid_tasks = [task for task in all_tasks if not isinstance(task.get('Timestamp'), datetime.datetime)]
-
-        # Sort valid tasks
-        current_tasks_sorted = sorted(
-            valid_tasks_for_sorting,
-            key=lambda x: x['Timestamp'],
-            reverse=True
-        )
-        # Add tasks with invalid/missing timestamps at the end or handle as per logic
-        current_tasks_sorted.extend(invalid_tasks)
+        # Most recent tasks by Timestamp, from the model's recency index rather than sorting all tasks
+        recent_tasks = self.task_table_model.recent_tasks(NOTICE_BOARD_TASKS)
+        today = datetime.date.today()
 
         notice_text = "<b>Recent Task Updates:</b><br>"
-        if not current_tasks_sorted:
+        if not self.tasks_loaded:
+            notice_text += "(Loading tasks...)"
+        elif not recent_tasks:
             notice_text += "(No tasks added yet)"
         else:
-            for i, task in enumerate(current_tasks_sorted[:3]):  # Show top 3
-                due_date = task.get('Submit By')
-                urgency_color = "green"
-                urgency_text = ""
-                if isinstance(due_date, datetime.date):
-                    due_date_str = due_date.strftime('%Y-%m-%d')
-                    days_left = (due_date - datetime.date.today()).days
-                    if days_left < 0:
-                        urgency_text = f"Past Due by {-days_left} day(s)"
-                        urgency_color = "red"
-                    elif days_left == 0:
-                        urgency_text = "Due Today!"
-                        urgency_color = "orange"
-                    elif days_left <= 3:
-                        urgency_text = f"Due in {days_left} day(s)"
-                        urgency_color = "darkorange"
-                    else:
-                        urgency_text = f"Due in {days_left} days"
-                else:
-                    due_date_str = str(due_date if due_date is not None else 'N/A')
-
-                notice_text += f"- {task.get('Type', 'Task')} ({task.get('Subject', 'N/A')}): {task.get('Description', 'No desc.')} " \
-                               f"[Due: {due_date_str} <font color='{urgency_color}'>{urgency_text}</font>]<br>"
+            for task in recent_tasks:
+                notice_text += self._format_notice_task(task, today)
         self.notice_board_label.setText(notice_text.strip())
+        self.update_deadlines_panel(today)
+
+    @staticmethod
+    def _deadline_urgency(due_date, today):
+        """The urgency text and color of a due date."""
+        days_left = due_date.toordinal() - today.toordinal()  # Also for a datetime in Submit By
+        if days_left < 0:
+            return f"Past Due by {-days_left} day(s)", "red"
+        elif days_left == 0:
+            return "Due Today!", "orange"
+        elif days_left <= DEADLINE_SOON_DAYS:
+            return f"Due in {days_left} day(s)", "darkorange"
+        return f"Due in {days_left} days", "green"
+
+    def _format_notice_task(self, task, today):
+        due_date = task.get('Submit By')
+        if isinstance(due_date, datetime.date):
+            due_date_str = due_date.strftime('%Y-%m-%d')
+            urgency_text, urgency_color = self._deadline_urgency(due_date, today)
+        else:
+            due_date_str = str(due_date if due_date is not None else 'N/A')
+            urgency_text, urgency_color = "", "green"
+        return f"- {task.get('Type', 'Task')} ({task.get('Subject', 'N/A')}): {task.get('Description', 'No desc.')} " \
+               f"[Due: {due_date_str} <font color='{urgency_color}'>{urgency_text}</font>]<br>"
+
+    def update_deadlines_panel(self, today=None):
+        """Lists open tasks that are overdue, due today and due soon, from the model's deadline index."""
+        today = today or datetime.date.today()
+        deadlines = self.task_table_model.deadlines
+        yesterday = today - datetime.timedelta(days=1)
+        tomorrow = today + datetime.timedelta(days=1)
+        window_end = today + datetime.timedelta(days=DEADLINE_WINDOW_DAYS)
+        groups = [
+            ("Overdue", None, yesterday),
+            ("Due today", today, today),
+            (f"Due in the next {DEADLINE_WINDOW_DAYS} days", tomorrow, window_end),
+        ]
+
+        panel_text = "<b>Upcoming Deadlines:</b><br>"
+        if not self.tasks_loaded:
+            panel_text += "(Loading tasks...)"
+        elif not deadlines.count_due_between(None, window_end):
+            panel_text += f"(Nothing due in the next {DEADLINE_WINDOW_DAYS} days)"
+        else:
+            for title, first, last in groups:
+                count = deadlines.count_due_between(first, last)
+                if not count:
+                    continue
+                panel_text += f"<i>{title} ({count}):</i><br>"
+                for task_id in deadlines.due_between(first, last, limit=DEADLINE_PANEL_TASKS):
+                    task = self.task_table_model.get_task(task_id)
+                    due_date = task['Submit By']
+                    urgency_text, urgency_color = self._deadline_urgency(due_date, today)
+                    panel_text += f"- {task.get('Description', 'No desc.')} ({task.get('Subject', 'N/A')}) " \
+                                  f"<font color='{urgency_color}'>{urgency_text}</font><br>"
+                if count > DEADLINE_PANEL_TASKS:
+                    panel_text += f"&nbsp;&nbsp;... and {count - DEADLINE_PANEL_TASKS} more<br>"
+        self.deadlines_label.setText(panel_text.strip())
 
     @staticmethod
     def _get_tasks_filepath():
@@ -1414,55 +1125,139 @@ class SyllabusTrackerApp(QMainWindow):
     def _get_ongoing_chapters_filepath():
         return "ongoing_chapters.json"
 
-    def _load_tasks(self):
-        filepath = self._get_tasks_filepath()
-        try:
-            with open(filepath, 'r') as f:
-                tasks_data = json.load(f)
-                for task in tasks_data:
-                    for key in ["Assigned", "Submit By"]:
-                        if key in task and isinstance(task[key], str):
-                            try:
-                                task[key] = datetime.datetime.strptime(task[key], "%Y-%m-%d").date()
-                            except ValueError:
-                                task[key] = None
-                    if 'Timestamp' in task and isinstance(task['Timestamp'], str):
-                        try:
-                            task['Timestamp'] = datetime.datetime.fromisoformat(
-                                task['Timestamp'].replace('Z', '+00:00'))
-                        except ValueError:
-                            task['Timestamp'] = datetime.datetime.min  # Default for sorting if invalid
-                # Sort by timestamp after loading and conversion
-                tasks_data.sort(key=lambda x: x.get('Timestamp', datetime.datetime.min), reverse=True)
-                return tasks_data
-        except FileNotFoundError:
-            return []
-        except (json.JSONDecodeError, Exception) as e:
-            print(f"Error loading tasks: {e}")
-            QMessageBox.warning(self, "Load Error",
-                                f"Could not load tasks from {filepath}.\nError: {e}\nStarting with an empty list.")
-            return []
+    @staticmethod
+    def _get_syllabus_cache_filepath():
+        return "syllabus_cache.json"
+
+    def _start_data_loading(self, syllabus_paths, rebuild_cache, parse_workers):
+        """Loads tasks and parses the syllabus on a worker thread; the window stays responsive meanwhile."""
+        self.data_loader = DataLoader(self.task_store, syllabus_paths, self._get_syllabus_cache_filepath(),
+                                      rebuild_cache, parse_workers)
+        self.loader_thread = QThread(self)
+        self.data_loader.moveToThread(self.loader_thread)
+        self.data_loader.tasks_loaded.connect(self._on_tasks_loaded)
+        self.data_loader.tasks_failed.connect(self._on_tasks_load_error)
+        self.data_loader.courses_loaded.connect(self._on_courses_loaded)
+        self.data_loader.syllabus_failed.connect(self._on_syllabus_load_error)
+        self.data_loader.finished.connect(self._on_syllabus_loaded)
+        self.data_loader.finished.connect(self.loader_thread.quit)
+        self.loader_thread.started.connect(self.data_loader.run)
+        self.loader_thread.finished.connect(self.data_loader.deleteLater)
+        self.loader_thread.start()
+
+    def _stop_data_loading(self):
+        if self.loader_thread is not None:
+            self.loader_thread.requestInterruption()
+            self.loader_thread.quit()
+            self.loader_thread.wait()
+            self.loader_thread = None
+            self.data_loader = None
+
+    def _set_tasks_loading(self, loading):
+        self.task_list_group.setTitle("Current Tasks List (loading...)" if loading else "Current Tasks List")
+        for button in [self.add_task_button, self.update_task_button, self.delete_task_button,
+                       self.import_tasks_button]:
+            button.setEnabled(not loading)
+
+    def _on_tasks_loaded(self, tasks):
+        self.tasks_loaded = True
+        self.task_table_model.set_data(tasks)
+        self._set_tasks_loading(False)
+        self.update_notice_board()
 
-    def _save_tasks(self):
-        filepath = self._get_tasks_filepath()
-        try:
-            tasks_to_save = self.task_table_model.get_data()
-            with open(filepath, 'w') as f:
-                def json_serializer(obj):
-                    if isinstance(obj, (datetime.date, datetime.datetime)):
-                        return obj.isoformat()
-                    raise TypeError(f"Type {type(obj)} not serializable for JSON: {obj}")
-
-                json.dump(tasks_to_save, f, indent=4, default=json_serializer)
-        except Exception as e:
-            print(f"Error saving tasks: {e}")
-            QMessageBox.critical(self, "Save Error", f"Could not save tasks to {filepath}.\nError: {e}")
+    def _on_tasks_load_error(self, error):
+        filepath = self.task_store.path
+        print(f"Error loading tasks: {error}")
+        QMessageBox.warning(self, "Load Error",
+                            f"Could not load tasks from {filepath}.\nError: {error}\nStarting with an empty list.")
+        self._on_tasks_loaded([])
+
+    def _on_courses_loaded(self, courses):
+        for title, course in courses:
+            if course is None:
+                self._remove_subject(title)
+            else:
+                self._add_subject(title, course)
+
+    def _add_subject(self, title, course):
+        """Adds a parsed course to the subject list and task form, or refreshes it if already shown."""
+        known = title in self.syllabus_data
+        self.syllabus_data[title] = course
+        if not known:
+            index = bisect.bisect(self.subjects, title)
+            self.subjects.insert(index, title)
+            self.subject_list_widget.insertItem(index, title)
+            if len(self.subjects) == 1:
+                self.task_subject_combo.setItemText(0, "-- Select Subject --")
+            self.task_subject_combo.insertItem(index + 1, title)
+        current_item = self.subject_list_widget.currentItem()
+        if current_item and current_item.text() == title:
+            self.display_subject_details(title)
+
+    def _remove_subject(self, title):
+        """Removes a course shown earlier that the rest of the syllabus left without content."""
+        if self.syllabus_data.pop(title, None) is None:
+            return
+        index = bisect.bisect_left(self.subjects, title)
+        del self.subjects[index]
+        self.subject_list_widget.takeItem(index)
+        self.task_subject_combo.removeItem(index + 1)
+        if not self.subjects:
+            self.task_subject_combo.setItemText(0, "-- No Subjects --")
+
+    def _on_syllabus_loaded(self):
+        if self.subjects:
+            if not self.subject_list_widget.currentItem():
+                self.subject_list_widget.setCurrentRow(0)  # Triggers on_subject_selected
+        else:  # No subjects parsed
+            self.subject_title_label.setText("No subjects found in syllabus data.")
+            self.units_display.setText("Please check the syllabus text format.")
+
+    def _on_syllabus_load_error(self, error):
+        print(f"Error loading syllabus: {error}")
+        QMessageBox.warning(self, "Load Error", f"Could not load the syllabus.\nError: {error}")
+
+    def on_task_cell_edited(self, top_left, bottom_right, _roles=None):
+        """Journals edits made directly in the task table and refreshes the notice board."""
+        if self.applying_task_form or not self.tasks_loaded:
+            return
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            task_id, fields = self.task_table_model.get_row_fields(row, top_left.column(), bottom_right.column())
+            self._record_task_change(UPDATE, task_id, fields)
+        self.update_notice_board()  # Cheap: both panels read only the tasks they show
+
+    def _record_task_change(self, op, task_id, payload):
+        """Queues one change for the task store; the save scheduler writes queued changes as a batch."""
+        self._record_task_changes([(op, task_id, payload)])
+
+    def _record_task_changes(self, changes):
+        """Queues (op, task id, payload) changes for the task store."""
+        self.pending_task_changes.extend(changes)
+        self.save_scheduler.schedule("tasks", self._take_task_changes, self.task_store.apply_changes)
+        if self.task_store.needs_compaction() and not self.save_scheduler.is_pending("task snapshot"):
+            # Scheduled after "tasks", so the snapshot is written after the changes it contains
+            self.save_scheduler.schedule("task snapshot", self._copy_tasks, self.task_store.compact)
+
+    def _take_task_changes(self):
+        changes, self.pending_task_changes = self.pending_task_changes, []
+        return changes
+
+    def _copy_tasks(self):
+        return [dict(task) for task in self.task_table_model.get_data()]  # Values are immutable
+
+    def _on_save_failed(self, key, error):
+        if key == "ongoing chapters":
+            QMessageBox.critical(self, "Save Error", f"Could not save ongoing chapters: {error}")
+        else:
+            QMessageBox.critical(self, "Save Error", f"Could not save tasks to {self.task_store.path}.\nError: {error}")
 
     def _load_ongoing_chapters(self):
         filepath = self._get_ongoing_chapters_filepath()
         try:
-            with open(filepath, 'r') as f:
-                return json.load(f)
+            ongoing_chapters, read_path = load_json_with_backups(filepath, validate=_validate_ongoing_chapters)
+            if read_path != filepath:
+                print(f"Ongoing chapters restored from backup {read_path}")
+            return ongoing_chapters
         except FileNotFoundError:
             return {}
         except (json.JSONDecodeError, Exception) as e:
@@ -1470,24 +1265,138 @@ class SyllabusTrackerApp(QMainWindow):
             QMessageBox.warning(self, "Load Error", f"Could not load ongoing chapters: {e}")
             return {}
 
-    def _save_ongoing_chapters(self):
-        filepath = self._get_ongoing_chapters_filepath()
-        try:
-            with open(filepath, 'w') as f:
-                json.dump(self.ongoing_chapters, f, indent=4)
-        except Exception as e:
-            print(f"Error saving ongoing chapters: {e}")
-            QMessageBox.critical(self, "Save Error", f"Could not save ongoing chapters: {e}")
+    def _schedule_ongoing_chapters_save(self):
+        self.save_scheduler.schedule("ongoing chapters", lambda: dict(self.ongoing_chapters),
+                                     self._write_ongoing_chapters)
+
+    def _write_ongoing_chapters(self, ongoing_chapters):
+        """Runs on the save scheduler's worker thread."""
+        atomic_write_json(self._get_ongoing_chapters_filepath(), ongoing_chapters, indent=4)
+
+    def import_tasks(self, path=None):
+        """Adds the valid tasks of a CSV, JSON or iCalendar file, read on a worker thread."""
+        if self.import_thread is not None or not self.tasks_loaded:
+            return
+        if not path:
+            path, _ = QFileDialog.getOpenFileName(self, "Import Tasks", "",
+                                                  "Task files (*.csv *.json *.jsonl *.ics);;All files (*)")
+            if not path:
+                return
+        if not self.subjects:
+            QMessageBox.warning(self, "Import Error", "Tasks can only be imported once the syllabus has subjects.")
+            return
+
+        self.task_importer = TaskImporter(path, self.subjects, TASK_TYPES, TASK_STATUSES)
+        self.import_thread = QThread(self)
+        self.task_importer.moveToThread(self.import_thread)
+        self.task_importer.tasks_read.connect(self._on_import_tasks_read)
+        self.task_importer.progress.connect(self.import_progress_bar.setValue)
+        self.task_importer.finished.connect(self._on_import_finished)
+        self.task_importer.failed.connect(self._on_import_failed)
+        self.task_importer.finished.connect(self.import_thread.quit)
+        self.task_importer.failed.connect(self.import_thread.quit)
+        self.import_thread.started.connect(self.task_importer.run)
+        self.import_thread.finished.connect(self.task_importer.deleteLater)
+        self.import_tasks_button.setEnabled(False)
+        self.import_progress_bar.setValue(0)
+        self.import_progress_bar.setVisible(True)
+        self.import_thread.start()
+
+    def _on_import_tasks_read(self, tasks):
+        if self.task_importer is None:
+            return  # Sent before the import was stopped
+        # Reversed so that the table, newest first, ends up listing the file bottom-up like tasks added one by one
+        model = self.task_table_model
+        task_ids = model.add_tasks(tasks[::-1], position=0)
+        self._record_task_changes([(ADD, task_id, dict(model.get_row_data(row)))
+                                   for row, task_id in enumerate(task_ids)])
+        self.task_importer.chunk_added()
+
+    def _end_task_import(self):
+        self._stop_task_import()
+        self.import_progress_bar.setVisible(False)
+        self.import_tasks_button.setEnabled(True)
+        self.update_notice_board()
+
+    def _on_import_finished(self, imported, rejected, errors):
+        self._end_task_import()
+        message = f"Imported {imported} task(s)."
+        if rejected:
+            message += f"\n{rejected} row(s) were skipped:\n" + "\n".join(errors)
+            if rejected > len(errors):
+                message += "\n..."
+        QMessageBox.information(self, "Import Finished", message)
+
+    def _on_import_failed(self, error, imported):
+        self._end_task_import()
+        QMessageBox.critical(self, "Import Error",
+                             f"Could not import tasks: {error}\n{imported} task(s) read before the error were added.")
+
+    def _stop_task_import(self):
+        if self.import_thread is not None:
+            self.import_thread.requestInterruption()
+            self.import_thread.quit()
+            self.import_thread.wait()
+            self.import_thread = None
+            self.task_importer = None
 
     def closeEvent(self, event):
-        self._save_tasks()
-        self._save_ongoing_chapters()
+        self._stop_data_loading()
+        self._stop_task_import()
+        self.save_scheduler.close()  # Writes every change not saved yet
+        self.task_store.close()
         super().closeEvent(event)
 
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="Syllabus & Task Tracker")
+    parser.add_argument("--syllabus", nargs="+", metavar="PATH",
+                        help=f"syllabus .txt files or directories of them (default: {DEFAULT_SYLLABUS_PATH})")
+    parser.add_argument("--rebuild-syllabus-cache", action="store_true",
+                        help="ignore the cached parse of the syllabus and parse it again")
+    parser.add_argument("--parse-workers", type=int, metavar="N",
+                        help="parse changed syllabus courses in N worker processes")
+    parser.add_argument("--tasks", metavar="PATH",
+                        help="task store: a JSON file, a binary snapshot ending in .tasksnap, or a SQLite database "
+                             "ending in .db, .sqlite or .sqlite3 "
+                             f"(default: {SyllabusTrackerApp._get_tasks_filepath()})")
+    parser.add_argument("--save-delay", type=int, default=SAVE_DELAY_MS, metavar="MS",
+                        help=f"write changes once no further change arrives for MS milliseconds "
+                             f"(default: {SAVE_DELAY_MS})")
+    parser.add_argument("--columnar-tasks", action="store_true",
+                        help="keep tasks in memory as typed columns instead of dictionaries, for large task lists")
+    parser.add_argument("--migrate-tasks-from", metavar="PATH",
+                        help="copy all tasks from this store into the --tasks store, then exit")
+    parser.add_argument("--export-tasks-json", metavar="PATH",
+                        help="write all tasks of the --tasks store to a JSON file, then exit")
+    args, qt_args = parser.parse_known_args()
+
+    if args.migrate_tasks_from:
+        target_path = args.tasks or SyllabusTrackerApp._get_tasks_filepath()
+        try:
+            source_store, target_store = open_task_store(args.migrate_tasks_from), open_task_store(target_path)
+            count = migrate_tasks(source_store, target_store)
+            source_store.close()
+            target_store.close()
+        except (OSError, ValueError, sqlite3.Error) as e:
+            sys.exit(f"Task migration failed: {e}")
+        print(f"Migrated {count} tasks from {args.migrate_tasks_from} to {target_path}")
+        sys.exit(0)
+    if args.export_tasks_json:
+        source_path = args.tasks or SyllabusTrackerApp._get_tasks_filepath()
+        try:
+            source_store = open_task_store(source_path)
+            count = export_tasks_json(source_store, args.export_tasks_json)
+            source_store.close()
+        except (OSError, TypeError, ValueError, sqlite3.Error) as e:
+            sys.exit(f"Task export failed: {e}")
+        print(f"Exported {count} tasks from {source_path} to {args.export_tasks_json}")
+        sys.exit(0)
+
+    app = QApplication(sys.argv[:1] + qt_args)
     app.setStyle("Fusion")  # Optional: Apply a style
-    main_window = SyllabusTrackerApp()
+    main_window = SyllabusTrackerApp(syllabus_paths=args.syllabus, rebuild_syllabus_cache=args.rebuild_syllabus_cache,
+                                     parse_workers=args.parse_workers, tasks_path=args.tasks,
+                                     save_delay_ms=args.save_delay, columnar_tasks=args.columnar_tasks)
     main_window.show()
     sys.exit(app.exec_())
\ No newline at end of file
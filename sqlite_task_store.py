@@ -0,0 +1,232 @@
+import datetime
+import json
+import sqlite3
+import threading
+
+from task_index import timestamp_key
+from task_store import (ADD, DELETE, TASK_ID_KEY, UPDATE, TaskStore, coalesce_changes, decode_task, json_default,
+                        parse_timestamp)
+
+
+# --- SQLite Task Store ---
+#
+# One row per task, with a column per task field and an index on each field the
+# application filters or sorts by (subject, status, submit-by date, timestamp;
+# the subject and status indexes also cover the timestamp order), so loading in
+# newest-first order and filtered queries are answered from the indexes rather
+# than by scanning and sorting in Python. Dates and timestamps
+# are stored as ISO 8601 text. Timestamps with different UTC offsets do not sort
+# chronologically as text, so the newest-first order uses the "timestamp_key"
+# column instead: the timestamp as naive UTC (see task_index.timestamp_key) in
+# a fixed-width ISO 8601 form, and NULL when it is missing. Fields outside the
+# fixed columns are kept as JSON in the "extra" column. Every change is its own
+# committed transaction, and a batch of changes (apply_changes) is one
+# transaction; the database runs in WAL mode so that readers of a
+# shared database are not blocked by a writer.
+
+# Task field -> column
+FIELD_COLUMNS = (
+    ("Subject", "subject"),
+    ("Type", "type"),
+    ("Description", "description"),
+    ("Assigned", "assigned"),
+    ("Submit By", "submit_by"),
+    ("Status", "status"),
+    ("Timestamp", "timestamp"),
+)
+COLUMN_BY_FIELD = dict(FIELD_COLUMNS)
+COLUMNS = ("id",) + tuple(column for _, column in FIELD_COLUMNS) + ("extra",)
+STORED_COLUMNS = COLUMNS + ("timestamp_key",)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    subject TEXT,
+    type TEXT,
+    description TEXT,
+    assigned TEXT,
+    submit_by TEXT,
+    status TEXT,
+    timestamp TEXT,
+    extra TEXT,
+    timestamp_key TEXT
+);
+"""
+INDEXES = """
+CREATE INDEX IF NOT EXISTS tasks_subject_newest ON tasks (subject, timestamp_key);
+CREATE INDEX IF NOT EXISTS tasks_status_newest ON tasks (status, timestamp_key);
+CREATE INDEX IF NOT EXISTS tasks_submit_by ON tasks (submit_by);
+CREATE INDEX IF NOT EXISTS tasks_newest ON tasks (timestamp_key);
+"""
+# Indexes on the raw timestamp text, created by databases written before the timestamp_key column
+OLD_INDEXES = ("tasks_subject", "tasks_status", "tasks_timestamp")
+
+# Newest first; SQLite sorts NULL below any value, so tasks without a timestamp come last
+NEWEST_FIRST = "ORDER BY timestamp_key DESC"
+
+
+def _to_column(value):
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return value
+
+
+def _sort_key_column(timestamp):
+    key = timestamp_key(timestamp)
+    return key.isoformat(timespec="microseconds") if key is not None else None
+
+
+def _task_to_row(task):
+    """The task as values for STORED_COLUMNS."""
+    extra = {key: value for key, value in task.items() if key not in COLUMN_BY_FIELD and key != TASK_ID_KEY}
+    return ((task[TASK_ID_KEY],) + tuple(_to_column(task.get(field)) for field, _ in FIELD_COLUMNS) +
+            (json.dumps(extra, default=json_default) if extra else None, _sort_key_column(task.get("Timestamp"))))
+
+
+def _row_to_task(row):
+    task = {field: row[index + 1] for index, (field, _) in enumerate(FIELD_COLUMNS)}
+    if row[-1]:
+        task.update(json.loads(row[-1]))
+    task[TASK_ID_KEY] = row[0]
+    return decode_task(task)
+
+
+class SqliteTaskStore(TaskStore):
+    """
+    Task storage in a SQLite database.
+
+    The connection may be used from more than one thread (the window loads tasks
+    on a worker thread); calls are serialized by a lock.
+
+    Args:
+        path (str): The database file; it is created with the tasks table if missing.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(SCHEMA)
+            self._add_timestamp_key_column()
+            self._connection.executescript(INDEXES)
+
+    def _add_timestamp_key_column(self):
+        """Adds and fills the timestamp_key column in a database written before it existed."""
+        columns = [row[1] for row in self._connection.execute("PRAGMA table_info(tasks)")]
+        if "timestamp_key" in columns:
+            return
+        with self._connection:  # One transaction
+            self._connection.execute("BEGIN")
+            self._connection.execute("ALTER TABLE tasks ADD COLUMN timestamp_key TEXT")
+            rows = self._connection.execute("SELECT id, timestamp FROM tasks WHERE timestamp IS NOT NULL").fetchall()
+            self._connection.executemany(
+                "UPDATE tasks SET timestamp_key = ? WHERE id = ?",
+                [(_sort_key_column(parse_timestamp(timestamp)), task_id) for task_id, timestamp in rows])
+            for index in OLD_INDEXES:
+                self._connection.execute(f"DROP INDEX IF EXISTS {index}")
+
+    def _select(self, where="", params=(), limit=None):
+        sql = f"SELECT {', '.join(COLUMNS)} FROM tasks {where} {NEWEST_FIRST}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = tuple(params) + (limit,)
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+        return [_row_to_task(row) for row in rows]
+
+    def load(self):
+        return self._select()
+
+    def find_tasks(self, subject=None, status=None, due_before=None, due_after=None, limit=None):
+        conditions = []
+        params = []
+        if subject is not None:
+            conditions.append("subject = ?")
+            params.append(subject)
+        if status is not None:
+            conditions.append("status = ?")
+            params.append(status)
+        if due_before is not None:
+            # Bounded by the next day, as a value stored with a time ("2026-10-18T09:00:00") sorts after its date
+            conditions.append("submit_by < ?")
+            params.append((due_before + datetime.timedelta(days=1)).isoformat())
+        if due_after is not None:
+            conditions.append("submit_by >= ?")
+            params.append(due_after.isoformat())
+        where = "WHERE " + " AND ".join(conditions) if conditions else ""
+        return self._select(where, params, limit)
+
+    def _insert(self, task):
+        self._connection.execute(
+            f"INSERT OR REPLACE INTO tasks ({', '.join(STORED_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(STORED_COLUMNS))})",
+            _task_to_row(task))
+
+    def _update(self, task_id, fields):
+        assignments = []
+        params = []
+        extra_fields = {}
+        for field, value in fields.items():
+            if field in COLUMN_BY_FIELD:
+                assignments.append(f"{COLUMN_BY_FIELD[field]} = ?")
+                params.append(_to_column(value))
+                if field == "Timestamp":
+                    assignments.append("timestamp_key = ?")
+                    params.append(_sort_key_column(value))
+            elif field != TASK_ID_KEY:
+                extra_fields[field] = value
+        if extra_fields:
+            row = self._connection.execute("SELECT extra FROM tasks WHERE id = ?", (task_id,)).fetchone()
+            extra = json.loads(row[0]) if row and row[0] else {}
+            extra.update(extra_fields)
+            assignments.append("extra = ?")
+            params.append(json.dumps(extra, default=json_default))
+        if assignments:
+            self._connection.execute(f"UPDATE tasks SET {', '.join(assignments)} WHERE id = ?", params + [task_id])
+
+    def _delete(self, task_id):
+        self._connection.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+
+    def record_add(self, task):
+        with self._lock:
+            self._insert(task)
+
+    def record_update(self, task_id, fields):
+        with self._lock:
+            self._update(task_id, fields)
+
+    def record_delete(self, task_id):
+        with self._lock:
+            self._delete(task_id)
+
+    def apply_changes(self, changes):
+        changes = coalesce_changes(changes)
+        if not changes:
+            return
+        with self._lock:
+            with self._connection:  # One transaction
+                self._connection.execute("BEGIN")
+                for op, task_id, payload in changes:
+                    if op == ADD:
+                        self._insert(payload)
+                    elif op == UPDATE:
+                        self._update(task_id, payload)
+                    elif op == DELETE:
+                        self._delete(task_id)
+
+    def replace_all(self, tasks):
+        rows = [_task_to_row(task) for task in tasks]
+        with self._lock:
+            with self._connection:  # One transaction
+                self._connection.execute("BEGIN")
+                self._connection.execute("DELETE FROM tasks")
+                self._connection.executemany(
+                    f"INSERT OR REPLACE INTO tasks ({', '.join(STORED_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(STORED_COLUMNS))})",
+                    rows)
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
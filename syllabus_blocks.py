@@ -0,0 +1,268 @@
+import hashlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from line_classifier import COURSE_TITLE_RE, DETAIL_KEYWORDS_RE, default_classifier
+from syllabus_parser import (DETAILS_WINDOW, TITLE_LOOKAHEAD, SyllabusStateMachine, clean_syllabus_data,
+                             has_course_content, tokenize)
+
+
+# --- Per-Course Blocks ---
+#
+# The syllabus is split into blocks at "Course Title:" lines so that each block
+# can be parsed on its own and the results merged. A split is only made where
+# it cannot change the result of parsing the whole document:
+#   * the title line is a confirmed "Course Title: <Name>" line (a detail keyword
+#     follows within TITLE_LOOKAHEAD lines), which always starts a new subject;
+#   * no detail keyword appears in the DETAILS_WINDOW - 1 lines before it, so no
+#     earlier title's lookahead or details window reaches into the new block;
+#   * none of the TITLE_LOOKAHEAD lines before it could become a title, so no
+#     earlier line needs the new block's lines to be classified.
+# Blocks are fingerprinted by content; a block whose fingerprint is already known
+# reuses its previous result instead of being parsed again.
+
+_LOOKBEHIND = DETAILS_WINDOW - 1
+
+
+def _is_block_boundary(block, index, first_block):
+    """Checks whether block[index] can start a new block; block holds the lines read so far."""
+    match = COURSE_TITLE_RE.match(block[index])
+    if not match or not match.group(1).strip():
+        return False
+    if not any(DETAIL_KEYWORDS_RE.search(line) for line in block[index:index + TITLE_LOOKAHEAD + 1]):
+        return False
+    if index < _LOOKBEHIND and not first_block:
+        return False  # The previous boundary is too close
+    if any(DETAIL_KEYWORDS_RE.search(line) for line in block[max(0, index - _LOOKBEHIND):index]):
+        return False
+    for line in block[max(0, index - TITLE_LOOKAHEAD):index]:
+        info = default_classifier.classify(line)
+        if info.course_title is not None or info.general_title:
+            return False
+    return True
+
+
+def split_course_blocks(lines):
+    """
+    Splits syllabus lines into independently parseable blocks.
+
+    Args:
+        lines (iterable): Lines of syllabus text, with or without trailing newlines.
+
+    Yields:
+        list: The lines of each block, in document order. Only one block is held at a time.
+    """
+    block = []
+    first_block = True
+    title_match = COURSE_TITLE_RE.match
+    for raw in lines:
+        block.append(raw)
+        candidate = len(block) - 1 - TITLE_LOOKAHEAD
+        # The inline match is a cheap pre-check; most lines are rejected without a call
+        if candidate > 0 and title_match(block[candidate]) and _is_block_boundary(block, candidate, first_block):
+            yield block[:candidate]
+            block = block[candidate:]
+            first_block = False
+    # Candidates among the last lines only have a truncated lookahead
+    for candidate in range(max(1, len(block) - TITLE_LOOKAHEAD), len(block)):
+        if _is_block_boundary(block, candidate, first_block):
+            yield block[:candidate]
+            block = block[candidate:]
+            break
+    if block:
+        yield block
+
+
+def block_fingerprint(block_lines):
+    return hashlib.blake2b("\n".join(block_lines).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class CourseBlock:
+    """
+    Parse result of one block.
+
+    Attributes:
+        fingerprint (str): Content fingerprint of the block's lines.
+        courses (dict): Uncleaned course dictionaries for every subject seen in the block.
+        lab_subjects (list): Subjects whose "Lab Work" was assigned in this block.
+    """
+    __slots__ = ("fingerprint", "courses", "lab_subjects")
+
+    def __init__(self, fingerprint, courses, lab_subjects):
+        self.fingerprint = fingerprint
+        self.courses = courses
+        self.lab_subjects = lab_subjects
+
+    def to_dict(self):
+        return {"fingerprint": self.fingerprint, "courses": self.courses, "lab_subjects": self.lab_subjects}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["fingerprint"], data["courses"], data["lab_subjects"])
+
+
+def parse_course_block(block_lines, fingerprint=None):
+    """Parses one block in isolation."""
+    machine = SyllabusStateMachine()
+    for token in tokenize(block_lines):
+        machine.feed(token)
+    machine.close()
+    return CourseBlock(fingerprint or block_fingerprint(block_lines), dict(machine.syllabus_data),
+                       [subject for subject in machine.syllabus_data if subject in machine.lab_subjects])
+
+
+def merge_course_block(merged, block):
+    """
+    Merges one block result into merged in place.
+
+    A subject appearing in several blocks is combined the way a whole-document
+    parse would combine it: units are appended, details updated and the lab work
+    replaced by the last block that assigned it.
+
+    Returns:
+        dict_keys: The titles the block touched.
+    """
+    lab_subjects = block.lab_subjects
+    for title, course in block.courses.items():
+        target = merged.get(title)
+        if target is None:
+            merged[title] = {"Units": list(course["Units"]), "Lab Work": course["Lab Work"],
+                             "Details": dict(course["Details"])}
+        else:
+            target["Units"].extend(course["Units"])
+            target["Details"].update(course["Details"])
+            if title in lab_subjects:
+                target["Lab Work"] = course["Lab Work"]
+    return block.courses.keys()
+
+
+def merge_course_blocks(blocks):
+    """Merges block results in document order into the dictionary parse_syllabus returns."""
+    merged = {}
+    for block in blocks:
+        merge_course_block(merged, block)
+    return clean_syllabus_data(merged)
+
+
+# Number of lines of changed blocks sent to a worker process in one batch
+PARALLEL_BATCH_LINES = 20000
+
+
+def _parse_block_batch(batch):
+    """Worker entry point: parses a list of (fingerprint, block lines) pairs."""
+    return [parse_course_block(block_lines, fingerprint) for fingerprint, block_lines in batch]
+
+
+class IncrementalSyllabusParser:
+    """
+    Re-parses only the blocks whose content changed since the previous parse.
+
+    Args:
+        blocks (iterable): CourseBlock results of an earlier parse, e.g. restored from the syllabus cache.
+        executor (concurrent.futures.Executor): Optional process pool. Changed blocks are then sent to
+            it in batches of about PARALLEL_BATCH_LINES lines while the rest of the input is still being
+            split, and the results are merged in document order.
+    """
+
+    def __init__(self, blocks=(), executor=None):
+        self.blocks = list(blocks)
+        self.executor = executor
+        self.parsed_count = 0
+        self.reused_count = 0
+
+    def iter_blocks(self, lines):
+        """
+        Splits and parses syllabus lines, reusing the results of unchanged blocks.
+
+        Blocks are yielded in document order as soon as their result is available.
+        Once the generator is exhausted, `blocks` holds the results of this parse.
+
+        Yields:
+            CourseBlock: The result of each block.
+        """
+        known = {block.fingerprint: block for block in self.blocks}
+        blocks = []
+        pending = deque()  # Fingerprints of blocks not yet yielded while the executor is busy
+        batch = []
+        batch_lines = 0
+        futures = deque()
+        self.parsed_count = self.reused_count = 0
+        for block_lines in split_course_blocks(lines):
+            fingerprint = block_fingerprint(block_lines)
+            if fingerprint in known:
+                self.reused_count += 1
+            else:
+                self.parsed_count += 1
+                if self.executor is None:
+                    known[fingerprint] = parse_course_block(block_lines, fingerprint)
+                else:
+                    known[fingerprint] = None  # Queued; identical blocks are parsed once
+                    batch.append((fingerprint, block_lines))
+                    batch_lines += len(block_lines)
+                    if batch_lines >= PARALLEL_BATCH_LINES:
+                        futures.append(self.executor.submit(_parse_block_batch, batch))
+                        batch = []
+                        batch_lines = 0
+            pending.append(fingerprint)
+            while futures and futures[0].done():
+                for block in futures.popleft().result():
+                    known[block.fingerprint] = block
+            while pending and known[pending[0]] is not None:
+                block = known[pending.popleft()]
+                blocks.append(block)
+                yield block
+        if batch:
+            futures.append(self.executor.submit(_parse_block_batch, batch))
+        while pending:
+            while known[pending[0]] is None:
+                for block in futures.popleft().result():
+                    known[block.fingerprint] = block
+            block = known[pending.popleft()]
+            blocks.append(block)
+            yield block
+        self.blocks = blocks
+
+    def iter_courses(self, lines):
+        """
+        Parses syllabus lines, yielding courses as the blocks containing them are merged.
+
+        Yields:
+            tuple: (title, course dict) for each course with substantial content. A title
+            whose course continues in a later block is yielded again with the same, updated dict,
+            or with None if the later block leaves it without substantial content.
+        """
+        merged = {}
+        shown = set()
+        for block in self.iter_blocks(lines):
+            for title in merge_course_block(merged, block):
+                course = merged[title]
+                if has_course_content(course):
+                    shown.add(title)
+                    yield title, course
+                elif title in shown:
+                    shown.discard(title)
+                    yield title, None
+
+    def parse_lines(self, lines):
+        """
+        Parses syllabus lines, reusing the results of unchanged blocks.
+
+        Returns:
+            dict: The same course dictionary as parse_syllabus.
+        """
+        return merge_course_blocks(self.iter_blocks(lines))
+
+
+def parse_syllabus_parallel(lines, max_workers=None):
+    """
+    Parses syllabus lines using a pool of worker processes.
+
+    Args:
+        lines (iterable): Lines of syllabus text.
+        max_workers (int): Number of worker processes; defaults to the number of CPUs.
+
+    Returns:
+        dict: The same course dictionary as parse_syllabus.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return IncrementalSyllabusParser(executor=executor).parse_lines(lines)
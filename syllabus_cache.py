@@ -0,0 +1,111 @@
+import hashlib
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+from atomic_file import atomic_write_json
+from syllabus_blocks import CourseBlock, IncrementalSyllabusParser, merge_course_blocks
+from syllabus_parser import PARSER_VERSION
+
+
+# --- Parsed Syllabus Cache ---
+#
+# The parse results of the syllabus blocks (see syllabus_blocks) are stored as
+# compact JSON together with a key derived from the syllabus source contents
+# and PARSER_VERSION. A warm start whose files and parser are unchanged only
+# hashes the files and merges the stored blocks instead of parsing again. When
+# the files changed, the stored blocks seed an incremental parse so that only
+# blocks with new content are parsed. A different parser version, or an
+# unreadable cache file, falls back to a full parse.
+
+CACHE_FORMAT = 2
+
+
+def syllabus_cache_key(source):
+    """Returns the cache key for a SyllabusSource under the current parser version."""
+    digest = hashlib.sha256()
+    digest.update(f"parser-{PARSER_VERSION}\n".encode("utf-8"))
+    digest.update(source.content_hash().encode("ascii"))
+    return digest.hexdigest()
+
+
+def load_syllabus_cache(filepath):
+    """
+    Loads the syllabus cache file if it was written by the current parser version.
+
+    Returns:
+        tuple: (key, list of CourseBlock), or None if the cache is missing, outdated or unreadable.
+    """
+    try:
+        with open(filepath, 'r', encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("format") != CACHE_FORMAT or cached.get("parser_version") != PARSER_VERSION:
+            return None
+        return cached["key"], [CourseBlock.from_dict(block) for block in cached["blocks"]]
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, AttributeError, KeyError, TypeError) as e:
+        print(f"Ignoring unreadable syllabus cache {filepath}: {e}")
+        return None
+
+
+def save_syllabus_cache(filepath, key, blocks):
+    """Writes the cache file atomically; failures are reported but never fatal."""
+    try:
+        # The cache can always be rebuilt from the syllabus files, so no backups are kept
+        atomic_write_json(filepath, {"format": CACHE_FORMAT, "parser_version": PARSER_VERSION, "key": key,
+                                     "blocks": [block.to_dict() for block in blocks]},
+                          backups=0, separators=(",", ":"))
+    except OSError as e:
+        print(f"Could not write syllabus cache {filepath}: {e}")
+
+
+def iter_syllabus_cached(source, cache_filepath, rebuild=False, max_workers=None):
+    """
+    Yields the parsed syllabus course by course, using the on-disk cache where it is still valid.
+
+    The cache is written once the generator has been exhausted; closing it early
+    leaves the cache file untouched.
+
+    Args:
+        source (SyllabusSource): The syllabus files.
+        cache_filepath (str): Location of the cache file.
+        rebuild (bool): Ignore any existing cache and parse everything again.
+        max_workers (int): Parse changed blocks in this many worker processes; None or 1 parses in-process.
+
+    Yields:
+        tuple: (title, course dict). A title may be yielded again with its updated course dict,
+        or with None once it no longer has substantial content and must be removed.
+    """
+    key = syllabus_cache_key(source)
+    cached = None if rebuild else load_syllabus_cache(cache_filepath)
+    if cached is not None and cached[0] == key:
+        yield from merge_course_blocks(cached[1]).items()
+        return
+
+    parser = IncrementalSyllabusParser(cached[1] if cached is not None else ())
+    if max_workers and max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            parser.executor = executor
+            yield from parser.iter_courses(source.iter_lines())
+        parser.executor = None
+    else:
+        yield from parser.iter_courses(source.iter_lines())
+    save_syllabus_cache(cache_filepath, key, parser.blocks)
+
+
+def parse_syllabus_cached(source, cache_filepath, rebuild=False, max_workers=None):
+    """
+    Returns the parsed syllabus, using the on-disk cache where it is still valid.
+
+    Takes the same arguments as iter_syllabus_cached.
+
+    Returns:
+        dict: The same course dictionary parse_syllabus returns.
+    """
+    syllabus_data = {}
+    for title, course in iter_syllabus_cached(source, cache_filepath, rebuild, max_workers):
+        if course is None:
+            del syllabus_data[title]
+        else:
+            syllabus_data[title] = course
+    return syllabus_data
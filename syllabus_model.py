@@ -0,0 +1,137 @@
+import re
+
+
+# --- Course and Unit Objects ---
+#
+# The parser works on plain dictionaries, which merge easily across blocks and
+# serialize directly into the syllabus cache. Consumers get Course objects
+# instead: they are built once per course, hold each unit's title, number and
+# hours already extracted from the unit text, and use __slots__ so that no
+# per-instance dictionary is allocated.
+
+# "Unit IV: Context Free Grammar (9 Hrs.)" -> number IV, name, hours 9
+UNIT_HEADER_RE = re.compile(
+    r"^Unit\s+(?P<number>[IVXLCDM]+)\b[:\s]*(?P<name>.*?)\s*(?:\((?P<hours>\d+(?:\.\d+)?)\s*Hrs?\.?\))?\s*$",
+    re.IGNORECASE)
+ROMAN_VALUES = {"I": 1, "V": 5, "X": 10, "L": 50, "C": 100, "D": 500, "M": 1000}
+
+
+def roman_to_int(numeral):
+    total = 0
+    previous = 0
+    for char in reversed(numeral.upper()):
+        value = ROMAN_VALUES[char]
+        total = total - value if value < previous else total + value
+        previous = max(previous, value)
+    return total
+
+
+class Unit:
+    """
+    One course unit.
+
+    Attributes:
+        title (str): The unit's first line, e.g. "Unit I: Basic Foundations (3 Hrs.)".
+        number (int): The unit number, or None if the title has no "Unit <numeral>" prefix.
+        hours (int or float): Teaching hours from a "(N Hrs.)" suffix, or None.
+        body (str): The full unit text, including the title line.
+    """
+    __slots__ = ("title", "number", "hours", "body", "_topics")
+
+    def __init__(self, title, number, hours, body):
+        self.title = title
+        self.number = number
+        self.hours = hours
+        self.body = body
+        self._topics = None
+
+    @classmethod
+    def from_text(cls, text, index=0):
+        """Builds a unit from parsed unit text; index names units without a title line."""
+        lines = text.splitlines()
+        title = lines[0].strip() if lines else f"Unit {index + 1}"
+        match = UNIT_HEADER_RE.match(title)
+        if match:
+            hours = match.group("hours")
+            if hours is not None:
+                hours = float(hours) if "." in hours else int(hours)
+            return cls(title, roman_to_int(match.group("number")), hours, text)
+        return cls(title, None, None, text)
+
+    @property
+    def name(self):
+        """The title without the "Unit <numeral>:" prefix and the hours."""
+        match = UNIT_HEADER_RE.match(self.title)
+        return match.group("name") if match else self.title
+
+    @property
+    def topics(self):
+        """The non-empty lines after the title, as a tuple; split from the body on first access, then kept."""
+        if self._topics is None:
+            self._topics = tuple(stripped for stripped in (line.strip() for line in self.body.splitlines()[1:])
+                                 if stripped)
+        return self._topics
+
+    def __repr__(self):
+        return f"Unit({self.title!r})"
+
+
+# Parsed detail keys and the Course attributes holding them
+DETAIL_ATTRIBUTES = (
+    ("Course No", "course_no"),
+    ("Credit Hrs", "credit_hrs"),
+    ("Semester", "semester"),
+    ("Full Marks", "full_marks"),
+    ("Pass Marks", "pass_marks"),
+    ("Nature", "nature"),
+)
+
+
+class Course:
+    """
+    One parsed course.
+
+    Attributes:
+        title (str): The course title.
+        course_no, credit_hrs, semester, full_marks, pass_marks, nature (str): Course details, or None
+            if the syllabus does not give them.
+        units (tuple): Unit objects in document order.
+        lab_work (str): Laboratory work text, possibly empty.
+        unit_titles (tuple): Titles of the units, for chapter selection.
+        total_hours (int or float): Sum of the unit hours that are known.
+    """
+    __slots__ = ("title", "course_no", "credit_hrs", "semester", "full_marks", "pass_marks", "nature", "units",
+                 "lab_work", "unit_titles", "total_hours")
+
+    def __init__(self, title, details, units, lab_work):
+        self.title = title
+        for key, attribute in DETAIL_ATTRIBUTES:
+            setattr(self, attribute, details.get(key))
+        self.units = tuple(units)
+        self.lab_work = lab_work
+        self.unit_titles = tuple(unit.title for unit in self.units)
+        self.total_hours = sum(unit.hours for unit in self.units if unit.hours is not None)
+
+    @classmethod
+    def from_dict(cls, title, course):
+        """Builds a course from a dictionary in the format parse_syllabus returns."""
+        return cls(title, course["Details"],
+                   [Unit.from_text(text, index) for index, text in enumerate(course["Units"])],
+                   course["Lab Work"])
+
+    @property
+    def details(self):
+        """The details that are present, keyed as in the parser's "Details" dictionary."""
+        return {key: getattr(self, attribute) for key, attribute in DETAIL_ATTRIBUTES
+                if getattr(self, attribute) is not None}
+
+    def to_dict(self):
+        return {"Units": [unit.body for unit in self.units], "Lab Work": self.lab_work, "Details": self.details}
+
+    def __repr__(self):
+        return f"Course({self.title!r}, {len(self.units)} units)"
+
+
+def build_courses(syllabus_data):
+    """Converts a parse_syllabus result into a dictionary of Course objects, keyed by title."""
+    return {title: Course.from_dict(title, course) for title, course in syllabus_data.items()}
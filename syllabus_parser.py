@@ -0,0 +1,359 @@
+import re
+from collections import defaultdict, deque
+
+from line_classifier import (
+    BOOKS_LINE, CONTENTS_LINE, LAB_LINE, TITLE_LINE, UNIT_LINE, BLANK_LINE, DETAIL_LINE, default_classifier
+)
+
+
+# --- Syllabus Parsing Engine ---
+#
+# Parsing happens in two stages. The tokenizer classifies every line of the
+# syllabus exactly once into a token (TITLE, DETAIL, CONTENTS_START, UNIT_START,
+# LAB_START, BOOKS_START, BODY or BLANK). Course titles can only be confirmed by
+# looking at the next few lines (the "Course No:" line that follows them), so the
+# tokenizer keeps a fixed-size lookahead window instead of re-scanning the text.
+# A small deterministic state machine then consumes the token stream and builds
+# the same dictionary shape that the original parser produced.
+
+# Bump whenever a change to the parser alters its output, so cached results are rebuilt
+PARSER_VERSION = 2
+
+TITLE = "TITLE"
+DETAIL = "DETAIL"
+CONTENTS_START = "CONTENTS_START"
+UNIT_START = "UNIT_START"
+LAB_START = "LAB_START"
+BOOKS_START = "BOOKS_START"
+BODY = "BODY"
+BLANK = "BLANK"
+
+# Number of lines after a candidate title that are inspected to confirm it
+TITLE_LOOKAHEAD = 3
+# Maximum number of lines (title included) searched for course details
+DETAILS_WINDOW = 7
+
+DETAIL_FIELDS = (
+    ("Course No", re.compile(r"Course No:\s*(\S+)", re.IGNORECASE)),
+    ("Credit Hrs", re.compile(r"Credit Hrs:\s*(\S+)", re.IGNORECASE)),
+    ("Semester", re.compile(r"Semester:\s*(\S+)", re.IGNORECASE)),
+    ("Full Marks", re.compile(r"Full Marks:\s*(\S+)", re.IGNORECASE)),
+    ("Pass Marks", re.compile(r"Pass Marks:\s*(\S+)", re.IGNORECASE)),
+    ("Nature", re.compile(r"Nature of the Course:\s*(.+)", re.IGNORECASE)),
+)
+
+
+_KIND_BY_LINE_CLASS = {
+    CONTENTS_LINE: CONTENTS_START,
+    UNIT_LINE: UNIT_START,
+    LAB_LINE: LAB_START,
+    BOOKS_LINE: BOOKS_START,
+    BLANK_LINE: BLANK,
+    DETAIL_LINE: DETAIL,
+    TITLE_LINE: BODY,  # "Course Title:" lines that were not confirmed as titles
+}
+
+
+def _resolve_token(window):
+    """Sets the token fields of window[0] using the lines that follow it in the lookahead window."""
+    head = window[0]
+    title = None
+    if head.course_title is not None or head.general_title is not None:  # Most lines cannot be a title
+        # "Course Title: <Name>" counts if details follow in the next few lines
+        if head.course_title is not None and any(info.has_detail for info in window):
+            title = head.course_title
+        # Heuristic title: a capitalized line shortly followed by "Course No:"
+        elif head.general_title and any(window[i].course_no for i in range(1, len(window))):
+            title = head.general_title
+
+    if title:
+        kind = TITLE
+    else:
+        kind = _KIND_BY_LINE_CLASS.get(head.line_class, BODY)
+        title = None
+    head.kind = kind
+    head.title = title
+    head.ends_lab = kind == BOOKS_START or head.course_title is not None or \
+        (head.general_match and len(window) > 1 and window[1].course_no)
+
+
+def tokenize(lines, classifier=None):
+    """
+    Classifies syllabus lines into a token stream.
+
+    Each line is classified with a single regex match; title confirmation uses a
+    lookahead window of TITLE_LOOKAHEAD lines, so memory use is constant and the
+    total work is linear in the number of lines.
+
+    Args:
+        lines (iterable): Lines of syllabus text, with or without trailing newlines.
+        classifier (LineClassifier): Classifier to use, e.g. one counting hits for profiling.
+            Defaults to the shared classifier.
+
+    Yields:
+        LineInfo: One per input line, in order, with its token fields (kind, title, ends_lab) set.
+    """
+    classify = (classifier or default_classifier).classify
+    window = deque()
+    append = window.append
+    popleft = window.popleft
+    for raw in lines:
+        append(classify(raw))
+        if len(window) > TITLE_LOOKAHEAD:
+            _resolve_token(window)
+            yield popleft()
+    while window:
+        _resolve_token(window)
+        yield popleft()
+
+
+class _DetailsWindow:
+    """Collects the lines around a course title until its details can be extracted."""
+    __slots__ = ("details", "lines")
+
+    def __init__(self, details, raw):
+        self.details = details
+        self.lines = [raw]
+
+    def accept(self, token):
+        """Adds the token's line; returns False once the window is complete."""
+        if len(self.lines) > 1 and not self.lines[-1].strip() and \
+                (token.course_title is not None or token.general_match):
+            return False  # Stop if next title seems to start
+        self.lines.append(token.raw)
+        return len(self.lines) < DETAILS_WINDOW
+
+    def apply(self):
+        details_text = "\n".join(self.lines)
+        for key, pattern in DETAIL_FIELDS:
+            match = pattern.search(details_text)
+            if match:
+                self.details[key] = match.group(1).strip()
+
+
+class SyllabusStateMachine:
+    """
+    Deterministic state machine that turns a token stream into course data.
+
+    The machine is either outside any section, inside "Course Contents" (collecting
+    units) or inside a laboratory works section. Each token is handled in constant
+    time; the only token that is looked at twice is the one that closes a lab
+    section, which is re-dispatched once in the outside state.
+    """
+
+    def __init__(self):
+        self.syllabus_data = defaultdict(lambda: {"Units": [], "Lab Work": "", "Details": {}})
+        self.current_subject = None
+        self.parsing_contents = False
+        self.unit_lines = []
+        self.lab_lines = None  # List of lines while inside a lab section, otherwise None
+        self.lab_blank_count = 0
+        self.lab_subjects = set()  # Subjects whose "Lab Work" was assigned by a lab section
+        self.details_windows = []
+        self.finishing_subjects = {}  # Subjects left behind by a new title, in order (used as an ordered set)
+        self.reported_subjects = set()  # Subjects pop_completed has returned with content
+
+    def feed(self, token):
+        if self.details_windows:
+            self.details_windows = [window for window in self.details_windows if self._feed_window(window, token)]
+        if self.lab_lines is not None and self._feed_lab(token):
+            return
+        kind = token.kind
+        if kind is BODY or kind is BLANK or kind is DETAIL:  # Most lines; they can only extend the open unit
+            if self.parsing_contents and self.unit_lines and token.line:
+                if token.course_title is None:
+                    self.unit_lines.append(token.line)
+                else:
+                    self._flush_unit()
+        else:
+            self._dispatch(token)
+
+    def close(self):
+        """Closes any open section; syllabus_data then holds every subject seen, uncleaned."""
+        if self.lab_lines is not None:
+            self._end_lab()
+        self._flush_unit()
+        for window in self.details_windows:
+            window.apply()
+        self.details_windows = []
+        if self.current_subject:
+            self.finishing_subjects[self.current_subject] = None
+            self.current_subject = None
+
+    def pop_completed(self):
+        """
+        Returns the subjects completed since the last call.
+
+        A subject is complete once another title has started (or the input has
+        been closed) and its details have been extracted. Subjects without
+        substantial content are skipped; a subject whose title appears again
+        later is reported again once that later section completes. If that later
+        section leaves it without substantial content (an empty lab section
+        replaces its lab work), it is reported with None instead, so that it can
+        be removed again.
+
+        Returns:
+            list: (title, course dict) pairs; the course is None for a subject to remove.
+        """
+        completed = []
+        if self.finishing_subjects:
+            open_details = [window.details for window in self.details_windows]
+            pending = {}
+            for subject in self.finishing_subjects:
+                course = self.syllabus_data[subject]
+                if subject == self.current_subject or any(details is course["Details"] for details in open_details):
+                    pending[subject] = None
+                elif has_course_content(course):
+                    completed.append((subject, course))
+                    self.reported_subjects.add(subject)
+                elif subject in self.reported_subjects:
+                    completed.append((subject, None))
+                    self.reported_subjects.discard(subject)
+            self.finishing_subjects = pending
+        return completed
+
+    def finish(self):
+        """Closes any open section and returns the cleaned-up course dictionary."""
+        self.close()
+        return clean_syllabus_data(self.syllabus_data)
+
+    @staticmethod
+    def _feed_window(window, token):
+        if window.accept(token):
+            return True
+        window.apply()
+        return False
+
+    def _feed_lab(self, token):
+        """Consumes a token inside a lab section; returns False if it must be re-dispatched."""
+        if token.kind == BLANK:
+            self.lab_blank_count += 1
+            if self.lab_blank_count >= 2:  # Stop after two consecutive blank lines
+                self._end_lab()
+                return False
+        else:
+            self.lab_blank_count = 0
+        if token.ends_lab:
+            self._end_lab()
+            return False
+        self.lab_lines.append(token.line)
+        return True
+
+    def _end_lab(self):
+        self.syllabus_data[self.current_subject]["Lab Work"] = "\n".join(
+            filter(None, self.lab_lines)).strip()  # Filter out empty strings
+        self.lab_subjects.add(self.current_subject)
+        self.lab_lines = None
+
+    def _flush_unit(self):
+        if self.current_subject and self.unit_lines:
+            unit_text = "\n".join(self.unit_lines).strip()
+            if unit_text:
+                self.syllabus_data[self.current_subject]["Units"].append(unit_text)
+        self.unit_lines = []
+
+    def _dispatch(self, token):
+        kind = token.kind
+        if kind == TITLE:
+            self._flush_unit()
+            if self.current_subject and self.current_subject != token.title:
+                self.finishing_subjects[self.current_subject] = None
+            self.current_subject = token.title
+            self.parsing_contents = False
+            course = self.syllabus_data[token.title]  # Ensure key exists
+            self.details_windows.append(_DetailsWindow(course["Details"], token.raw))
+
+        elif kind == CONTENTS_START:
+            if self.current_subject:
+                self.parsing_contents = True
+                self._flush_unit()  # Save any lingering unit content before starting new ones
+
+        elif kind == UNIT_START and self.parsing_contents:
+            self._flush_unit()
+            self.unit_lines = [token.line]
+
+        elif kind == LAB_START and self.current_subject:
+            self._flush_unit()
+            self.parsing_contents = False  # Lab work is usually after units
+            self.lab_lines = [token.line.replace(token.marker, "").strip()]  # Remove "Laboratory Works:" prefix
+            self.lab_blank_count = 0
+
+        elif self.parsing_contents and self.unit_lines and token.line:
+            # Book lists and stray "Course Title:" lines close the unit; anything else belongs to it
+            if kind != BOOKS_START and token.course_title is None:
+                self.unit_lines.append(token.line)
+            else:
+                self._flush_unit()
+
+
+def has_course_content(course):
+    """Whether a course has units, lab work or at least a course number."""
+    return bool(course.get("Units") or course.get("Lab Work") or
+                (course.get("Details") and course["Details"].get("Course No")))
+
+
+def clean_syllabus_data(syllabus_data):
+    """Removes subjects with no substantial content."""
+    cleaned_data = {k: v for k, v in syllabus_data.items() if has_course_content(v)}
+    for k in cleaned_data:  # Ensure "Units" key exists even if empty
+        if "Units" not in cleaned_data[k]:
+            cleaned_data[k]["Units"] = []
+    return cleaned_data
+
+
+def parse_syllabus(text):
+    """
+    Parses the syllabus text.
+
+    Args:
+        text (str): The full text content from the PDF.
+
+    Returns:
+        dict: A dictionary where keys are course titles and values are
+              dictionaries containing course details.
+    """
+    return parse_syllabus_lines(text.split('\n'))
+
+
+def parse_syllabus_lines(lines):
+    """
+    Parses syllabus text supplied as an iterable of lines.
+
+    The lines are consumed one at a time, so a lazily read file never has to be
+    held in memory as a whole.
+
+    Args:
+        lines (iterable): Lines of syllabus text, with or without trailing newlines.
+
+    Returns:
+        dict: The same course dictionary as parse_syllabus.
+    """
+    machine = SyllabusStateMachine()
+    for token in tokenize(lines):
+        machine.feed(token)
+    return machine.finish()
+
+
+def iter_syllabus(lines):
+    """
+    Parses syllabus lines incrementally, yielding each course as soon as it is complete.
+
+    Only a handful of lines are buffered at any time, so the input can be a file
+    object or any other lazy iterable of lines.
+
+    Args:
+        lines (iterable): Lines of syllabus text, e.g. an open text file.
+
+    Yields:
+        tuple: (title, course dict) in completion order. A title that appears again
+        later in the document is yielded again with its updated course dict, or
+        with None if the course no longer has substantial content and parse_syllabus
+        would leave it out.
+    """
+    machine = SyllabusStateMachine()
+    for token in tokenize(lines):
+        machine.feed(token)
+        if machine.finishing_subjects:
+            yield from machine.pop_completed()
+    machine.close()
+    yield from machine.pop_completed()
@@ -0,0 +1,102 @@
+import hashlib
+import mmap
+import os
+
+
+# --- Syllabus Source Files ---
+#
+# Syllabus text lives in external .txt files rather than in the application
+# code. A source is a list of files (directories are expanded to the .txt files
+# they contain, in name order) that is read line by line, so the raw text is
+# never held in memory as a whole. Files of MMAP_THRESHOLD bytes or more are
+# memory-mapped instead of being read through a file buffer.
+
+DEFAULT_SYLLABUS_PATH = "syllabus"
+SYLLABUS_FILE_SUFFIX = ".txt"
+MMAP_THRESHOLD = 1 << 20  # 1 MiB
+
+
+def find_syllabus_files(paths):
+    """
+    Expands files and directories into the list of syllabus files to read.
+
+    Args:
+        paths (list): File or directory paths. Directories contribute their .txt files sorted by name.
+
+    Returns:
+        list: File paths, in reading order.
+
+    Raises:
+        FileNotFoundError: If a path does not exist.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, name) for name in sorted(os.listdir(path))
+                if name.lower().endswith(SYLLABUS_FILE_SUFFIX) and os.path.isfile(os.path.join(path, name))
+            )
+        elif os.path.isfile(path):
+            files.append(path)
+        else:
+            raise FileNotFoundError(f"Syllabus source not found: {path}")
+    return files
+
+
+def _iter_file_chunks(filepath):
+    """Yields the file's bytes, memory-mapped for large files."""
+    with open(filepath, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+        else:
+            yield f.read()
+
+
+def _decode_line(raw):
+    return raw[:-1].decode("utf-8") if raw.endswith(b"\n") else raw.decode("utf-8")
+
+
+def iter_file_lines(filepath):
+    """
+    Yields the lines of a syllabus file without their trailing newline.
+
+    Large files are memory-mapped and decoded one line at a time.
+    """
+    with open(filepath, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for raw in iter(mapped.readline, b""):
+                    yield _decode_line(raw)
+        else:
+            for raw in f:
+                yield _decode_line(raw)
+
+
+class SyllabusSource:
+    """
+    One or more syllabus text files, read lazily.
+
+    Args:
+        paths (list): File or directory paths; see find_syllabus_files.
+    """
+
+    def __init__(self, paths):
+        self.files = find_syllabus_files(paths)
+
+    def content_hash(self):
+        """Returns a SHA-256 hex digest over the names and contents of all files."""
+        digest = hashlib.sha256()
+        for filepath in self.files:
+            digest.update(os.path.basename(filepath).encode("utf-8") + b"\0")
+            for chunk in _iter_file_chunks(filepath):
+                digest.update(chunk)
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def iter_lines(self):
+        """Yields the lines of all files in order, as if they were one document."""
+        for filepath in self.files:
+            yield from iter_file_lines(filepath)
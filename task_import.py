@@ -0,0 +1,383 @@
+import csv
+import datetime
+import io
+import json
+import os
+import re
+
+from task_store import TASK_ID_KEY, parse_task_date, parse_timestamp
+
+
+# --- Bulk Task Import ---
+#
+# Task files are read as a stream of rows, never as a whole, so a semester of
+# tasks (100k rows or more) is imported in constant memory:
+#
+#   .csv   A header row naming the columns (Subject, Type, Description,
+#          Assigned, Submit By, Status; case, spaces and underscores do not
+#          matter, and "Due" is accepted for Submit By), then one task per row.
+#   .json  An array of task objects, as --export-tasks-json writes, or one
+#          object per line (JSON Lines); objects are decoded one at a time.
+#   .ics   iCalendar VTODO and VEVENT components; see _ics_fields.
+#
+# Every row is checked with the rules of the task form (validate_task). The
+# window's TaskImporter runs this on a worker thread and adds the valid tasks
+# in chunks.
+
+IMPORT_FORMATS = {".csv": "csv", ".json": "json", ".jsonl": "json", ".ics": "ics"}
+DEFAULT_TASK_TYPE = "Assignment"
+DEFAULT_TASK_STATUS = "Pending"
+JSON_READ_SIZE = 1 << 16  # Characters read at a time while streaming JSON
+JSON_ITEM_SIZE_LIMIT = 1 << 20  # Characters a single JSON item may take; larger ones are rejected
+
+# Normalized column or key name -> task field
+FIELD_NAMES = {
+    "subject": "Subject",
+    "type": "Type",
+    "tasktype": "Type",
+    "description": "Description",
+    "assigned": "Assigned",
+    "dateassigned": "Assigned",
+    "submitby": "Submit By",
+    "due": "Submit By",
+    "duedate": "Submit By",
+    "status": "Status",
+    "timestamp": "Timestamp",
+    "id": TASK_ID_KEY,
+}
+
+
+def _field_name(name):
+    return FIELD_NAMES.get(re.sub(r"[^a-z0-9]", "", str(name).lower()))
+
+
+class TaskFileReader:
+    """
+    Reads the rows of a task file as (location, fields) pairs, where location
+    names the row for error messages ("line 12", "item 3") and fields maps task
+    fields to their raw values. Use as a context manager.
+
+    Args:
+        path (str): A .csv, .json, .jsonl or .ics file.
+
+    Raises:
+        ValueError: If the file type is not supported, or the file is malformed
+            beyond a single row (e.g. a CSV file without a Description column).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file_format = IMPORT_FORMATS.get(os.path.splitext(path)[1].lower())
+        if self.file_format is None:
+            raise ValueError(f"Unsupported task file type: {path} (use .csv, .json or .ics)")
+        self.size = os.path.getsize(path)
+        self._binary = None
+        self._text = None
+
+    def __enter__(self):
+        self._binary = open(self.path, "rb")
+        self._text = io.TextIOWrapper(self._binary, encoding="utf-8-sig", newline="")
+        return self
+
+    def __exit__(self, *exc_info):
+        self._text.close()
+
+    def __iter__(self):
+        if self.file_format == "csv":
+            return iter_csv_rows(self._text)
+        if self.file_format == "json":
+            return iter_json_rows(self._text)
+        return iter_ics_rows(self._text)
+
+    def bytes_read(self):
+        """How far into the file reading has got, in bytes (ahead of the rows returned by a buffer at most)."""
+        return self._binary.tell()
+
+
+def iter_csv_rows(stream):
+    reader = csv.DictReader(stream)
+    columns = {}
+    for name in reader.fieldnames or []:
+        field = _field_name(name)
+        if field is not None and field not in columns:
+            columns[field] = name
+    if "Description" not in columns:
+        raise ValueError("The CSV file has no Description column")
+    for row in reader:
+        yield f"line {reader.line_num}", {field: row[name] for field, name in columns.items()}
+
+
+_JSON_TOKEN_END = re.compile(r'[\s,:\[\]{}"]')
+
+
+def _json_cut_off(buffer, error):
+    """
+    Whether a decoding error only comes from the buffer ending inside the value
+    (in a string, or in a number, literal or escape running up to the end), so
+    that reading on may complete it; any other error is invalid JSON.
+    """
+    return error.msg.startswith("Unterminated string") or _JSON_TOKEN_END.search(buffer, error.pos) is None
+
+
+def iter_json_rows(stream):
+    """
+    Objects of a top-level JSON array, or of JSON Lines, decoded one at a time.
+
+    Items of an array must be separated by commas and only whitespace may follow
+    the array; JSON Lines values must be separated by whitespace.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    count = 0
+    in_array = None  # Whether the file is an array, known once its first character is read
+    array_closed = False
+    separator_due = False  # An array item was read, so "," or "]" must come next
+    while True:
+        # Skip whitespace, reading on as needed
+        while position < len(buffer) and buffer[position] in " \t\r\n":
+            position += 1
+        if position == len(buffer):
+            chunk = stream.read(JSON_READ_SIZE)
+            if not chunk:
+                if in_array and not array_closed:
+                    raise ValueError("The JSON array of tasks is not closed")
+                return
+            buffer, position = chunk, 0
+            continue
+        char = buffer[position]
+        if array_closed:
+            raise ValueError("Invalid JSON after the array of tasks: unexpected text")
+        if in_array is None:
+            in_array = char == "["
+            if in_array:
+                position += 1
+                continue
+        if separator_due:
+            if char not in ",]":
+                raise ValueError(f"Invalid JSON after item {count}: expected ',' or ']'")
+            separator_due = False
+            array_closed = char == "]"
+            position += 1
+            continue
+        if in_array and char == "]" and count == 0:  # An empty array
+            array_closed = True
+            position += 1
+            continue
+        try:
+            value, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError as e:
+            if not _json_cut_off(buffer, e):
+                raise ValueError(f"Invalid JSON in item {count + 1}: {e.msg}") from e
+            if len(buffer) - position > JSON_ITEM_SIZE_LIMIT:
+                raise ValueError(f"Item {count + 1} of the JSON file is over {JSON_ITEM_SIZE_LIMIT} characters") from e
+            chunk = stream.read(JSON_READ_SIZE)
+            if not chunk:
+                raise ValueError(f"Invalid JSON in item {count + 1}: {e.msg}") from e
+            buffer, position = buffer[position:] + chunk, 0
+            continue
+        if _JSON_TOKEN_END.search(buffer, end) is None:
+            # A number or literal running up to the end of the buffer may continue in the next chunk
+            chunk = stream.read(JSON_READ_SIZE)
+            if chunk:
+                buffer, position = buffer[position:] + chunk, 0
+                continue
+        if not in_array and end < len(buffer) and buffer[end] not in " \t\r\n":
+            raise ValueError(f"Invalid JSON after item {count + 1}: expected a new line")
+        count += 1
+        position = end
+        separator_due = in_array
+        if isinstance(value, dict):
+            fields = {}
+            for key, field_value in value.items():
+                field = _field_name(key)
+                if field is not None and field not in fields:
+                    fields[field] = field_value
+            yield f"item {count}", fields
+        else:
+            yield f"item {count}", None
+
+
+# iCalendar STATUS -> task status
+ICS_STATUSES = {
+    "NEEDS-ACTION": "Pending",
+    "IN-PROCESS": "In Progress",
+    "COMPLETED": "Completed",
+    "CANCELLED": "Cancelled",
+    "TENTATIVE": "Pending",
+    "CONFIRMED": "Pending",
+}
+ICS_COMPONENTS = ("VTODO", "VEVENT")
+_ICS_ESCAPES = re.compile(r"\\(.)")
+
+
+def _unfold_ics_lines(stream):
+    """Yields (line number, logical line) with folded continuation lines joined."""
+    pending, pending_number = None, 0
+    for number, line in enumerate(stream, 1):
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and pending is not None:
+            pending += line[1:]
+            continue
+        if pending is not None:
+            yield pending_number, pending
+        pending, pending_number = line, number
+    if pending is not None:
+        yield pending_number, pending
+
+
+def _split_ics_line(line):
+    """Splits "NAME;PARAM=...:VALUE" into the upper-cased name, the parameters, and the value."""
+    index = line.find(":")
+    if index < 0:
+        return line.upper(), "", ""
+    if '"' not in line[:index]:  # The usual case: no quoted parameter value that could hold a colon
+        name, _, params = line[:index].partition(";")
+        return name.upper(), params.upper(), line[index + 1:]
+    quoted = False
+    for index, char in enumerate(line):
+        if char == '"':
+            quoted = not quoted
+        elif char == ":" and not quoted:
+            name, _, params = line[:index].partition(";")
+            return name.upper(), params.upper(), line[index + 1:]
+    return line.upper(), "", ""
+
+
+def _ics_text(value):
+    return _ICS_ESCAPES.sub(lambda match: "\n" if match.group(1) in "nN" else match.group(1), value)
+
+
+def _ics_date(property_value):
+    """The date of a DATE or DATE-TIME property value (its local date, without time zone conversion)."""
+    if property_value is None:
+        return None
+    params, value = property_value
+    value = value.strip()
+    try:
+        day = datetime.date(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+    except ValueError:
+        return None
+    if len(value) > 8 and value[8:9] != "T":
+        return None
+    return day
+
+
+def _ics_fields(properties):
+    """
+    The task fields of a VTODO or VEVENT: SUMMARY is the description, X-SUBJECT
+    or else the first of CATEGORIES the subject, X-TASK-TYPE the type and STATUS
+    the status. DUE (or DTEND, the day before it for an all-day event) is the
+    submission date and DTSTART the assigned date; either falls back to the other.
+    """
+    submit = _ics_date(properties.get("DUE"))
+    if submit is None and "DTEND" in properties:
+        submit = _ics_date(properties["DTEND"])
+        start = _ics_date(properties.get("DTSTART"))
+        if submit is not None and "VALUE=DATE" in properties["DTEND"][0] and start is not None and submit > start:
+            submit -= datetime.timedelta(days=1)  # All-day events end the day after their last day
+    assigned = _ics_date(properties.get("DTSTART"))
+    subject = properties.get("X-SUBJECT", (None, ""))[1]
+    if not subject and "CATEGORIES" in properties:
+        subject = re.split(r"(?<!\\),", properties["CATEGORIES"][1])[0]
+    return {
+        "Subject": _ics_text(subject),
+        "Type": _ics_text(properties.get("X-TASK-TYPE", (None, ""))[1]),
+        "Description": _ics_text(properties.get("SUMMARY", (None, ""))[1]),
+        "Assigned": assigned or submit,
+        "Submit By": submit or assigned,
+        "Status": ICS_STATUSES.get(properties.get("STATUS", (None, ""))[1].strip().upper(), DEFAULT_TASK_STATUS),
+    }
+
+
+def iter_ics_rows(stream):
+    component, start, properties, depth = None, 0, None, 0
+    for number, line in _unfold_ics_lines(stream):
+        name, params, value = _split_ics_line(line)
+        if name == "BEGIN":
+            if component is None and value.strip().upper() in ICS_COMPONENTS:
+                component, start, properties, depth = value.strip().upper(), number, {}, 0
+            elif component is not None:
+                depth += 1  # E.g. a VALARM inside the task, whose properties are not the task's
+        elif name == "END" and component is not None:
+            if depth:
+                depth -= 1
+            elif value.strip().upper() == component:
+                yield f"line {start}", _ics_fields(properties)
+                component = None
+        elif component is not None and not depth:
+            properties.setdefault(name, (params, value))
+
+
+def _task_date(value):
+    if isinstance(value, datetime.date):
+        return value
+    if isinstance(value, str) and value.strip():
+        return parse_task_date(value.strip())
+    return None
+
+
+def task_from_fields(fields):
+    """A task dictionary from the raw fields of an imported row; missing type and status get defaults."""
+    task = {
+        "Subject": str(fields.get("Subject") or "").strip(),
+        "Type": str(fields.get("Type") or "").strip() or DEFAULT_TASK_TYPE,
+        "Description": str(fields.get("Description") or "").strip(),
+        "Assigned": _task_date(fields.get("Assigned")),
+        "Submit By": _task_date(fields.get("Submit By")),
+        "Status": str(fields.get("Status") or "").strip() or DEFAULT_TASK_STATUS,
+    }
+    timestamp = fields.get("Timestamp")
+    if isinstance(timestamp, str) and timestamp.strip():
+        timestamp = parse_timestamp(timestamp.strip())
+    if isinstance(timestamp, datetime.datetime) and timestamp != datetime.datetime.min:
+        task["Timestamp"] = timestamp  # Otherwise the time of the import
+    if fields.get(TASK_ID_KEY):
+        task[TASK_ID_KEY] = str(fields[TASK_ID_KEY])
+    return task
+
+
+def validate_task(task, subjects, task_types, statuses):
+    """
+    Checks a task with the rules of the task form: a description, a subject of
+    the syllabus, one of the form's types and statuses, and valid dates with the
+    submission not before the assignment.
+
+    Returns:
+        str: Why the task is invalid, or None if it is valid.
+    """
+    if not task.get("Description"):
+        return "Task description cannot be empty."
+    subject = task.get("Subject")
+    if subject not in subjects:
+        return f"Unknown subject '{subject}'." if subject else "Please select a valid subject for the task."
+    if task.get("Type") not in task_types:
+        return f"Unknown task type '{task.get('Type')}'."
+    if task.get("Status") not in statuses:
+        return f"Unknown status '{task.get('Status')}'."
+    assigned, submit = task.get("Assigned"), task.get("Submit By")
+    if not isinstance(assigned, datetime.date):
+        return "The assigned date is missing or invalid."
+    if not isinstance(submit, datetime.date):
+        return "The submission date is missing or invalid."
+    if assigned > submit:
+        return "Submission date cannot be before assigned date."
+    return None
+
+
+def parse_import_row(fields, subjects, task_types, statuses):
+    """
+    Returns (task, None) for a valid imported row, or (None, reason) otherwise.
+
+    Args:
+        fields (dict): Raw fields of a row, from TaskFileReader; None for a
+            JSON value that is not an object.
+        subjects (collection): The subjects tasks may belong to.
+        task_types (collection): The types tasks may have.
+        statuses (collection): The statuses tasks may have.
+    """
+    if not isinstance(fields, dict):
+        return None, "Not a task object."
+    task = task_from_fields(fields)
+    error = validate_task(task, subjects, task_types, statuses)
+    return (None, error) if error else (task, None)
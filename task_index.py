@@ -0,0 +1,199 @@
+import bisect
+import datetime
+
+from task_rows import comparable_datetime
+
+
+# --- Task Field Indexes ---
+#
+# Kept by TaskTableModel next to its rows, keyed by task id rather than row so
+# that sorting or inserting rows does not touch them. Each index holds the
+# (key, task id) pairs of its tasks in a sorted list, the key derived from the
+# task fields the index names: a change is a bisect and a list insert or delete
+# (a memmove, fast even at 100k tasks), and queries read only the entries they
+# return. Tasks that get no key (a missing date, text typed into the table, a
+# closed task for the deadline index) are kept apart, in the order they came.
+
+BULK_CHANGE_SIZE = 64  # Batches of at least this many tasks rebuild the entries rather than bisect each
+
+
+class SortedFieldIndex:
+    """Task ids ordered by a key derived from some task fields; subclasses define fields and key()."""
+
+    fields = ()  # The fields key() is given, in order
+
+    def __init__(self, items=()):
+        self.rebuild(items)
+
+    def key(self, *values):
+        """The sort key of a task with these field values, or None to leave it out of the order."""
+        raise NotImplementedError
+
+    def rebuild(self, items):
+        """Replaces the contents with (task id, field values) pairs."""
+        self._entries = []
+        self._key_by_id = {}
+        self._unkeyed = {}  # Task id -> None, in insertion order
+        for task_id, values in items:
+            key = self.key(*values)
+            if key is None:
+                self._unkeyed[task_id] = None
+            else:
+                self._key_by_id[task_id] = key
+                self._entries.append((key, task_id))
+        self._entries.sort()
+
+    def __len__(self):
+        return len(self._key_by_id) + len(self._unkeyed)
+
+    def set(self, task_id, values):
+        """Adds a task, or moves it to where its new field values belong."""
+        key = self.key(*values)
+        if key is not None and self._key_by_id.get(task_id) == key:
+            return
+        self.remove(task_id)
+        if key is None:
+            self._unkeyed[task_id] = None
+            return
+        self._key_by_id[task_id] = key
+        entry = (key, task_id)
+        if not self._entries or self._entries[-1] < entry:
+            self._entries.append(entry)  # The usual case for new tasks in a recency index
+        else:
+            bisect.insort(self._entries, entry)
+
+    def remove(self, task_id):
+        key = self._key_by_id.pop(task_id, None)
+        if key is None:
+            self._unkeyed.pop(task_id, None)
+            return
+        entries = self._entries
+        del entries[bisect.bisect_left(entries, (key, task_id))]
+
+    def add_many(self, items):
+        """
+        Adds (task id, field values) pairs of tasks not in the index yet. Large
+        batches are sorted on their own and then merged into the entries by one
+        sort of two ordered runs, or appended if they all sort after them (new
+        tasks in a recency index), instead of being inserted one by one.
+        """
+        items = list(items)
+        if len(items) < BULK_CHANGE_SIZE:
+            for task_id, values in items:
+                self.set(task_id, values)
+            return
+        added = []
+        for task_id, values in items:
+            key = self.key(*values)
+            if key is None:
+                self._unkeyed[task_id] = None
+            else:
+                self._key_by_id[task_id] = key
+                added.append((key, task_id))
+        added.sort()
+        entries = self._entries
+        merge = bool(added and entries and added[0] < entries[-1])
+        entries.extend(added)
+        if merge:
+            entries.sort()
+
+    def remove_many(self, task_ids):
+        """Removes tasks; large batches are removed by one pass over the entries."""
+        if len(task_ids) < BULK_CHANGE_SIZE:
+            for task_id in task_ids:
+                self.remove(task_id)
+            return
+        removed = set(task_ids)
+        for task_id in removed:
+            self._key_by_id.pop(task_id, None)
+            self._unkeyed.pop(task_id, None)
+        self._entries = [entry for entry in self._entries if entry[1] not in removed]
+
+
+def timestamp_key(value):
+    """Timestamps as naive datetimes to compare (timezone-aware ones converted to UTC); others None."""
+    if not isinstance(value, datetime.datetime):
+        return None
+    return comparable_datetime(value)
+
+
+class RecencyIndex(SortedFieldIndex):
+    """Task ids by Timestamp, for the most recently added or changed tasks."""
+
+    fields = ("Timestamp",)
+
+    def key(self, timestamp):
+        return timestamp_key(timestamp)
+
+    def newest(self, count):
+        """
+        The ids of up to count tasks, newest first, followed if there are too
+        few by tasks without a valid timestamp. O(count); ties between equal
+        timestamps are broken by task id.
+        """
+        if count <= 0:
+            return []
+        task_ids = [task_id for _, task_id in reversed(self._entries[-count:])]
+        for task_id in self._unkeyed:
+            if len(task_ids) >= count:
+                break
+            task_ids.append(task_id)
+        return task_ids
+
+
+class DeadlineIndex(SortedFieldIndex):
+    """
+    Open tasks by their Submit By date, as proleptic Gregorian ordinals.
+
+    Args:
+        closed_statuses (collection): Statuses of tasks that are done with and
+            so are never due.
+    """
+
+    fields = ("Submit By", "Status")
+
+    def __init__(self, items=(), closed_statuses=()):
+        self.closed_statuses = frozenset(closed_statuses)
+        super().__init__(items)
+
+    def key(self, submit_by, status):
+        if not isinstance(submit_by, datetime.date) or status in self.closed_statuses:
+            return None
+        return submit_by.toordinal()
+
+    def _bounds(self, first, last):
+        entries = self._entries
+        start = bisect.bisect_left(entries, (first.toordinal(),)) if first is not None else 0
+        end = bisect.bisect_left(entries, (last.toordinal() + 1,)) if last is not None else len(entries)
+        return start, max(start, end)
+
+    def due_between(self, first, last, limit=None):
+        """
+        The ids of the open tasks due from first to last (dates, inclusive; None
+        for no bound), soonest first, at most limit of them. O(log n + returned).
+        """
+        start, end = self._bounds(first, last)
+        if limit is not None:
+            end = min(end, start + limit)
+        return [task_id for _, task_id in self._entries[start:end]]
+
+    def count_due_between(self, first, last):
+        """The number of open tasks due from first to last, in O(log n)."""
+        start, end = self._bounds(first, last)
+        return end - start
+
+    def overdue(self, today=None, limit=None):
+        """Open tasks due before today, longest overdue first."""
+        if today is None:
+            today = datetime.date.today()
+        return self.due_between(None, today - datetime.timedelta(days=1), limit)
+
+    def due_within(self, days, today=None, limit=None):
+        """Open tasks due from today to days after it, soonest first."""
+        if today is None:
+            today = datetime.date.today()
+        return self.due_between(today, today + datetime.timedelta(days=days), limit)
+
+    def due_on(self, day, limit=None):
+        """Open tasks due on day."""
+        return self.due_between(day, day, limit)
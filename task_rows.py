@@ -0,0 +1,582 @@
+import datetime
+from array import array
+
+from task_store import TASK_ID_KEY, new_task_id
+
+
+# --- Task Row Storage ---
+#
+# TaskTableModel keeps its rows in one of two interchangeable backends:
+#
+#   TaskRows          A list of task dictionaries, as the tasks are loaded. The
+#                     dictionaries are shared with the caller.
+#   ColumnarTaskRows  One column per field: subjects, types and statuses as
+#                     small integer codes into intern tables, dates as ordinals
+#                     in array('i'), timestamps as microseconds in array('q'),
+#                     and everything else (descriptions, ids) in plain lists.
+#                     No per-task dictionary or date object is kept; task(row)
+#                     builds a dictionary on request.
+#
+# Both take and return task dictionaries at their edges, so the model and the
+# window do not depend on which one is used. A typed column that receives a
+# value it cannot hold (e.g. a string in a date column, or a timezone-aware
+# timestamp) turns into a plain list column for good.
+#
+# Sorting: sort_keys(key) returns one key per row for a field, cheap to compare
+# (dates as ordinals, ranked values as integers), and reorder(order) moves the
+# rows into a new order in one pass.
+#
+# The model does not use a backend directly but through NewestFirstRows, which
+# stores the rows bottom-up: the task table is newest first and new tasks go on
+# top, so adding one is an append to the backend's lists and arrays rather than
+# an insert that shifts every row. It also finds the row of a task id, by the
+# task's position in the backend, which appends leave unchanged.
+
+_MISSING = object()  # A field a task does not have
+
+# Classes whose values sort by their own order; values of other classes sort by repr()
+_ORDERED_CLASSES = frozenset([str, int, float, bool, datetime.date, datetime.datetime])
+
+
+def comparable_datetime(value):
+    """A datetime that compares with naive ones: timezone-aware values are converted to naive UTC."""
+    if value.tzinfo is not None:
+        return value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def value_sort_key(value):
+    """A key that orders any field values: missing ones first, then grouped by type."""
+    if value is None or value is _MISSING:
+        return (0,)
+    cls = value.__class__
+    if cls is datetime.datetime:
+        return (1, cls.__name__, comparable_datetime(value))
+    if cls in _ORDERED_CLASSES:
+        return (1, cls.__name__, value)
+    return (2, cls.__name__, repr(value))
+
+
+def column_sort_keys(values, rank=None):
+    """
+    Sort keys for the values of one field, one per value.
+
+    Args:
+        values (list): The values; None or _MISSING for a missing one.
+        rank (dict, optional): Value -> integer rank; values it does not list
+            sort after those it does.
+    """
+    if rank is not None:
+        unranked = len(rank)
+        return [rank.get(value, unranked) if value.__class__ is str else unranked for value in values]
+    classes = {value.__class__ for value in values}
+    present = classes - {type(None), type(_MISSING)}
+    if len(present) == 1:
+        cls = present.pop()
+        if cls is datetime.date:
+            return [value.toordinal() if value.__class__ is cls else 0 for value in values]
+        if cls is str:
+            return [value if value.__class__ is cls else "" for value in values]
+        if cls is datetime.datetime:
+            return [comparable_datetime(value) if value.__class__ is cls else datetime.datetime.min
+                    for value in values]
+        if cls in _ORDERED_CLASSES and len(classes) == 1:
+            return values
+    return [value_sort_key(value) for value in values]
+
+
+class TaskRows:
+    """
+    Rows backed by a list of task dictionaries.
+
+    Args:
+        tasks (list): Task dictionaries; the list is used as is, not copied.
+    """
+
+    def __init__(self, tasks):
+        self._tasks = tasks
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def value(self, row, key):
+        return self._tasks[row].get(key)
+
+    def set_value(self, row, key, value):
+        self._tasks[row][key] = value
+
+    def update(self, row, fields):
+        self._tasks[row].update(fields)
+
+    def task_id(self, row):
+        return self._tasks[row].get(TASK_ID_KEY)
+
+    def insert(self, position, task):
+        self._tasks.insert(position, task)
+
+    def remove(self, position):
+        """Removes a row and returns the task id it had."""
+        return self._tasks.pop(position).get(TASK_ID_KEY)
+
+    def insert_many(self, position, tasks):
+        self._tasks[position:position] = tasks
+
+    def remove_many(self, position, count):
+        """Removes count rows from position on and returns the task ids they had."""
+        task_ids = [task.get(TASK_ID_KEY) for task in self._tasks[position:position + count]]
+        del self._tasks[position:position + count]
+        return task_ids
+
+    def task(self, row):
+        """The task at row; changes to it change the row."""
+        return self._tasks[row]
+
+    def tasks(self):
+        """All tasks, in row order; the list itself is returned, not a copy."""
+        return self._tasks
+
+    def sort_keys(self, key, rank=None):
+        """One sort key per row for a field; see column_sort_keys."""
+        return column_sort_keys([task.get(key) for task in self._tasks], rank)
+
+    def reorder(self, order):
+        """Moves the rows so that row i is the one that was at order[i]."""
+        tasks = self._tasks
+        tasks[:] = [tasks[row] for row in order]
+
+
+class ListColumn:
+    """Values as they are."""
+
+    def __init__(self, values=()):
+        self._values = list(values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def get(self, row):
+        return self._values[row]
+
+    @staticmethod
+    def accepts(value):
+        return True
+
+    def set(self, row, value):
+        self._values[row] = value
+
+    def insert(self, position, value):
+        self._values.insert(position, value)
+
+    def remove(self, position):
+        del self._values[position]
+
+    def insert_many(self, position, values):
+        self._values[position:position] = values
+
+    def remove_many(self, position, count):
+        del self._values[position:position + count]
+
+    def values(self):
+        return list(self._values)
+
+    def sort_keys(self, rank=None):
+        return column_sort_keys(self._values, rank)
+
+    def reorder(self, order):
+        values = self._values
+        self._values = [values[row] for row in order]
+
+
+class CodeColumn:
+    """Values interned in a table, stored as unsigned 16-bit codes (32-bit once more are needed)."""
+
+    def __init__(self, values=()):
+        self._table = []
+        self._codes_by_value = {}
+        self._codes = array("H")
+        for value in values:
+            self._codes.append(self._code(value))
+
+    def __len__(self):
+        return len(self._codes)
+
+    def _code(self, value):
+        try:
+            return self._codes_by_value[value]
+        except KeyError:
+            code = len(self._table)
+            if code == 0x10000 and self._codes.typecode == "H":
+                self._codes = array("I", self._codes)
+            self._table.append(value)
+            self._codes_by_value[value] = code
+            return code
+
+    def get(self, row):
+        return self._table[self._codes[row]]
+
+    @staticmethod
+    def accepts(value):
+        try:
+            hash(value)
+        except TypeError:
+            return False
+        return True
+
+    def set(self, row, value):
+        self._codes[row] = self._code(value)
+
+    def insert(self, position, value):
+        self._codes.insert(position, self._code(value))
+
+    def remove(self, position):
+        del self._codes[position]
+
+    def insert_many(self, position, values):
+        codes = [self._code(value) for value in values]  # May widen the array first
+        self._codes[position:position] = array(self._codes.typecode, codes)
+
+    def remove_many(self, position, count):
+        del self._codes[position:position + count]
+
+    def values(self):
+        return [self._table[code] for code in self._codes]
+
+    def sort_keys(self, rank=None):
+        # Each distinct value is keyed once; rows then take the key of their code
+        table_keys = column_sort_keys(self._table, rank)
+        return [table_keys[code] for code in self._codes]
+
+    def reorder(self, order):
+        codes = self._codes
+        self._codes = array(codes.typecode, [codes[row] for row in order])
+
+
+class DateColumn:
+    """datetime.date values (or None) as proleptic Gregorian ordinals; 0 is None."""
+
+    def __init__(self, values=()):
+        self._ordinals = array("i", [0 if value is None else value.toordinal() for value in values])
+
+    def __len__(self):
+        return len(self._ordinals)
+
+    def get(self, row):
+        ordinal = self._ordinals[row]
+        return datetime.date.fromordinal(ordinal) if ordinal else None
+
+    @staticmethod
+    def accepts(value):
+        return value is None or value.__class__ is datetime.date
+
+    def set(self, row, value):
+        self._ordinals[row] = 0 if value is None else value.toordinal()
+
+    def insert(self, position, value):
+        self._ordinals.insert(position, 0 if value is None else value.toordinal())
+
+    def remove(self, position):
+        del self._ordinals[position]
+
+    def insert_many(self, position, values):
+        self._ordinals[position:position] = array("i", [0 if value is None else value.toordinal() for value in values])
+
+    def remove_many(self, position, count):
+        del self._ordinals[position:position + count]
+
+    def values(self):
+        return [self.get(row) for row in range(len(self._ordinals))]
+
+    def sort_keys(self, rank=None):
+        return self._ordinals  # None (0) sorts first
+
+    def reorder(self, order):
+        ordinals = self._ordinals
+        self._ordinals = array("i", [ordinals[row] for row in order])
+
+
+DATETIME_EPOCH = datetime.datetime.min
+MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+class DatetimeColumn:
+    """Naive datetime.datetime values (or None) as microseconds since datetime.min; -1 is None."""
+
+    def __init__(self, values=()):
+        self._micros = array("q", [self._to_micros(value) for value in values])
+
+    def __len__(self):
+        return len(self._micros)
+
+    @staticmethod
+    def _to_micros(value):
+        return -1 if value is None else (value - DATETIME_EPOCH) // MICROSECOND
+
+    def get(self, row):
+        micros = self._micros[row]
+        return None if micros < 0 else DATETIME_EPOCH + datetime.timedelta(microseconds=micros)
+
+    @staticmethod
+    def accepts(value):
+        return value is None or (value.__class__ is datetime.datetime and value.tzinfo is None)
+
+    def set(self, row, value):
+        self._micros[row] = self._to_micros(value)
+
+    def insert(self, position, value):
+        self._micros.insert(position, self._to_micros(value))
+
+    def remove(self, position):
+        del self._micros[position]
+
+    def insert_many(self, position, values):
+        self._micros[position:position] = array("q", [self._to_micros(value) for value in values])
+
+    def remove_many(self, position, count):
+        del self._micros[position:position + count]
+
+    def values(self):
+        return [self.get(row) for row in range(len(self._micros))]
+
+    def sort_keys(self, rank=None):
+        return self._micros  # None (-1) sorts first
+
+    def reorder(self, order):
+        micros = self._micros
+        self._micros = array("q", [micros[row] for row in order])
+
+
+# Field -> column type; other fields get a ListColumn
+COLUMN_TYPES = {
+    "Subject": CodeColumn,
+    "Type": CodeColumn,
+    "Status": CodeColumn,
+    "Assigned": DateColumn,
+    "Submit By": DateColumn,
+    "Timestamp": DatetimeColumn,
+}
+
+
+class ColumnarTaskRows:
+    """
+    Rows backed by one typed column per field.
+
+    Args:
+        tasks (list): Task dictionaries to copy in; they are not kept.
+    """
+
+    def __init__(self, tasks):
+        self._count = len(tasks)
+        self._columns = {}
+        for key in dict.fromkeys(key for task in tasks for key in task):
+            self._columns[key] = self._new_column(key, [task.get(key, _MISSING) for task in tasks])
+
+    @staticmethod
+    def _new_column(key, values):
+        column_type = COLUMN_TYPES.get(key, ListColumn)
+        if column_type is not ListColumn and not all(column_type.accepts(value) for value in values):
+            column_type = ListColumn
+        return column_type(values)
+
+    def _column_for(self, key, value):
+        """The column of key, created or turned into a ListColumn as needed to hold value."""
+        column = self._columns.get(key)
+        if column is None:
+            column = self._columns[key] = self._new_column(key, [_MISSING] * self._count)
+        if not column.accepts(value):
+            column = self._columns[key] = ListColumn(column.values())
+        return column
+
+    def __len__(self):
+        return self._count
+
+    def value(self, row, key):
+        if not 0 <= row < self._count:
+            raise IndexError(row)
+        column = self._columns.get(key)
+        if column is None:
+            return None
+        value = column.get(row)
+        return None if value is _MISSING else value
+
+    def set_value(self, row, key, value):
+        if not 0 <= row < self._count:
+            raise IndexError(row)
+        self._column_for(key, value).set(row, value)
+
+    def update(self, row, fields):
+        for key, value in fields.items():
+            self.set_value(row, key, value)
+
+    def task_id(self, row):
+        return self.value(row, TASK_ID_KEY)
+
+    def insert(self, position, task):
+        position = max(0, min(position, self._count))
+        for key, value in task.items():
+            self._column_for(key, value)
+        for key, column in self._columns.items():
+            value = task.get(key, _MISSING)
+            if not column.accepts(value):
+                column = self._columns[key] = ListColumn(column.values())
+            column.insert(position, value)
+        self._count += 1
+
+    def remove(self, position):
+        """Removes a row and returns the task id it had."""
+        task_id = self.task_id(position)
+        for column in self._columns.values():
+            column.remove(position)
+        self._count -= 1
+        return task_id
+
+    def insert_many(self, position, tasks):
+        position = max(0, min(position, self._count))
+        for key in dict.fromkeys(key for task in tasks for key in task):
+            if key not in self._columns:
+                self._columns[key] = self._new_column(key, [_MISSING] * self._count)
+        for key, column in self._columns.items():
+            values = [task.get(key, _MISSING) for task in tasks]
+            if not all(column.accepts(value) for value in values):
+                column = self._columns[key] = ListColumn(column.values())
+            column.insert_many(position, values)
+        self._count += len(tasks)
+
+    def remove_many(self, position, count):
+        """Removes count rows from position on and returns the task ids they had."""
+        count = max(0, min(count, self._count - position))
+        task_ids = [self.task_id(row) for row in range(position, position + count)]
+        for column in self._columns.values():
+            column.remove_many(position, count)
+        self._count -= count
+        return task_ids
+
+    def task(self, row):
+        """A new dictionary with the fields of the task at row."""
+        if not 0 <= row < self._count:
+            raise IndexError(row)
+        task = {}
+        for key, column in self._columns.items():
+            value = column.get(row)
+            if value is not _MISSING:
+                task[key] = value
+        return task
+
+    def tasks(self):
+        """New dictionaries for all tasks, in row order."""
+        keys = list(self._columns)
+        rows = zip(*(self._columns[key].values() for key in keys))
+        return [{key: value for key, value in zip(keys, values) if value is not _MISSING} for values in rows]
+
+    def sort_keys(self, key, rank=None):
+        """One sort key per row for a field; see column_sort_keys."""
+        column = self._columns.get(key)
+        if column is None:
+            return [0] * self._count
+        return column.sort_keys(rank)
+
+    def reorder(self, order):
+        """Moves the rows so that row i is the one that was at order[i]."""
+        for column in self._columns.values():
+            column.reorder(order)
+
+
+class NewestFirstRows:
+    """
+    The rows of a backend in reverse order, plus the lookup of rows by task id.
+
+    Row 0 is the task stored last, so inserting rows at the top of the table
+    appends them to the backend: O(1) per task, and no stored task moves.
+    Inserting or removing rows further down is O(n), as with a plain list.
+    Takes and returns rows in table order; the backend is not used by others.
+
+    Args:
+        backend: An empty TaskRows or ColumnarTaskRows, or one holding the
+            tasks bottom-up (oldest first, for a newest-first table). Tasks
+            without an id are given one.
+    """
+
+    def __init__(self, backend):
+        self._backend = backend
+        for position in range(len(backend)):
+            if not backend.task_id(position):
+                backend.set_value(position, TASK_ID_KEY, new_task_id())
+        self._task_ids = {backend.task_id(position) for position in range(len(backend))}
+        # Task id -> backend position, only trusted below _positions_valid_below: inserting
+        # or removing tasks shifts those stored after them, whose entries are refreshed on
+        # the next lookup. Appending moves nothing.
+        self._position_by_id = {}
+        self._positions_valid_below = 0
+
+    def __len__(self):
+        return len(self._backend)
+
+    def __contains__(self, task_id):
+        return task_id in self._task_ids
+
+    def _position(self, row):
+        count = len(self._backend)
+        if not 0 <= row < count:
+            raise IndexError(row)
+        return count - 1 - row
+
+    def row_of(self, task_id):
+        """
+        The row of the task with the given id, or -1 if there is none. O(1),
+        except for the first lookup after tasks were inserted or removed below
+        the top of the table, which re-indexes the tasks stored after them.
+        """
+        if task_id not in self._task_ids:
+            return -1
+        position = self._position_by_id.get(task_id)
+        if position is None or position >= self._positions_valid_below:
+            backend = self._backend
+            for position in range(self._positions_valid_below, len(backend)):
+                self._position_by_id[backend.task_id(position)] = position
+            self._positions_valid_below = len(backend)
+            position = self._position_by_id[task_id]
+        return len(self._backend) - 1 - position
+
+    def value(self, row, key):
+        return self._backend.value(self._position(row), key)
+
+    def set_value(self, row, key, value):
+        self._backend.set_value(self._position(row), key, value)
+
+    def update(self, row, fields):
+        self._backend.update(self._position(row), fields)
+
+    def task_id(self, row):
+        return self._backend.task_id(self._position(row))
+
+    def task(self, row):
+        return self._backend.task(self._position(row))
+
+    def tasks(self):
+        """All tasks, in row order, in a new list."""
+        return self._backend.tasks()[::-1]
+
+    def insert_many(self, row, tasks):
+        """Inserts tasks, which must have distinct new ids, so that the first is at row."""
+        position = len(self._backend) - max(0, min(row, len(self._backend)))
+        self._backend.insert_many(position, tasks[::-1])
+        self._task_ids.update(task[TASK_ID_KEY] for task in tasks)
+        self._positions_valid_below = min(self._positions_valid_below, position)
+
+    def remove_many(self, row, count):
+        """Removes count rows from row on and returns the task ids they had, in row order."""
+        position = len(self._backend) - row - count
+        task_ids = self._backend.remove_many(position, count)[::-1]
+        self._task_ids.difference_update(task_ids)
+        for task_id in task_ids:
+            self._position_by_id.pop(task_id, None)
+        self._positions_valid_below = min(self._positions_valid_below, position)
+        return task_ids
+
+    def sort_keys(self, key, rank=None):
+        return self._backend.sort_keys(key, rank)[::-1]
+
+    def reorder(self, order):
+        """Moves the rows so that row i is the one that was at order[i]."""
+        last = len(self._backend) - 1
+        self._backend.reorder([last - row for row in reversed(order)])
+        self._positions_valid_below = 0
@@ -0,0 +1,385 @@
+import datetime
+import json
+import mmap
+import re
+import struct
+import sys
+from array import array
+from itertools import repeat
+
+from atomic_file import BACKUP_GENERATIONS, atomic_write, load_with_backups
+from task_store import DATE_KEYS, json_default, parse_task_date, parse_timestamp
+
+
+# --- Binary Columnar Task Snapshots ---
+#
+# An alternative to the JSON task snapshot, used by TaskJournal for task files
+# ending in BINARY_SUFFIX. The tasks are stored column by column:
+#
+#   MAGIC | header length (uint32 LE) | header (JSON) | sections, 8-byte aligned
+#
+# The header lists the row count, the string table sections and one entry per
+# column (name, kind, section offset and length). Column kinds:
+#
+#   "str"       Index into the string table per row, as uint8, uint16 or
+#               uint32, whichever is the narrowest that fits the column (the
+#               largest value of the type: None). Strings are interned, so each
+#               subject, type and status is stored once however many tasks share it.
+#   "hex"       Raw bytes of lowercase hex strings of one length, such as the
+#               uuid4 task ids, at half the size of the text.
+#   "date"      int32 proleptic Gregorian ordinal per row (0: None).
+#   "datetime"  Naive timestamps as fixed-width ISO 8601 text, DATETIME_WIDTH
+#               ASCII characters per row (spaces: None). datetime.fromisoformat
+#               parses these several times faster than datetimes can be built
+#               from integers in Python.
+#   "json"      A JSON array of the values, for columns that fit no other kind
+#               (e.g. timezone-aware timestamps or fields of other types). Rows
+#               missing the field are listed in the column's "missing" entry.
+#
+# The string table is the UTF-8 strings joined by NUL, plus a uint32 offset
+# array so that single strings can be decoded without the rest. Numbers use the
+# byte order recorded in the header. TaskSnapshot memory-maps the file; a column
+# is decoded the first time it is needed, and task(row) reads one row without
+# decoding any column. Snapshots are written atomically with backups like the
+# JSON files (see atomic_file).
+
+MAGIC = b"TASKSNP1"
+HEADER_LENGTH = struct.Struct("<I")
+ALIGNMENT = 8
+DATETIME_WIDTH = 26  # YYYY-MM-DDTHH:MM:SS.ffffff
+
+# Typecodes of string index arrays with the index that marks None, narrowest first
+INDEX_TYPECODES = (("B", 0xFF), ("H", 0xFFFF), ("I", 0xFFFFFFFF))
+HEX_RE = re.compile(r"(?:[0-9a-f]{2})+")
+
+_MISSING = object()
+
+
+def _column_kind(values):
+    """The most compact kind that can hold values (None allowed; _MISSING not)."""
+    kinds = {"str", "date", "datetime"}
+    for value in values:
+        if value is None:
+            continue
+        if value is _MISSING:
+            return "json"
+        value_type = value.__class__
+        if value_type is str:
+            kinds &= {"str"}
+        elif value_type is datetime.date:
+            kinds &= {"date"}
+        elif value_type is datetime.datetime and value.tzinfo is None:
+            kinds &= {"datetime"}
+        else:
+            return "json"
+        if not kinds:
+            return "json"
+    return next(iter(kinds)) if len(kinds) == 1 else "str"  # An all-None column
+
+
+def encode_snapshot(tasks):
+    """
+    Encodes task dictionaries in the snapshot format.
+
+    Returns:
+        bytes: The file contents.
+
+    Raises:
+        TypeError: If a field of a "json" column is not JSON-serializable.
+    """
+    names = list(dict.fromkeys(name for task in tasks for name in task))
+    strings = {}
+    sections = []
+    columns = []
+
+    def add_section(data):
+        sections.append(data)
+        return len(sections) - 1
+
+    column_values = {name: [task.get(name, _MISSING) for task in tasks] for name in names}
+    kinds = {name: _column_kind(values) for name, values in column_values.items()}
+    for name, values in column_values.items():
+        if kinds[name] == "str" and None not in values and _is_hex(values):
+            kinds[name] = "hex"
+    # Interning the columns with the fewest distinct strings first keeps their indexes narrow
+    string_columns = [name for name in names if kinds[name] == "str"]
+    for name in sorted(string_columns, key=lambda name: len(set(column_values[name]))):
+        for value in column_values[name]:
+            if value is not None:
+                strings.setdefault(value, len(strings))
+
+    for name, values in column_values.items():
+        kind = kinds[name]
+        column = {"name": name, "kind": kind}
+        if kind != "json":
+            column["nulls"] = None in values
+        if kind == "hex":
+            column["width"] = len(values[0]) // 2
+            data = bytes.fromhex("".join(values))
+        elif kind == "str":
+            indexes = [None if value is None else strings.setdefault(value, len(strings)) for value in values]
+            largest = max((index for index in indexes if index is not None), default=0)
+            typecode, null = next((typecode, null) for typecode, null in INDEX_TYPECODES if largest < null)
+            column["typecode"], column["null"] = typecode, null
+            data = array(typecode, [null if index is None else index for index in indexes])
+        elif kind == "date":
+            column["typecode"] = "i"
+            data = array("i", [0 if value is None else value.toordinal() for value in values])
+        elif kind == "datetime":
+            blank = " " * DATETIME_WIDTH
+            data = "".join(blank if value is None else value.isoformat(timespec="microseconds")
+                           for value in values).encode("ascii")
+        else:
+            column["missing"] = [row for row, value in enumerate(values) if value is _MISSING]
+            data = json.dumps([None if value is _MISSING else value for value in values],
+                              separators=(",", ":"), default=json_default).encode("utf-8")
+        column["section"] = add_section(data.tobytes() if isinstance(data, array) else data)
+        columns.append(column)
+
+    encoded_strings = [string.encode("utf-8") for string in strings]
+    offsets = array("I", [0])
+    for encoded in encoded_strings:
+        offsets.append(offsets[-1] + len(encoded) + 1)
+    string_table = {"blob": add_section(b"\0".join(encoded_strings)), "offsets": add_section(offsets.tobytes()),
+                    "count": len(encoded_strings),
+                    "nul_free": not any("\0" in string for string in strings)}
+
+    header = {"count": len(tasks), "byteorder": sys.byteorder, "strings": string_table, "columns": columns,
+              "sections": []}
+    # Section offsets depend on the header length and the header on the offsets; repeat until they agree
+    header_length = 0
+    while True:
+        position = _align(len(MAGIC) + HEADER_LENGTH.size + header_length)
+        header["sections"] = []
+        for data in sections:
+            header["sections"].append([position, len(data)])
+            position = _align(position + len(data))
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        if len(header_bytes) <= header_length:
+            header_bytes += b" " * (header_length - len(header_bytes))
+            break
+        header_length = _align(len(header_bytes))
+    parts = [MAGIC, HEADER_LENGTH.pack(len(header_bytes)), header_bytes]
+    position = len(MAGIC) + HEADER_LENGTH.size + len(header_bytes)
+    for (offset, _), data in zip(header["sections"], sections):
+        parts.append(b"\0" * (offset - position))
+        parts.append(data)
+        position = offset + len(data)
+    return b"".join(parts)
+
+
+def _is_hex(values):
+    return (bool(values) and all(len(value) == len(values[0]) for value in values)
+            and all(HEX_RE.fullmatch(value) for value in values))
+
+
+def _align(position):
+    return (position + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def write_snapshot(path, tasks, backups=BACKUP_GENERATIONS):
+    """Writes tasks to path in the snapshot format, atomically."""
+    data = encode_snapshot(tasks)
+    atomic_write(path, lambda f: f.write(data), backups, binary=True)
+
+
+class TaskSnapshot:
+    """
+    A memory-mapped snapshot file.
+
+    Opening reads only the header. Columns are decoded on first use and kept;
+    task(row) decodes a single row. Use as a context manager or call close().
+
+    Raises:
+        ValueError: If the file is not a valid snapshot.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Empty file
+                raise ValueError(f"{path} is not a task snapshot") from None
+        self._views = []
+        try:
+            self._read_header()
+        except (ValueError, KeyError, TypeError, IndexError, struct.error) as e:
+            self.close()
+            raise ValueError(f"{path} is not a valid task snapshot: {e}") from None
+        self._decoded = {}
+        self._strings = None
+        self._string_cache = {}
+
+    def _read_header(self):
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError("unknown format")
+        (header_length,) = HEADER_LENGTH.unpack_from(self._mmap, len(MAGIC))
+        start = len(MAGIC) + HEADER_LENGTH.size
+        header = json.loads(self._mmap[start:start + header_length])
+        self.count = header["count"]
+        self._swap = header["byteorder"] != sys.byteorder
+        self._sections = header["sections"]
+        for offset, length in self._sections:
+            if offset < 0 or offset + length > len(self._mmap):
+                raise ValueError("section outside the file")
+        self._string_table = header["strings"]
+        self.columns = {column["name"]: column for column in header["columns"]}
+        self._string_offsets = self._numbers(self._string_table["offsets"], "I")
+        for column in self.columns.values():
+            if "typecode" in column:
+                column["view"] = self._numbers(column["section"], column["typecode"])
+                length = len(column["view"])
+            elif column["kind"] in ("datetime", "hex"):
+                column["view"] = self._bytes(column["section"])
+                column.setdefault("width", DATETIME_WIDTH)
+                length = len(column["view"]) // column["width"]
+            else:
+                continue
+            if length != self.count:
+                raise ValueError(f"column {column['name']} has the wrong length")
+
+    def _bytes(self, section, keep=True):
+        """A view of a section; views not kept must be released by the caller."""
+        offset, length = self._sections[section]
+        view = memoryview(self._mmap)[offset:offset + length]
+        if keep:
+            self._views.append(view)
+        return view
+
+    def _numbers(self, section, typecode):
+        """A zero-copy view of a number section, or a decoded array if the byte order differs."""
+        view = self._bytes(section)
+        if self._swap:
+            numbers = array(typecode, view)
+            numbers.byteswap()
+            return numbers
+        view = view.cast(typecode)
+        self._views.append(view)
+        return view
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def string(self, index):
+        """One entry of the string table, decoded on demand."""
+        if self._strings is not None:
+            return self._strings[index]
+        try:
+            return self._string_cache[index]
+        except KeyError:
+            pass
+        with self._bytes(self._string_table["blob"], keep=False) as blob:
+            string = str(blob[self._string_offsets[index]:self._string_offsets[index + 1] - 1], "utf-8")
+        self._string_cache[index] = string
+        return string
+
+    def _all_strings(self):
+        if self._strings is None:
+            with self._bytes(self._string_table["blob"], keep=False) as blob:
+                if self._string_table["nul_free"]:
+                    strings = str(blob, "utf-8").split("\0") if self._string_table["count"] else []
+                else:
+                    offsets = self._string_offsets
+                    strings = [str(blob[offsets[i]:offsets[i + 1] - 1], "utf-8")
+                               for i in range(self._string_table["count"])]
+            self._strings = strings
+        return self._strings
+
+    def column(self, name):
+        """All values of one column, decoded; decoded once and cached."""
+        try:
+            return self._decoded[name]
+        except KeyError:
+            pass
+        column = self.columns[name]
+        kind = column["kind"]
+        if kind == "str":
+            strings = self._all_strings()
+            indexes = column["view"].tolist()
+            if column["nulls"]:
+                null = column["null"]
+                values = [None if index == null else strings[index] for index in indexes]
+            else:
+                values = list(map(strings.__getitem__, indexes))
+        elif kind == "hex":
+            text = column["view"].hex()
+            step = 2 * column["width"]
+            values = [text[start:start + step] for start in range(0, len(text), step)]
+        elif kind == "date":
+            ordinals = column["view"].tolist()
+            dates = {ordinal: datetime.date.fromordinal(ordinal) for ordinal in set(ordinals) if ordinal}
+            values = list(map(dates.get, ordinals))
+        elif kind == "datetime":
+            text = str(column["view"], "ascii")
+            texts = [text[start:start + DATETIME_WIDTH] for start in range(0, len(text), DATETIME_WIDTH)]
+            if column["nulls"]:
+                values = [None if text[0] == " " else datetime.datetime.fromisoformat(text) for text in texts]
+            else:
+                values = list(map(datetime.datetime.fromisoformat, texts))
+        else:
+            with self._bytes(column["section"], keep=False) as data:
+                values = json.loads(bytes(data))
+            if name in DATE_KEYS:
+                values = [parse_task_date(value) if value.__class__ is str else value for value in values]
+            elif name == "Timestamp":
+                values = [parse_timestamp(value) if value.__class__ is str else value for value in values]
+        self._decoded[name] = values
+        return values
+
+    def task(self, row):
+        """The task at row, decoding only that row."""
+        if not 0 <= row < self.count:
+            raise IndexError(row)
+        task = {}
+        for name, column in self.columns.items():
+            if name in self._decoded or column["kind"] == "json":
+                if row in column.get("missing", ()):
+                    continue
+                task[name] = self.column(name)[row]
+                continue
+            if column["kind"] == "datetime":
+                text = str(column["view"][row * DATETIME_WIDTH:(row + 1) * DATETIME_WIDTH], "ascii")
+                task[name] = None if text[0] == " " else datetime.datetime.fromisoformat(text)
+                continue
+            if column["kind"] == "hex":
+                task[name] = column["view"][row * column["width"]:(row + 1) * column["width"]].hex()
+                continue
+            raw = column["view"][row]
+            if column["kind"] == "str":
+                task[name] = None if raw == column["null"] else self.string(raw)
+            elif column["kind"] == "date":
+                task[name] = datetime.date.fromordinal(raw) if raw else None
+        return task
+
+    def tasks(self):
+        """Every task as a dictionary, in stored order."""
+        names = list(self.columns)
+        tasks = list(map(dict, map(zip, repeat(names), zip(*(self.column(name) for name in names)))))
+        for name, column in self.columns.items():
+            for row in column.get("missing", ()):
+                del tasks[row][name]
+        return tasks
+
+
+def read_snapshot(path):
+    """Reads every task of a snapshot file; raises ValueError if it is not valid."""
+    with TaskSnapshot(path) as snapshot:
+        return snapshot.tasks()
+
+
+def read_snapshot_with_backups(path):
+    """Like read_snapshot, falling back to the backups; returns (tasks, path actually read)."""
+    return load_with_backups(path, read_snapshot)
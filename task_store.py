@@ -0,0 +1,487 @@
+import datetime
+import json
+import os
+import shutil
+import threading
+import uuid
+
+from atomic_file import atomic_write_json, load_json_with_backups
+
+
+# --- Task Storage Backends ---
+#
+# TaskStore is the interface the window persists tasks through: load the task
+# list once, then report adds, updates and deletes, one at a time or as a batch
+# of changes (apply_changes; the window's save scheduler sends batches). Backends
+# are picked by file extension in open_task_store: TaskJournal (below) keeps the
+# JSON file the application has always used, or a binary columnar snapshot
+# (task_snapshot) for files ending in BINARY_SUFFIX; SqliteTaskStore
+# (sqlite_task_store) keeps tasks in an indexed SQLite table. migrate_tasks
+# copies tasks between them and export_tasks_json writes any store as JSON.
+
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+BINARY_SUFFIX = ".tasksnap"
+
+
+class TaskStore:
+    """
+    Interface of task storage backends.
+
+    Attributes:
+        path (str): The file the tasks are stored in.
+    """
+    path = None
+
+    def load(self):
+        """Returns all tasks as dictionaries, newest first, with dates decoded."""
+        raise NotImplementedError
+
+    def record_add(self, task):
+        raise NotImplementedError
+
+    def record_update(self, task_id, fields):
+        """Stores new values for some fields of the task with the given id."""
+        raise NotImplementedError
+
+    def record_delete(self, task_id):
+        raise NotImplementedError
+
+    def replace_all(self, tasks):
+        """Replaces the stored tasks with the given list, e.g. when migrating."""
+        raise NotImplementedError
+
+    def find_tasks(self, subject=None, status=None, due_before=None, due_after=None, limit=None):
+        """
+        Returns the tasks matching all given filters, newest first.
+
+        Args:
+            subject (str): Only tasks of this subject.
+            status (str): Only tasks with this status.
+            due_before (datetime.date): Only tasks due on or before this date.
+            due_after (datetime.date): Only tasks due on or after this date.
+            limit (int): At most this many tasks.
+        """
+        return filter_tasks(self.load(), subject, status, due_before, due_after, limit)
+
+    def apply_changes(self, changes):
+        """
+        Stores a batch of changes in order.
+
+        Args:
+            changes (list): (op, task id, payload) tuples, where op is ADD (payload:
+                the task), UPDATE (payload: the changed fields) or DELETE (payload: None).
+        """
+        for op, task_id, payload in coalesce_changes(changes):
+            if op == ADD:
+                self.record_add(payload)
+            elif op == UPDATE:
+                self.record_update(task_id, payload)
+            elif op == DELETE:
+                self.record_delete(task_id)
+
+    def needs_compaction(self):
+        """Whether the backend wants compact() to fold its change log into a snapshot."""
+        return False
+
+    def compact(self, tasks):
+        """Writes tasks, the current list, as the backend's snapshot."""
+
+    def close(self):
+        pass
+
+
+def filter_tasks(tasks, subject=None, status=None, due_before=None, due_after=None, limit=None):
+    """Filters a newest-first task list the way TaskStore.find_tasks does, by scanning it."""
+    # Dates and datetimes do not compare with each other, so due dates are compared by day, as DeadlineIndex does
+    last_day = due_before.toordinal() if due_before is not None else None
+    first_day = due_after.toordinal() if due_after is not None else None
+    matches = []
+    for task in tasks:
+        if subject is not None and task.get("Subject") != subject:
+            continue
+        if status is not None and task.get("Status") != status:
+            continue
+        if last_day is not None or first_day is not None:
+            due = task.get("Submit By")
+            if not isinstance(due, datetime.date):
+                continue
+            day = due.toordinal()
+            if (last_day is not None and day > last_day) or (first_day is not None and day < first_day):
+                continue
+        matches.append(task)
+        if limit is not None and len(matches) >= limit:
+            break
+    return matches
+
+
+def coalesce_changes(changes):
+    """
+    Folds a batch of changes into at most one change per task.
+
+    Updates are merged into the preceding add or update of the same task, and a
+    task added and deleted within the batch is dropped. The payloads of the
+    result are new dictionaries; the input is not modified.
+    """
+    merged = {}  # Task id -> [op, payload], in order of first change
+    for op, task_id, payload in changes:
+        previous = merged.get(task_id)
+        if op == DELETE:
+            if previous is not None and previous[0] == ADD:
+                del merged[task_id]
+            else:
+                merged[task_id] = [DELETE, None]
+        elif op == UPDATE and previous is not None:
+            if previous[0] != DELETE:
+                previous[1].update(payload)
+        else:
+            merged[task_id] = [op, dict(payload)]
+    return [(op, task_id, payload) for task_id, (op, payload) in merged.items()]
+
+
+def open_task_store(path):
+    """Opens the storage backend for path: SQLite for .db/.sqlite/.sqlite3 files, otherwise a journal."""
+    if path.lower().endswith(SQLITE_SUFFIXES):
+        from sqlite_task_store import SqliteTaskStore  # sqlite_task_store builds on this module
+        return SqliteTaskStore(path)
+    return TaskJournal(path)
+
+
+def migrate_tasks(source, target, overwrite=False):
+    """
+    Copies every task from one store to another.
+
+    Args:
+        source (TaskStore): The store to read.
+        target (TaskStore): The store to write.
+        overwrite (bool): Replace tasks already in the target instead of refusing.
+
+    Returns:
+        int: The number of tasks copied.
+
+    Raises:
+        ValueError: If the target already holds tasks and overwrite is False.
+    """
+    tasks = source.load()
+    if not overwrite and target.load():
+        raise ValueError(f"{target.path} already contains tasks")
+    target.replace_all(tasks)
+    return len(tasks)
+
+
+def export_tasks_json(source, path):
+    """
+    Writes every task of a store to a JSON file in the format of syllabus_tasks.json.
+
+    Returns:
+        int: The number of tasks written.
+    """
+    tasks = source.load()
+    atomic_write_json(path, tasks, indent=4, default=json_default)
+    return len(tasks)
+
+
+# --- JSON Task Journal ---
+#
+# Tasks are persisted as a snapshot (the syllabus_tasks.json list, in the format
+# the application has always written) plus an append-only journal next to it.
+# Every add, update or delete appends one compact JSON line to the journal and
+# fsyncs it, so an edit costs O(1) I/O regardless of the number of tasks and is
+# durable once the call returns. Snapshots are written atomically with backup
+# generations (see atomic_file), which load() falls back to if the snapshot
+# cannot be decoded. A batch of changes (apply_changes) is appended with a
+# single fsync. Loading replays the
+# journal on top of the snapshot. Once COMPACT_AFTER_RECORDS records have been
+# appended, the journal is rotated to a ".compacting" file and a new snapshot is
+# written on a background thread; the rotated file is deleted only after the
+# snapshot has replaced the old one. Replaying is idempotent (records carry task
+# ids and full field values), so records that are replayed on top of a snapshot
+# that already contains them do no harm.
+
+JOURNAL_SUFFIX = ".journal"
+COMPACTING_SUFFIX = ".compacting"
+COMPACT_AFTER_RECORDS = 500
+TASK_ID_KEY = "Id"
+DATE_KEYS = ("Assigned", "Submit By")
+
+ADD = "add"
+UPDATE = "update"
+DELETE = "delete"
+
+
+def new_task_id():
+    return uuid.uuid4().hex
+
+
+def json_default(obj):
+    if isinstance(obj, (datetime.date, datetime.datetime)):
+        return obj.isoformat()
+    raise TypeError(f"Type {type(obj)} not serializable for JSON: {obj}")
+
+
+# Parsed task dates, by text. Tasks share few distinct dates, so most lookups hit.
+_date_cache = {}
+DATE_CACHE_SIZE = 100000
+
+
+def parse_task_date(text):
+    """Parses a YYYY-MM-DD task date; returns None if it is not a valid date."""
+    try:
+        return _date_cache[text]
+    except KeyError:
+        pass
+    if len(text) == 10 and text[4] == "-" and text[7] == "-":
+        try:
+            value = datetime.date.fromisoformat(text)
+        except ValueError:
+            value = None
+    else:  # E.g. without zero padding, which fromisoformat rejects
+        try:
+            value = datetime.datetime.strptime(text, "%Y-%m-%d").date()
+        except ValueError:
+            value = None
+    if len(_date_cache) >= DATE_CACHE_SIZE:
+        _date_cache.clear()
+    _date_cache[text] = value
+    return value
+
+
+def parse_timestamp(text):
+    """Parses an ISO 8601 task timestamp; invalid ones become datetime.min, which sorts last."""
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    try:
+        return datetime.datetime.fromisoformat(text)
+    except ValueError:
+        return datetime.datetime.min
+
+
+def decode_task(task):
+    """
+    Converts the date and timestamp strings of a task read from JSON, in place.
+
+    Values that are already decoded are left alone, so it can also serve as the
+    object_hook of json.load, decoding tasks while the file is parsed.
+    """
+    for key in DATE_KEYS:
+        value = task.get(key)
+        if value.__class__ is str:
+            task[key] = parse_task_date(value)
+    value = task.get("Timestamp")
+    if value.__class__ is str:
+        task["Timestamp"] = parse_timestamp(value)
+    return task
+
+
+def _validate_snapshot(snapshot):
+    if not isinstance(snapshot, list) or not all(isinstance(task, dict) for task in snapshot):
+        raise ValueError("task snapshot is not a list of tasks")
+
+
+class TaskJournal(TaskStore):
+    """
+    Snapshot-plus-journal persistence for the task list.
+
+    Args:
+        snapshot_path (str): The task snapshot file; the journal is kept beside it. The
+            snapshot is JSON, or in the binary format of task_snapshot if the name
+            ends in BINARY_SUFFIX.
+    """
+
+    def __init__(self, snapshot_path):
+        self.path = snapshot_path
+        self.snapshot_path = snapshot_path
+        self.journal_path = snapshot_path + JOURNAL_SUFFIX
+        self.compacting_path = self.journal_path + COMPACTING_SUFFIX
+        self.binary = snapshot_path.lower().endswith(BINARY_SUFFIX)
+        self.record_count = 0  # Records in the journal since the last compaction
+        self._journal = None
+        self._compaction = None
+
+    def load(self):
+        """
+        Reads the snapshot and replays the journal.
+
+        Tasks without an id (e.g. written before the journal existed) are given
+        one, and the snapshot is rewritten at once so the ids stay stable.
+
+        Returns:
+            list: Task dictionaries, newest first.
+
+        Raises:
+            OSError, ValueError: If neither the snapshot nor a backup of it can be read or decoded.
+        """
+        try:
+            snapshot, read_path = self._read_snapshot()
+            if read_path != self.snapshot_path:
+                print(f"Tasks restored from backup {read_path}")
+        except FileNotFoundError:
+            snapshot = []
+        ids_assigned = False
+        tasks_by_id = {}
+        for task in snapshot:
+            if not task.get(TASK_ID_KEY):
+                task[TASK_ID_KEY] = new_task_id()
+                ids_assigned = True
+            tasks_by_id[task[TASK_ID_KEY]] = task
+        self.record_count = (self._replay(self.compacting_path, tasks_by_id) +
+                             self._replay(self.journal_path, tasks_by_id))
+
+        from task_index import timestamp_key  # task_index builds on this module
+
+        tasks = list(tasks_by_id.values())  # Decoded while parsing
+        # The snapshot is stored newest first, so this sort is usually a single linear pass. Timestamps with
+        # and without a UTC offset are compared as naive UTC, and missing or invalid ones sort last.
+        tasks.sort(key=lambda x: timestamp_key(x.get('Timestamp')) or datetime.datetime.min, reverse=True)
+        if ids_assigned:
+            try:
+                self.compact(tasks)
+            except (OSError, TypeError) as e:
+                print(f"Could not store the new task ids in {self.snapshot_path}: {e}")
+        return tasks
+
+    def _read_snapshot(self):
+        if self.binary:
+            from task_snapshot import read_snapshot_with_backups  # task_snapshot builds on this module
+            return read_snapshot_with_backups(self.snapshot_path)
+        return load_json_with_backups(self.snapshot_path, validate=_validate_snapshot, object_hook=decode_task)
+
+    @staticmethod
+    def _replay(path, tasks_by_id):
+        """Applies the records of one journal file; returns how many were applied."""
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
+            return 0
+        count = 0
+        valid_length = 0
+        with f:
+            for raw in f:
+                try:
+                    if not raw.endswith(b"\n"):
+                        raise ValueError("incomplete record")
+                    record = json.loads(raw, object_hook=decode_task)
+                    op = record["op"]
+                    task_id = record["id"]
+                except (ValueError, KeyError, TypeError) as e:
+                    # Only the last record can be torn by a crash during an append
+                    print(f"Ignoring the end of task journal {path}: {e}")
+                    break
+                if op == ADD:
+                    tasks_by_id[task_id] = record["task"]
+                elif op == UPDATE:
+                    if task_id in tasks_by_id:
+                        tasks_by_id[task_id].update(record["fields"])
+                elif op == DELETE:
+                    tasks_by_id.pop(task_id, None)
+                valid_length += len(raw)
+                count += 1
+        if valid_length < os.path.getsize(path):
+            with open(path, 'r+b') as f:
+                f.truncate(valid_length)  # New records must not be appended to a torn one
+        return count
+
+    @staticmethod
+    def _record(op, task_id, payload):
+        if op == ADD:
+            return {"op": ADD, "id": task_id, "task": payload}
+        if op == UPDATE:
+            return {"op": UPDATE, "id": task_id, "fields": payload}
+        return {"op": DELETE, "id": task_id}
+
+    def _append(self, records):
+        if not records:
+            return
+        if self._journal is None:
+            self._journal = open(self.journal_path, 'a', encoding="utf-8")
+        self._journal.write("".join(json.dumps(record, separators=(",", ":"), default=json_default) + "\n"
+                                    for record in records))
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self.record_count += len(records)
+
+    def record_add(self, task):
+        self._append([self._record(ADD, task[TASK_ID_KEY], task)])
+
+    def record_update(self, task_id, fields):
+        self._append([self._record(UPDATE, task_id, fields)])
+
+    def record_delete(self, task_id):
+        self._append([self._record(DELETE, task_id, None)])
+
+    def apply_changes(self, changes):
+        self._append([self._record(*change) for change in coalesce_changes(changes)])
+
+    def replace_all(self, tasks):
+        self.compact(tasks)
+
+    def needs_compaction(self):
+        return self.record_count >= COMPACT_AFTER_RECORDS
+
+    def compact(self, tasks, background=False):
+        """
+        Writes tasks as the new snapshot and drops the journal records it contains.
+
+        Args:
+            tasks (list): The current task list. It is copied before this returns.
+            background (bool): Write the snapshot on a separate thread. Skipped if a
+                background compaction is still running.
+
+        Returns:
+            bool: Whether a compaction was started.
+
+        Raises:
+            OSError, TypeError: If a foreground compaction cannot write the snapshot; the
+                journal records are kept and replayed on the next load.
+        """
+        if self._compaction is not None and self._compaction.is_alive():
+            if background:
+                return False
+            self._compaction.join()
+        snapshot = [dict(task) for task in tasks]  # Values are immutable; shallow copies suffice
+        self._rotate_journal()
+        if background:
+            self._compaction = threading.Thread(target=self._write_snapshot_in_background, args=(snapshot,),
+                                                name="task-journal-compaction")
+            self._compaction.start()
+        else:
+            self._write_snapshot(snapshot)
+        return True
+
+    def _rotate_journal(self):
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        self.record_count = 0
+        if not os.path.exists(self.journal_path):
+            return
+        if os.path.exists(self.compacting_path):  # An earlier compaction failed; keep its records too
+            with open(self.compacting_path, 'ab') as dst, open(self.journal_path, 'rb') as src:
+                shutil.copyfileobj(src, dst)
+            os.remove(self.journal_path)
+        else:
+            os.replace(self.journal_path, self.compacting_path)
+
+    def _write_snapshot(self, snapshot):
+        if self.binary:
+            from task_snapshot import write_snapshot
+            write_snapshot(self.snapshot_path, snapshot)
+        else:
+            atomic_write_json(self.snapshot_path, snapshot, indent=4, default=json_default)
+        if os.path.exists(self.compacting_path):
+            os.remove(self.compacting_path)
+
+    def _write_snapshot_in_background(self, snapshot):
+        try:
+            self._write_snapshot(snapshot)
+        except (OSError, TypeError, ValueError) as e:
+            # The rotated journal is kept and replayed on the next load
+            print(f"Error compacting tasks into {self.snapshot_path}: {e}")
+
+    def close(self):
+        """Waits for a running compaction and closes the journal file."""
+        if self._compaction is not None:
+            self._compaction.join()
+            self._compaction = None
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None